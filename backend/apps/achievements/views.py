@@ -97,18 +97,16 @@ class UserLevelViewSet(viewsets.ViewSet):
 # 뱃지 획득 로직 (signals 또는 별도 서비스에서 호출)
 def check_and_award_badges(user):
     """뱃지 획득 조건 체크 및 자동 부여"""
-    from apps.sessions.models import TypingSession
     from apps.goals.models import UserStreak
-    from django.db.models import Avg, Max, Count
+    from apps.stats.models import UserLifetimeStats
     
-    # 사용자 통계
-    stats = TypingSession.objects.filter(user=user).aggregate(
-        avg_wpm=Avg('wpm'),
-        max_wpm=Max('wpm'),
-        avg_accuracy=Avg('accuracy'),
-        max_accuracy=Max('accuracy'),
-        total_sessions=Count('id'),
-    )
+    # 사용자 통계 (누적 통계 PK 조회 1회)
+    lifetime = UserLifetimeStats.objects.filter(pk=user.pk).first()
+    stats = {
+        'max_wpm': lifetime.best_wpm if lifetime else None,
+        'max_accuracy': lifetime.best_accuracy if lifetime else None,
+        'total_sessions': lifetime.total_sessions if lifetime else 0,
+    }
     
     streak = UserStreak.objects.filter(user=user).first()
     current_streak = streak.current_streak if streak else 0
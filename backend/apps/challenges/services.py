@@ -0,0 +1,48 @@
+"""
+challenges 서비스 - 세션 기반 챌린지 진행도 갱신
+"""
+from django.utils import timezone
+
+from .models import UserChallenge
+
+
+def record_challenge_progress(user, sessions):
+    """
+    세션 날짜의 데일리 챌린지에 참가 중이면 진행도 반영 후 완료 여부 확인
+    (같은 사용자의 세션 묶음, 참가 기록 조회는 한 번)
+    반환값: 갱신한 UserChallenge 목록
+    """
+    dates = {timezone.localdate(session.started_at) for session in sessions}
+    user_challenges = {
+        user_challenge.challenge.date: user_challenge
+        for user_challenge in UserChallenge.objects.select_for_update(of=('self',)).select_related('challenge').filter(
+            user=user,
+            challenge__date__in=dates,
+            challenge__is_active=True,
+            status='in_progress',
+        )
+    }
+    if not user_challenges:
+        return []
+
+    updated = {}
+    for session in sessions:
+        user_challenge = user_challenges.get(timezone.localdate(session.started_at))
+        if user_challenge is None:
+            continue
+        challenge = user_challenge.challenge
+        if challenge.text_pack_id and session.pack_id != challenge.text_pack_id:
+            continue
+
+        user_challenge.current_sessions += 1
+        user_challenge.current_time_minutes += session.duration_ms // 60000
+        user_challenge.current_wpm = max(user_challenge.current_wpm or 0, int(session.wpm))
+        user_challenge.current_accuracy = max(user_challenge.current_accuracy or 0, session.accuracy)
+        updated[user_challenge.id] = user_challenge
+
+    for user_challenge in updated.values():
+        user_challenge.save(update_fields=[
+            'current_sessions', 'current_time_minutes', 'current_wpm', 'current_accuracy', 'updated_at'
+        ])
+        user_challenge.check_completion()
+    return list(updated.values())
@@ -0,0 +1,510 @@
+"""
+leaderboard 실시간 순위 인덱스
+
+스냅샷 사이에도 세션 직후 순위를 보여주기 위한 프로세스 내 정렬 인덱스.
+활성 스냅샷을 시드로 읽고, 이후 세션은 저장 커밋 직후(record_sessions) 메모리에서 바로 반영하므로
+조회는 DB를 읽지 않는다.
+다른 프로세스에서 저장된 세션과 늦게 커밋된 세션은 LEADERBOARD_LIVE_RECONCILE_SECONDS마다
+세션 ID 워터마크 기준으로 따라잡는다 (reconcile). ID 순서와 커밋 순서는 다를 수 있으므로
+워터마크는 커밋 대기 시간이 지난 세션까지만 올리고, 그 이후 세션은 반영한 ID를 기억해 두고 다시 훑는다.
+반영 후에 부정행위 검사(detect_cheating)로 제외 점수를 받은 세션은 해당 사용자를 다시 집계해 뺀다.
+여러 워커 프로세스가 각자 인덱스를 가지더라도 DB의 신규 세션을 따라잡으므로
+결과는 수렴하며, 주기적인 체크포인트로 Entry에 반영된다.
+"""
+import threading
+import time
+from bisect import bisect_left, insort
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, Max, Q, Sum
+from django.utils import timezone
+
+from apps.sessions.models import TypingSession
+from .models import Snapshot, Entry
+from .services import (
+    ENTRY_BATCH_SIZE,
+    LEADERBOARD_LANGUAGES,
+    LEADERBOARD_MODES,
+    commit_window,
+    get_period_datetimes,
+    get_period_range,
+    pack_score_distribution,
+    publish_snapshots,
+    render_snapshot_payload,
+    safe_session_watermark,
+)
+
+
+class LiveRankIndex:
+    """
+    (기간, 모드, 언어) 단위 정렬 순위 인덱스
+
+    키는 (-평균 WPM, -평균 정확도, user_id)로 스냅샷 생성 쿼리와 같은 순서를 쓰며,
+    순위/주변 랭커/백분위는 bisect로 O(log n)에 조회한다.
+    """
+
+    def __init__(self, period, start_date, end_date, mode, language):
+        self.period = period
+        self.start_date = start_date
+        self.end_date = end_date
+        self.mode = mode
+        self.language = language
+        self.range_start, self.range_end = get_period_datetimes(start_date, end_date)
+        self.last_session_id = 0
+        # 워터마크 이후 반영한 세션: session_id -> (user_id, username, wpm, accuracy, duration_ms)
+        self.pending = {}
+        # 이 시각 이후 검사된 제외 대상 세션을 확인, 이미 처리한 세션: session_id -> screened_at
+        self.flags_since = timezone.now() - commit_window()
+        self.flags_handled = {}
+        # user_id -> [sum_wpm, sum_accuracy, session_count, best_wpm, total_duration_ms, username]
+        self.users = {}
+        self.keys = []
+
+    def __len__(self):
+        return len(self.keys)
+
+    @staticmethod
+    def _key(user_id, state):
+        count = state[2]
+        return (-round(state[0] / count, 2), -round(state[1] / count, 2), user_id)
+
+    def add(self, user_id, username, sum_wpm, sum_accuracy, session_count=1,
+            best_wpm=None, duration_ms=0):
+        """사용자 누적치 반영 (기존 키 제거 후 재삽입)"""
+        state = self.users.get(user_id)
+        if state is None:
+            state = [0.0, 0.0, 0, None, 0, username]
+            self.users[user_id] = state
+        else:
+            del self.keys[bisect_left(self.keys, self._key(user_id, state))]
+
+        best_wpm = sum_wpm if best_wpm is None else best_wpm
+        state[0] += sum_wpm
+        state[1] += sum_accuracy
+        state[2] += session_count
+        state[3] = best_wpm if state[3] is None else max(state[3], best_wpm)
+        state[4] += duration_ms
+        insort(self.keys, self._key(user_id, state))
+
+    def remove(self, user_id):
+        state = self.users.pop(user_id, None)
+        if state is not None:
+            del self.keys[bisect_left(self.keys, self._key(user_id, state))]
+
+    def advance(self, session_id):
+        """워터마크를 올리고 그 이하로 내려간 반영 세션 기록은 정리"""
+        if session_id <= self.last_session_id:
+            return
+        self.last_session_id = session_id
+        self.pending = {key: value for key, value in self.pending.items() if key > session_id}
+
+    def settled(self):
+        """
+        워터마크까지의 세션만 반영한 사본 (체크포인트 스냅샷의 source_session_id와 맞춤)
+        최고 WPM은 뺄 수 없어 그대로 두며, 시드 후 같은 세션을 다시 반영하면 같은 값이 된다.
+        """
+        copy = LiveRankIndex(self.period, self.start_date, self.end_date, self.mode, self.language)
+        copy.last_session_id = self.last_session_id
+        pending = {}
+        for user_id, _, wpm, accuracy, duration_ms in self.pending.values():
+            totals = pending.setdefault(user_id, [0.0, 0.0, 0, 0])
+            totals[0] += wpm
+            totals[1] += accuracy
+            totals[2] += 1
+            totals[3] += duration_ms
+        for user_id, (sum_wpm, sum_accuracy, count, best_wpm, duration_ms, username) in self.users.items():
+            totals = pending.get(user_id, (0.0, 0.0, 0, 0))
+            if count > totals[2]:
+                copy.add(
+                    user_id, username, sum_wpm - totals[0], sum_accuracy - totals[1],
+                    count - totals[2], best_wpm, duration_ms - totals[3],
+                )
+        return copy
+
+    def accepts(self, mode, language, started_at):
+        """세션이 이 인덱스의 집계 대상인지 여부"""
+        return (
+            (self.mode == 'all' or self.mode == mode)
+            and (self.language == 'all' or self.language == language)
+            and self.range_start <= started_at < self.range_end
+        )
+
+    def rank_of(self, user_id):
+        state = self.users.get(user_id)
+        if state is None:
+            return None
+        return bisect_left(self.keys, self._key(user_id, state)) + 1
+
+    def percentile(self, user_id):
+        """상위 백분위 (1위 = 상위 100/n %)"""
+        rank = self.rank_of(user_id)
+        if rank is None:
+            return None
+        return round(rank / len(self.keys) * 100, 2)
+
+    def entry_at(self, rank):
+        """순위 위치의 엔트리 (EntrySerializer와 같은 필드)"""
+        user_id = self.keys[rank - 1][2]
+        sum_wpm, sum_accuracy, count, best_wpm, duration_ms, username = self.users[user_id]
+        return {
+            'rank': rank,
+            'user': user_id,
+            'username': username,
+            'score_wpm': f'{sum_wpm / count:.2f}',
+            'score_accuracy': f'{sum_accuracy / count:.2f}',
+            'session_count': count,
+            'best_wpm': f'{best_wpm:.2f}',
+            'total_duration_ms': duration_ms,
+        }
+
+    def entry(self, user_id):
+        rank = self.rank_of(user_id)
+        return self.entry_at(rank) if rank else None
+
+    def neighbors(self, user_id, radius=2):
+        """내 순위 ±radius 랭커 (본인 제외)"""
+        rank = self.rank_of(user_id)
+        if rank is None:
+            return []
+        first = max(1, rank - radius)
+        last = min(len(self.keys), rank + radius)
+        return [self.entry_at(r) for r in range(first, last + 1) if r != rank]
+
+    def ranked(self):
+        """순위 순서로 (rank, user_id, state) 반환"""
+        for index, key in enumerate(self.keys):
+            yield index + 1, key[2], self.users[key[2]]
+
+
+_indexes = {}
+_lock = threading.Lock()
+# 따라잡기(DB 조회)는 한 스레드만, 인덱스 갱신 때만 _lock을 잡는다
+_reconcile_lock = threading.Lock()
+# 새로 적재하는 인덱스는 적재 시 따라잡으므로 시작 시각부터 주기를 센다
+_last_reconcile = time.monotonic()
+
+
+def reconcile_interval():
+    return settings.LEADERBOARD_LIVE_RECONCILE_SECONDS
+
+
+def _is_clean(session):
+    score = session.suspicion_score
+    return score is None or float(score) < settings.ANTICHEAT_EXCLUDE_SCORE
+
+
+def _clean_sessions():
+    """부정행위 의심 점수가 기준 미만이거나 아직 검사 전인 세션"""
+    return Q(suspicion_score__isnull=True) | Q(suspicion_score__lt=settings.ANTICHEAT_EXCLUDE_SCORE)
+
+
+def _session_filter(index):
+    filters = {
+        'user__isnull': False,
+        'started_at__gte': index.range_start,
+        'started_at__lt': index.range_end,
+    }
+    if index.mode != 'all':
+        filters['mode'] = index.mode
+    if index.language != 'all':
+        filters['language'] = index.language
+    return filters
+
+
+def _load_index(period, start_date, end_date, mode, language):
+    """활성 스냅샷(없으면 기간 집계)으로 인덱스 시드"""
+    index = LiveRankIndex(period, start_date, end_date, mode, language)
+
+    snapshot = Snapshot.objects.filter(
+        is_active=True,
+        period=period,
+        start_date=start_date,
+        end_date=end_date,
+        mode=mode,
+        language=language,
+        source_session_id__isnull=False,
+    ).order_by('-generated_at').first()
+
+    if snapshot:
+        index.last_session_id = snapshot.source_session_id
+        # 스냅샷 생성 이후 제외 점수를 받은 세션도 빼도록 생성 시각부터 확인
+        index.flags_since = snapshot.generated_at - commit_window()
+        rows = snapshot.entries.values_list(
+            'user_id', 'user__username', 'score_wpm', 'score_accuracy',
+            'session_count', 'best_wpm', 'total_duration_ms'
+        )
+        for user_id, username, score_wpm, score_accuracy, count, best_wpm, duration_ms in rows.iterator():
+            index.add(
+                user_id, username,
+                float(score_wpm) * count, float(score_accuracy) * count, count,
+                float(best_wpm) if best_wpm is not None else None, duration_ms,
+            )
+        return index
+
+    index.last_session_id = safe_session_watermark()
+    _add_clean_totals(index)
+    return index
+
+
+def _add_clean_totals(index, user_ids=None):
+    """워터마크 이하의 제외되지 않은 세션을 사용자별로 집계해 인덱스에 더함"""
+    queryset = TypingSession.objects.filter(
+        _clean_sessions(), id__lte=index.last_session_id, **_session_filter(index)
+    )
+    if user_ids is not None:
+        queryset = queryset.filter(user_id__in=user_ids)
+    rows = queryset.values('user_id', 'user__username').annotate(
+        sum_wpm=Sum('wpm'),
+        sum_accuracy=Sum('accuracy'),
+        session_count=Count('id'),
+        best_wpm=Max('wpm'),
+        total_duration_ms=Sum('duration_ms'),
+    )
+    for row in rows.iterator():
+        index.add(
+            row['user_id'], row['user__username'],
+            float(row['sum_wpm']), float(row['sum_accuracy']), row['session_count'],
+            float(row['best_wpm']), row['total_duration_ms'] or 0,
+        )
+
+
+def _reload_users(index, user_ids):
+    """사용자들의 누적치를 세션 테이블 기준으로 다시 계산 (워터마크 이후 반영분은 기억한 값으로)"""
+    for user_id in user_ids:
+        index.remove(user_id)
+    _add_clean_totals(index, user_ids)
+    for user_id, username, wpm, accuracy, duration_ms in index.pending.values():
+        if user_id in user_ids:
+            index.add(user_id, username, wpm, accuracy, 1, wpm, duration_ms)
+
+
+def _flagged_rows(indexes, earliest):
+    """반영 후 제외 점수를 받은 세션 (검사 결과는 screened_at보다 늦게 커밋될 수 있어 커밋 대기 시간만큼 겹쳐 확인)"""
+    return list(TypingSession.objects.filter(
+        suspicion_score__gte=settings.ANTICHEAT_EXCLUDE_SCORE,
+        screened_at__gte=min(index.flags_since for index in indexes),
+        user__isnull=False,
+        started_at__gte=earliest,
+    ).values_list('id', 'user_id', 'mode', 'language', 'started_at', 'screened_at'))
+
+
+def _exclude_flagged(indexes, rows, now):
+    """제외된 세션이 있는 사용자를 다시 집계 (영향 사용자만 쿼리)"""
+    for index in indexes:
+        affected = set()
+        for session_id, user_id, mode, language, started_at, screened_at in rows:
+            if (screened_at >= index.flags_since and session_id not in index.flags_handled
+                    and index.accepts(mode, language, started_at)):
+                index.flags_handled[session_id] = screened_at
+                index.pending.pop(session_id, None)
+                affected.add(user_id)
+        if affected:
+            _reload_users(index, affected)
+        index.flags_since = now - commit_window()
+        index.flags_handled = {
+            session_id: screened_at for session_id, screened_at in index.flags_handled.items()
+            if screened_at >= index.flags_since
+        }
+
+
+def _catch_up(indexes):
+    """
+    인덱스들에 워터마크 이후 세션과 새로 제외된 세션 반영
+
+    워터마크 이후 세션은 이미 반영했더라도 다시 읽어, 더 작은 ID로 늦게 커밋된 세션이나
+    다른 프로세스에서 저장된 세션을 놓치지 않는다 (pending에 있는 세션은 건너뜀).
+    커밋 대기 시간이 지난 세션까지 확인되면 워터마크를 그 ID로 올린다.
+    세션 조회는 _lock 밖에서 하고, 인덱스 갱신만 _lock 안에서 한다.
+    """
+    if not indexes:
+        return
+
+    with _lock:
+        watermark = min(index.last_session_id for index in indexes)
+    earliest = min(index.range_start for index in indexes)
+    now = timezone.now()
+    settled_before = now - commit_window()
+
+    rows = list(TypingSession.objects.filter(
+        _clean_sessions(),
+        id__gt=watermark,
+        user__isnull=False,
+        started_at__gte=earliest,
+    ).order_by('id').values_list(
+        'id', 'user_id', 'user__username', 'mode', 'language',
+        'started_at', 'wpm', 'accuracy', 'duration_ms', 'created_at'
+    ))
+    flagged = _flagged_rows(indexes, earliest)
+
+    with _lock:
+        settled_id = 0
+        for (session_id, user_id, username, mode, language, started_at,
+             wpm, accuracy, duration_ms, created_at) in rows:
+            for index in indexes:
+                _add_session(index, session_id, user_id, username, mode, language, started_at,
+                             float(wpm), float(accuracy), duration_ms)
+            if created_at < settled_before:
+                settled_id = session_id
+
+        for index in indexes:
+            index.advance(settled_id)
+
+        _exclude_flagged(indexes, flagged, now)
+
+
+def _add_session(index, session_id, user_id, username, mode, language, started_at, wpm, accuracy, duration_ms):
+    """세션 한 건 반영 (워터마크 이하이거나 이미 반영한 세션은 무시)"""
+    if (session_id > index.last_session_id and session_id not in index.pending
+            and index.accepts(mode, language, started_at)):
+        index.add(user_id, username, wpm, accuracy, 1, wpm, duration_ms)
+        index.pending[session_id] = (user_id, username, wpm, accuracy, duration_ms)
+
+
+def reconcile_live_indexes(force=False):
+    """
+    적재된 인덱스를 DB와 맞춤 (주기가 지났거나 force일 때만)
+
+    다른 스레드가 이미 따라잡는 중이면 기다리지 않고 넘어간다 (force면 기다림).
+    """
+    global _last_reconcile
+    if not force and time.monotonic() - _last_reconcile < reconcile_interval():
+        return
+    if not _reconcile_lock.acquire(blocking=force):
+        return
+    try:
+        with _lock:
+            indexes = list(_indexes.values())
+        _catch_up(indexes)
+        _last_reconcile = time.monotonic()
+    finally:
+        _reconcile_lock.release()
+
+
+def _evict_expired(today):
+    """종료된 지 하루 이상 지난 기간의 인덱스 제거"""
+    for key in [key for key, index in _indexes.items() if index.end_date < today - timedelta(days=1)]:
+        del _indexes[key]
+
+
+def get_live_index(period, mode='all', language='all', reference_date=None):
+    """
+    실시간 순위 인덱스 조회
+
+    처음 요청된 (기간, 모드, 언어)는 스냅샷으로 시드하고 따라잡은 뒤 등록한다.
+    이후 조회는 메모리만 읽으며, reconcile 주기가 지났을 때만 DB와 맞춘다.
+    """
+    today = timezone.localdate()
+    start_date, end_date = get_period_range(period, reference_date or today)
+    key = (period, start_date, mode, language)
+
+    with _lock:
+        index = _indexes.get(key)
+    if index is not None:
+        reconcile_live_indexes()
+        return index
+
+    index = _load_index(period, start_date, end_date, mode, language)
+    _catch_up([index])
+    with _lock:
+        _evict_expired(today)
+        # 동시에 같은 인덱스를 만든 스레드가 있으면 먼저 등록된 쪽 사용
+        return _indexes.setdefault(key, index)
+
+
+def live_user_rank(index, user_id):
+    """내 순위/백분위/주변 랭커 (세션 반영과 겹치지 않도록 _lock 안에서 읽음)"""
+    with _lock:
+        return {
+            'total_users': len(index),
+            'my_entry': index.entry(user_id),
+            'percentile': index.percentile(user_id),
+            'neighbors': index.neighbors(user_id),
+        }
+
+
+def record_sessions(sessions):
+    """
+    세션 저장 커밋 직후 호출 - 이 프로세스에 적재된 인덱스에 바로 반영 (DB 조회 없음)
+
+    제외 점수를 이미 받은 세션은 넣지 않으며, 이후 제외되는 세션은 reconcile에서 뺀다.
+    """
+    sessions = [session for session in sessions if session.user_id is not None and _is_clean(session)]
+    if not sessions:
+        return
+    with _lock:
+        for index in _indexes.values():
+            for session in sessions:
+                _add_session(
+                    index, session.id, session.user_id, session.user.username,
+                    session.mode, session.language, session.started_at,
+                    float(session.wpm), float(session.accuracy), session.duration_ms,
+                )
+
+
+def record_session(session):
+    """세션 한 건 반영 (record_sessions 참고)"""
+    record_sessions([session])
+
+
+def checkpoint_live_indexes(period, reference_date=None):
+    """
+    실시간 인덱스를 새 스냅샷 세대로 체크포인트
+
+    전체 재집계 없이 마지막 스냅샷 + 이후 세션으로 Entry를 다시 적재하고
+    build_leaderboard와 같은 스테이징/게시 경로로 교체한다.
+    반환값: {(mode, language): 엔트리 수}
+    """
+    indexes = {
+        (mode, language): get_live_index(period, mode, language, reference_date)
+        for mode in LEADERBOARD_MODES
+        for language in LEADERBOARD_LANGUAGES
+    }
+    # 체크포인트는 다른 프로세스의 세션까지 반영된 상태로 기록
+    reconcile_live_indexes(force=True)
+
+    with transaction.atomic():
+        snapshots = {}
+        counts = {}
+        for (mode, language), index in indexes.items():
+            with _lock:
+                settled = index.settled()
+            rows = list(settled.ranked())
+            source_session_id = settled.last_session_id
+
+            snapshot = Snapshot.objects.create(
+                period=period,
+                start_date=index.start_date,
+                end_date=index.end_date,
+                mode=mode,
+                language=language,
+                is_active=False,
+                source_session_id=source_session_id,
+            )
+            Entry.objects.bulk_create(
+                (
+                    Entry(
+                        snapshot=snapshot,
+                        user_id=user_id,
+                        rank=rank,
+                        score_wpm=round(state[0] / state[2], 2),
+                        score_accuracy=round(state[1] / state[2], 2),
+                        session_count=state[2],
+                        best_wpm=round(state[3], 2),
+                        total_duration_ms=state[4],
+                    )
+                    for rank, user_id, state in rows
+                ),
+                batch_size=ENTRY_BATCH_SIZE,
+            )
+            snapshot.entry_count = len(rows)
+            snapshot.score_distribution = pack_score_distribution(
+                round(state[0] / state[2], 2) for _, _, state in rows
+            )
+            render_snapshot_payload(snapshot)
+            snapshots[(mode, language)] = snapshot
+            counts[(mode, language)] = len(rows)
+
+    publish_snapshots(snapshots.values())
+    return counts
@@ -0,0 +1,68 @@
+"""
+랭킹 스냅샷 생성 커맨드
+Usage: python manage.py build_leaderboard [--period weekly] [--date 2026-01-30]
+"""
+import time
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+from apps.leaderboard.models import Snapshot
+from apps.leaderboard.services import build_leaderboard, prune_snapshots
+
+
+class Command(BaseCommand):
+    help = '기간별 랭킹 스냅샷(모드 × 언어)을 생성합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--period',
+            action='append',
+            choices=[choice[0] for choice in Snapshot.PERIOD_CHOICES],
+            help='생성할 기간 (여러 번 지정 가능, 기본: 전체)',
+        )
+        parser.add_argument(
+            '--date',
+            help='기준일 (YYYY-MM-DD, 기본: 오늘)',
+        )
+        parser.add_argument(
+            '--min-sessions',
+            type=int,
+            default=1,
+            help='랭킹 진입 최소 세션 수',
+        )
+        parser.add_argument(
+            '--skip-prune',
+            action='store_true',
+            help='유예 기간이 지난 이전 세대 스냅샷 정리를 건너뜁니다.',
+        )
+
+    def handle(self, *args, **options):
+        periods = options['period'] or [choice[0] for choice in Snapshot.PERIOD_CHOICES]
+
+        reference_date = None
+        if options['date']:
+            try:
+                reference_date = date.fromisoformat(options['date'])
+            except ValueError:
+                raise CommandError(f"잘못된 날짜 형식입니다: {options['date']}")
+
+        self.stdout.write('🏆 랭킹 스냅샷 생성 시작...')
+
+        for period in periods:
+            started = time.monotonic()
+            counts = build_leaderboard(
+                period,
+                reference_date=reference_date,
+                min_sessions=options['min_sessions'],
+            )
+            elapsed = time.monotonic() - started
+
+            self.stdout.write(f'  ✅ {period}: {sum(counts.values())}개 엔트리 ({elapsed:.2f}s)')
+            for (mode, language), count in counts.items():
+                self.stdout.write(f'     → {mode}/{language}: {count}')
+
+        if not options['skip_prune']:
+            pruned = prune_snapshots()
+            self.stdout.write(f'  🧹 이전 세대 스냅샷 {pruned}개 정리')
+
+        self.stdout.write(self.style.SUCCESS('✅ 랭킹 스냅샷 생성 완료!'))
@@ -0,0 +1,38 @@
+"""
+실시간 순위 인덱스 체크포인트 커맨드
+Usage: python manage.py checkpoint_leaderboard [--period weekly]
+"""
+import time
+
+from django.core.management.base import BaseCommand
+from apps.leaderboard.live import checkpoint_live_indexes
+from apps.leaderboard.models import Snapshot
+from apps.leaderboard.services import prune_snapshots
+
+
+class Command(BaseCommand):
+    help = '마지막 스냅샷 이후 세션을 반영한 실시간 순위를 새 스냅샷으로 게시합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--period',
+            action='append',
+            choices=[choice[0] for choice in Snapshot.PERIOD_CHOICES],
+            help='체크포인트할 기간 (여러 번 지정 가능, 기본: 전체)',
+        )
+
+    def handle(self, *args, **options):
+        periods = options['period'] or [choice[0] for choice in Snapshot.PERIOD_CHOICES]
+
+        self.stdout.write('⏱️ 실시간 순위 체크포인트 시작...')
+
+        for period in periods:
+            started = time.monotonic()
+            counts = checkpoint_live_indexes(period)
+            elapsed = time.monotonic() - started
+            self.stdout.write(f'  ✅ {period}: {sum(counts.values())}개 엔트리 ({elapsed:.2f}s)')
+
+        pruned = prune_snapshots()
+        self.stdout.write(f'  🧹 이전 세대 스냅샷 {pruned}개 정리')
+
+        self.stdout.write(self.style.SUCCESS('✅ 체크포인트 완료!'))
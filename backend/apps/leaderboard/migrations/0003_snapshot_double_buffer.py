@@ -0,0 +1,31 @@
+# Generated by Django 4.2.30 on 2026-10-17 21:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('leaderboard', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.RemoveConstraint(
+            model_name='snapshot',
+            name='uq_snapshot_period',
+        ),
+        migrations.AddField(
+            model_name='snapshot',
+            name='retired_at',
+            field=models.DateTimeField(blank=True, help_text='새 세대 게시로 비활성화된 시각 (유예 기간 후 정리)', null=True, verbose_name='교체 시각'),
+        ),
+        migrations.AlterField(
+            model_name='snapshot',
+            name='is_active',
+            field=models.BooleanField(default=True, help_text='스테이징 중인 스냅샷은 비활성 상태로 적재 후 게시', verbose_name='활성화'),
+        ),
+        migrations.AddConstraint(
+            model_name='snapshot',
+            constraint=models.UniqueConstraint(condition=models.Q(('is_active', True)), fields=('period', 'start_date', 'end_date', 'mode', 'language'), name='uq_snapshot_period_active'),
+        ),
+    ]
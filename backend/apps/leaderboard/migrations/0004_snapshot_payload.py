@@ -0,0 +1,39 @@
+# Generated by Django 4.2.30 on 2026-10-17 21:47
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_entry_count(apps, schema_editor):
+    Snapshot = apps.get_model('leaderboard', 'Snapshot')
+    Entry = apps.get_model('leaderboard', 'Entry')
+    counts = Entry.objects.filter(snapshot=OuterRef('pk')).values('snapshot').annotate(c=Count('id')).values('c')
+    # 엔트리가 없는 스냅샷은 서브쿼리가 NULL이므로 0으로
+    Snapshot.objects.update(entry_count=Coalesce(Subquery(counts), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('leaderboard', '0003_snapshot_double_buffer'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='snapshot',
+            name='entry_count',
+            field=models.PositiveIntegerField(default=0, help_text='생성 시점에 저장 (조회 시 COUNT 방지)', verbose_name='엔트리 수'),
+        ),
+        migrations.AddField(
+            model_name='snapshot',
+            name='payload',
+            field=models.TextField(blank=True, help_text='상위 N명 엔트리를 포함한 상세 응답 JSON (생성 시 1회 렌더링)', verbose_name='상세 응답 캐시'),
+        ),
+        migrations.AddField(
+            model_name='snapshot',
+            name='payload_etag',
+            field=models.CharField(blank=True, max_length=64, verbose_name='응답 ETag'),
+        ),
+        migrations.RunPython(backfill_entry_count, migrations.RunPython.noop),
+    ]
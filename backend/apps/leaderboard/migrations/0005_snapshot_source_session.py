@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-17 21:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('leaderboard', '0004_snapshot_payload'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='snapshot',
+            name='source_session_id',
+            field=models.BigIntegerField(blank=True, help_text='이 ID 이하의 세션까지 반영됨 (실시간 인덱스 따라잡기 기준)', null=True, verbose_name='집계 기준 세션 ID'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-17 21:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('leaderboard', '0005_snapshot_source_session'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='snapshot',
+            name='score_distribution',
+            field=models.BinaryField(blank=True, default=b'', help_text='전체 엔트리 score_wpm 오름차순 float64 배열 (백분위 이진 탐색용)', verbose_name='점수 분포'),
+        ),
+    ]
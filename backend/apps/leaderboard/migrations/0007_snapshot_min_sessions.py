@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-17 23:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('leaderboard', '0006_snapshot_score_distribution'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='snapshot',
+            name='min_sessions',
+            field=models.PositiveIntegerField(default=1, help_text='집계 시 적용한 랭킹 진입 최소 세션 수 (내 순위 백분위 계산에도 동일하게 적용)', verbose_name='최소 세션 수'),
+        ),
+    ]
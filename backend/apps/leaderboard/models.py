@@ -57,7 +57,46 @@ class Snapshot(models.Model):
     )
     is_active = models.BooleanField(
         default=True,
-        verbose_name='활성화'
+        verbose_name='활성화',
+        help_text='스테이징 중인 스냅샷은 비활성 상태로 적재 후 게시'
+    )
+    retired_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name='교체 시각',
+        help_text='새 세대 게시로 비활성화된 시각 (유예 기간 후 정리)'
+    )
+    source_session_id = models.BigIntegerField(
+        null=True,
+        blank=True,
+        verbose_name='집계 기준 세션 ID',
+        help_text='이 ID 이하의 세션까지 반영됨 (실시간 인덱스 따라잡기 기준)'
+    )
+    min_sessions = models.PositiveIntegerField(
+        default=1,
+        verbose_name='최소 세션 수',
+        help_text='집계 시 적용한 랭킹 진입 최소 세션 수 (내 순위 백분위 계산에도 동일하게 적용)'
+    )
+    entry_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name='엔트리 수',
+        help_text='생성 시점에 저장 (조회 시 COUNT 방지)'
+    )
+    score_distribution = models.BinaryField(
+        blank=True,
+        default=b'',
+        verbose_name='점수 분포',
+        help_text='전체 엔트리 score_wpm 오름차순 float64 배열 (백분위 이진 탐색용)'
+    )
+    payload = models.TextField(
+        blank=True,
+        verbose_name='상세 응답 캐시',
+        help_text='상위 N명 엔트리를 포함한 상세 응답 JSON (생성 시 1회 렌더링)'
+    )
+    payload_etag = models.CharField(
+        max_length=64,
+        blank=True,
+        verbose_name='응답 ETag'
     )
     created_at = models.DateTimeField(
         auto_now_add=True,
@@ -75,7 +114,8 @@ class Snapshot(models.Model):
         constraints = [
             models.UniqueConstraint(
                 fields=['period', 'start_date', 'end_date', 'mode', 'language'],
-                name='uq_snapshot_period'
+                condition=models.Q(is_active=True),
+                name='uq_snapshot_period_active'
             ),
         ]
         indexes = [
@@ -85,10 +125,6 @@ class Snapshot(models.Model):
     
     def __str__(self):
         return f"{self.get_period_display()} {self.start_date} ~ {self.end_date} ({self.language})"
-    
-    @property
-    def entry_count(self):
-        return self.entries.count()
 
 
 class Entry(models.Model):
@@ -1,3 +1,4 @@
+from django.conf import settings
 from rest_framework import serializers
 from .models import Snapshot, Entry
 
@@ -28,8 +29,8 @@ class SnapshotSerializer(serializers.ModelSerializer):
 
 
 class SnapshotDetailSerializer(serializers.ModelSerializer):
-    """랭킹 스냅샷 상세 직렬화 (엔트리 포함)"""
-    entries = EntrySerializer(many=True, read_only=True)
+    """랭킹 스냅샷 상세 직렬화 (상위 N명 엔트리 포함)"""
+    entries = serializers.SerializerMethodField()
     entry_count = serializers.IntegerField(read_only=True)
     
     class Meta:
@@ -38,6 +39,10 @@ class SnapshotDetailSerializer(serializers.ModelSerializer):
             'id', 'period', 'start_date', 'end_date', 'mode', 'language',
             'entry_count', 'generated_at', 'entries'
         ]
+    
+    def get_entries(self, obj):
+        entries = obj.entries.select_related('user').order_by('rank')[:settings.LEADERBOARD_TOP_N]
+        return EntrySerializer(entries, many=True).data
 
 
 class MyRankSerializer(serializers.Serializer):
@@ -45,3 +50,4 @@ class MyRankSerializer(serializers.Serializer):
     snapshot = SnapshotSerializer()
     my_entry = EntrySerializer(allow_null=True)
     neighbors = EntrySerializer(many=True)
+    percentile = serializers.FloatField(allow_null=True)
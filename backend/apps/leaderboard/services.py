@@ -0,0 +1,386 @@
+"""
+leaderboard 서비스 - 랭킹 스냅샷 생성
+"""
+import hashlib
+from array import array
+from bisect import bisect_right
+from datetime import datetime, time, timedelta
+from functools import lru_cache
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import Q
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+
+from apps.sessions.models import TypingSession
+from apps.stats.services import PERIOD_ROLLUPS
+from .models import Snapshot, Entry
+from .serializers import SnapshotDetailSerializer
+
+
+LEADERBOARD_MODES = ['practice', 'ranked', 'all']
+LEADERBOARD_LANGUAGES = ['ko', 'en', 'all']
+
+ENTRY_BATCH_SIZE = 5000
+
+# 기간 내 세션을 (사용자 × 모드 × 언어) GROUPING SETS로 한 번에 집계한 뒤
+# 모드/언어 조합별로 RANK()를 매긴다. 동점은 정확도 → user_id 순으로 풀어
+# uq_entry_snapshot_rank 제약과 충돌하지 않도록 한다.
+# 부정행위 의심 점수가 기준 이상인 세션은 집계에서 제외한다 (idx_session_suspicion).
+RANKING_SQL = """
+WITH agg AS (
+    SELECT
+        s.user_id,
+        CASE WHEN GROUPING(s.mode) = 1 THEN 'all' ELSE s.mode END AS mode_key,
+        CASE WHEN GROUPING(s.language) = 1 THEN 'all' ELSE s.language END AS language_key,
+        ROUND(AVG(s.wpm), 2) AS score_wpm,
+        ROUND(AVG(s.accuracy), 2) AS score_accuracy,
+        COUNT(*) AS session_count,
+        MAX(s.wpm) AS best_wpm,
+        COALESCE(SUM(s.duration_ms), 0) AS total_duration_ms
+    FROM {table} s
+    WHERE s.user_id IS NOT NULL
+      AND s.id <= %s
+      AND s.started_at >= %s
+      AND s.started_at < %s
+      AND (s.suspicion_score IS NULL OR s.suspicion_score < %s)
+    GROUP BY s.user_id, GROUPING SETS ((s.mode, s.language), (s.mode), (s.language), ())
+    HAVING COUNT(*) >= %s
+)
+SELECT
+    mode_key,
+    language_key,
+    user_id,
+    RANK() OVER (
+        PARTITION BY mode_key, language_key
+        ORDER BY score_wpm DESC, score_accuracy DESC, user_id
+    ) AS rank,
+    score_wpm,
+    score_accuracy,
+    session_count,
+    best_wpm,
+    total_duration_ms
+FROM agg
+WHERE mode_key IN %s
+"""
+
+
+# 주간/월간 랭킹: 세션 대신 UserWeekly/UserMonthly의 (사용자 × 모드 × 언어) 행을 읽는다.
+# 기간 안에 제외 대상(의심 점수 기준 이상) 세션이 있는 사용자만 세션 테이블에서 다시 집계해
+# 합치고, 평균은 RANKING_SQL의 AVG와 같도록 합계 / 세션 수로 계산한다.
+# 통계 행은 세션 ID와 무관하게 커밋된 세션을 모두 담으므로 워터마크 이후 세션은 빼서 맞춘다
+# (최고 WPM은 뺄 수 없지만 실시간 인덱스가 같은 세션을 다시 반영하면 같은 값이 된다).
+ROLLUP_RANKING_SQL = """
+WITH flagged AS (
+    SELECT DISTINCT s.user_id
+    FROM {table} s
+    WHERE s.user_id IS NOT NULL
+      AND s.started_at >= %(range_start)s
+      AND s.started_at < %(range_end)s
+      AND s.suspicion_score >= %(exclude_score)s
+),
+source AS (
+    SELECT
+        r.user_id, r.mode, r.language, r.total_sessions AS sessions,
+        r.sum_wpm, r.sum_accuracy, r.best_wpm, r.total_duration_ms
+    FROM {rollup_table} r
+    WHERE r.period_start = %(period_start)s
+      AND NOT EXISTS (SELECT 1 FROM flagged f WHERE f.user_id = r.user_id)
+    UNION ALL
+    SELECT
+        s.user_id, s.mode, s.language, COUNT(*),
+        SUM(s.wpm), SUM(s.accuracy), MAX(s.wpm), COALESCE(SUM(s.duration_ms), 0)
+    FROM {table} s
+    WHERE s.user_id IN (SELECT user_id FROM flagged)
+      AND s.id <= %(source_session_id)s
+      AND s.started_at >= %(range_start)s
+      AND s.started_at < %(range_end)s
+      AND (s.suspicion_score IS NULL OR s.suspicion_score < %(exclude_score)s)
+    GROUP BY s.user_id, s.mode, s.language
+    UNION ALL
+    -- 통계 행에는 이미 들어 있지만 워터마크 이후라 실시간 인덱스가 따라잡을 세션은 빼 둔다
+    SELECT
+        s.user_id, s.mode, s.language, -COUNT(*),
+        -SUM(s.wpm), -SUM(s.accuracy), NULL, -COALESCE(SUM(s.duration_ms), 0)
+    FROM {table} s
+    WHERE s.user_id IS NOT NULL
+      AND s.id > %(source_session_id)s
+      AND s.started_at >= %(range_start)s
+      AND s.started_at < %(range_end)s
+      AND NOT EXISTS (SELECT 1 FROM flagged f WHERE f.user_id = s.user_id)
+    GROUP BY s.user_id, s.mode, s.language
+),
+agg AS (
+    SELECT
+        user_id,
+        CASE WHEN GROUPING(mode) = 1 THEN 'all' ELSE mode END AS mode_key,
+        CASE WHEN GROUPING(language) = 1 THEN 'all' ELSE language END AS language_key,
+        ROUND(SUM(sum_wpm) / SUM(sessions), 2) AS score_wpm,
+        ROUND(SUM(sum_accuracy) / SUM(sessions), 2) AS score_accuracy,
+        SUM(sessions) AS session_count,
+        MAX(best_wpm) AS best_wpm,
+        SUM(total_duration_ms) AS total_duration_ms
+    FROM source
+    GROUP BY user_id, GROUPING SETS ((mode, language), (mode), (language), ())
+    HAVING SUM(sessions) >= GREATEST(%(min_sessions)s, 1)
+)
+SELECT
+    mode_key,
+    language_key,
+    user_id,
+    RANK() OVER (
+        PARTITION BY mode_key, language_key
+        ORDER BY score_wpm DESC, score_accuracy DESC, user_id
+    ) AS rank,
+    score_wpm,
+    score_accuracy,
+    session_count,
+    best_wpm,
+    total_duration_ms
+FROM agg
+WHERE mode_key IN %(modes)s
+"""
+
+
+def commit_window():
+    return timedelta(seconds=settings.LEADERBOARD_COMMIT_WINDOW_SECONDS)
+
+
+def safe_session_watermark(now=None):
+    """
+    이 ID 이하 세션은 모두 커밋되었다고 볼 수 있는 워터마크
+
+    ID는 INSERT 시점에 발급되고 커밋 순서는 그와 다를 수 있으므로, 최대 ID 대신
+    커밋 대기 시간(LEADERBOARD_COMMIT_WINDOW_SECONDS)보다 먼저 생성된 세션의 최대 ID를 쓴다.
+    """
+    cutoff = (now or timezone.now()) - commit_window()
+    return (
+        TypingSession.objects.filter(created_at__lt=cutoff).order_by('-id').values_list('id', flat=True).first()
+        or 0
+    )
+
+
+def get_period_range(period, reference_date):
+    """기준일이 속한 기간의 (시작일, 종료일) 반환"""
+    if period == 'daily':
+        return reference_date, reference_date
+    if period == 'weekly':
+        start_date = reference_date - timedelta(days=reference_date.weekday())
+        return start_date, start_date + timedelta(days=6)
+    if period == 'monthly':
+        start_date = reference_date.replace(day=1)
+        next_month = (start_date + timedelta(days=32)).replace(day=1)
+        return start_date, next_month - timedelta(days=1)
+    raise ValueError(f'지원하지 않는 기간입니다: {period}')
+
+
+def get_period_datetimes(start_date, end_date):
+    """기간의 [시작, 끝) 시각 반환 (집계 기준은 Asia/Seoul 자정)"""
+    tz = timezone.get_current_timezone()
+    range_start = timezone.make_aware(datetime.combine(start_date, time.min), tz)
+    range_end = timezone.make_aware(datetime.combine(end_date + timedelta(days=1), time.min), tz)
+    return range_start, range_end
+
+
+def build_leaderboard(period, reference_date=None, min_sessions=1):
+    """
+    기간별 랭킹 스냅샷 생성
+
+    모든 모드 × 언어 조합을 한 번의 쿼리로 집계해 비활성(스테이징) 스냅샷에
+    적재한 뒤, publish_snapshots로 한 트랜잭션 안에서 교체 게시한다.
+    일간은 세션 테이블, 주간/월간은 주간/월간 통계 행에서 집계한다.
+    반환값: {(mode, language): 엔트리 수}
+    """
+    reference_date = reference_date or timezone.localdate()
+    start_date, end_date = get_period_range(period, reference_date)
+
+    range_start, range_end = get_period_datetimes(start_date, end_date)
+
+    # 스테이징: 읽기 쪽은 is_active=True만 보므로 적재 중인 엔트리는 노출되지 않음
+    repeatable_read = not connection.in_atomic_block
+    with transaction.atomic():
+        if repeatable_read:
+            # 워터마크와 주간/월간 통계 행을 같은 스냅샷에서 읽도록 (트랜잭션 첫 문장이어야 함)
+            with connection.cursor() as cursor:
+                cursor.execute('SET TRANSACTION ISOLATION LEVEL REPEATABLE READ')
+
+        # 워터마크 이하 세션만 집계 (실시간 인덱스가 이후 세션을 커밋 순서와 무관하게 따라잡음)
+        source_session_id = safe_session_watermark()
+
+        if period in PERIOD_ROLLUPS:
+            rollup_model, _ = PERIOD_ROLLUPS[period]
+            sql = ROLLUP_RANKING_SQL.format(
+                table=TypingSession._meta.db_table, rollup_table=rollup_model._meta.db_table
+            )
+            params = {
+                'period_start': start_date,
+                'range_start': range_start,
+                'range_end': range_end,
+                'source_session_id': source_session_id,
+                'exclude_score': settings.ANTICHEAT_EXCLUDE_SCORE,
+                'min_sessions': min_sessions,
+                'modes': tuple(LEADERBOARD_MODES),
+            }
+        else:
+            sql = RANKING_SQL.format(table=TypingSession._meta.db_table)
+            params = [
+                source_session_id, range_start, range_end, settings.ANTICHEAT_EXCLUDE_SCORE,
+                min_sessions, tuple(LEADERBOARD_MODES),
+            ]
+
+        snapshots = {}
+        for mode in LEADERBOARD_MODES:
+            for language in LEADERBOARD_LANGUAGES:
+                snapshots[(mode, language)] = Snapshot.objects.create(
+                    period=period,
+                    start_date=start_date,
+                    end_date=end_date,
+                    mode=mode,
+                    language=language,
+                    is_active=False,
+                    source_session_id=source_session_id,
+                    min_sessions=min_sessions,
+                )
+
+        counts = {key: 0 for key in snapshots}
+        scores = {key: [] for key in snapshots}
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            while True:
+                rows = cursor.fetchmany(ENTRY_BATCH_SIZE)
+                if not rows:
+                    break
+
+                entries = []
+                for (mode, language, user_id, rank, score_wpm, score_accuracy,
+                     session_count, best_wpm, total_duration_ms) in rows:
+                    entries.append(Entry(
+                        snapshot=snapshots[(mode, language)],
+                        user_id=user_id,
+                        rank=rank,
+                        score_wpm=score_wpm,
+                        score_accuracy=score_accuracy,
+                        session_count=session_count,
+                        best_wpm=best_wpm,
+                        total_duration_ms=total_duration_ms,
+                    ))
+                    counts[(mode, language)] += 1
+                    scores[(mode, language)].append(float(score_wpm))
+
+                Entry.objects.bulk_create(entries, batch_size=ENTRY_BATCH_SIZE)
+
+        for key, snapshot in snapshots.items():
+            snapshot.entry_count = counts[key]
+            snapshot.score_distribution = pack_score_distribution(scores[key])
+            render_snapshot_payload(snapshot)
+
+    publish_snapshots(snapshots.values())
+    return counts
+
+
+def render_snapshot_payload(snapshot):
+    """
+    스냅샷 상세 응답 사전 렌더링
+
+    상위 N명 엔트리를 포함한 상세 응답을 생성 시점에 한 번만 직렬화해 저장한다.
+    latest/retrieve는 저장된 바이트를 그대로 ETag와 함께 내려준다.
+    """
+    payload = JSONRenderer().render(SnapshotDetailSerializer(snapshot).data)
+    snapshot.payload = payload.decode('utf-8')
+    snapshot.payload_etag = hashlib.sha1(payload).hexdigest()
+    snapshot.save(update_fields=[
+        'entry_count', 'score_distribution', 'payload', 'payload_etag', 'updated_at'
+    ])
+
+
+def pack_score_distribution(scores):
+    """score_wpm 목록을 오름차순 float64 배열 바이트로 변환"""
+    return array('d', sorted(scores)).tobytes()
+
+
+@lru_cache(maxsize=128)
+def load_score_distribution(snapshot_id):
+    """스냅샷 점수 분포 로드 (게시된 스냅샷은 불변이므로 ID 기준 캐시)"""
+    data = Snapshot.objects.filter(pk=snapshot_id).values_list('score_distribution', flat=True).first()
+    distribution = array('d')
+    if data:
+        distribution.frombytes(bytes(data))
+    return distribution
+
+
+def score_percentile(snapshot_id, score_wpm):
+    """
+    스냅샷에 없는 점수의 상위 백분위
+
+    점수 분포에서 이진 탐색으로 자신보다 높은 점수 수를 구해
+    가상 순위 / (엔트리 수 + 1)로 계산한다. 분포가 없으면 None.
+    """
+    distribution = load_score_distribution(snapshot_id)
+    if not distribution:
+        return None
+    higher = len(distribution) - bisect_right(distribution, float(score_wpm))
+    return round((higher + 1) / (len(distribution) + 1) * 100, 2)
+
+
+def publish_snapshots(snapshots):
+    """
+    스테이징 스냅샷 게시
+
+    같은 기간/모드/언어의 기존 활성 세대를 비활성화하고 새 세대를 활성화하는
+    작업을 한 트랜잭션으로 처리한다. 동시에 두 빌드가 게시하면
+    uq_snapshot_period_active 제약으로 나중 쪽이 롤백된다.
+    """
+    snapshots = list(snapshots)
+    now = timezone.now()
+
+    with transaction.atomic():
+        for snapshot in snapshots:
+            Snapshot.objects.filter(
+                period=snapshot.period,
+                start_date=snapshot.start_date,
+                end_date=snapshot.end_date,
+                mode=snapshot.mode,
+                language=snapshot.language,
+                is_active=True,
+            ).exclude(pk=snapshot.pk).update(is_active=False, retired_at=now)
+
+        Snapshot.objects.filter(
+            pk__in=[snapshot.pk for snapshot in snapshots]
+        ).update(is_active=True, retired_at=None)
+
+    for snapshot in snapshots:
+        snapshot.is_active = True
+        snapshot.retired_at = None
+
+
+def prune_snapshots(grace=None, batch_size=ENTRY_BATCH_SIZE):
+    """
+    유예 기간이 지난 비활성 스냅샷 정리
+
+    교체된 세대(retired_at 기준)와 게시되지 못한 스테이징 잔여물(generated_at 기준)을
+    대상으로, 엔트리를 batch_size 단위로 나눠 삭제해 긴 잠금을 피한다.
+    반환값: 삭제된 스냅샷 수
+    """
+    if grace is None:
+        grace = timedelta(minutes=settings.LEADERBOARD_SNAPSHOT_GRACE_MINUTES)
+    cutoff = timezone.now() - grace
+
+    expired_ids = list(
+        Snapshot.objects.filter(is_active=False).filter(
+            Q(retired_at__lt=cutoff) | Q(retired_at__isnull=True, generated_at__lt=cutoff)
+        ).values_list('id', flat=True)
+    )
+
+    for snapshot_id in expired_ids:
+        while True:
+            entry_ids = list(
+                Entry.objects.filter(snapshot_id=snapshot_id).values_list('id', flat=True)[:batch_size]
+            )
+            if not entry_ids:
+                break
+            Entry.objects.filter(id__in=entry_ids).delete()
+
+        Snapshot.objects.filter(id=snapshot_id, is_active=False).delete()
+
+    return len(expired_ids)
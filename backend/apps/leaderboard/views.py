@@ -1,8 +1,21 @@
 from rest_framework import viewsets, permissions, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
+from django.conf import settings
+from django.db.models import Avg, Count, Q
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils.http import parse_etags
+from apps.sessions.models import TypingSession
 from .models import Snapshot, Entry
 from .serializers import SnapshotSerializer, SnapshotDetailSerializer, EntrySerializer, MyRankSerializer
+from .live import get_live_index, live_user_rank
+from .services import (
+    LEADERBOARD_LANGUAGES,
+    LEADERBOARD_MODES,
+    get_period_datetimes,
+    render_snapshot_payload,
+    score_percentile,
+)
 
 
 class SnapshotViewSet(viewsets.ReadOnlyModelViewSet):
@@ -10,7 +23,7 @@ class SnapshotViewSet(viewsets.ReadOnlyModelViewSet):
     permission_classes = [permissions.AllowAny]
     
     def get_queryset(self):
-        queryset = Snapshot.objects.filter(is_active=True)
+        queryset = Snapshot.objects.filter(is_active=True).defer('score_distribution')
         
         period = self.request.query_params.get('period')
         language = self.request.query_params.get('language')
@@ -30,21 +43,67 @@ class SnapshotViewSet(viewsets.ReadOnlyModelViewSet):
             return SnapshotDetailSerializer
         return SnapshotSerializer
     
+    def _payload_response(self, request, snapshot):
+        """사전 렌더링된 상세 응답을 그대로 반환 (ETag 일치 시 304)"""
+        if not snapshot.payload:
+            # 사전 렌더링 이전에 생성된 스냅샷은 최초 조회 시 한 번 렌더링
+            render_snapshot_payload(snapshot)
+        
+        etag = f'"{snapshot.payload_etag}"'
+        # If-None-Match는 약한 비교 (W/ 접두사 무시), '*'는 모든 표현과 일치
+        client_etags = parse_etags(request.headers.get('If-None-Match', ''))
+        if '*' in client_etags or etag in (tag.removeprefix('W/') for tag in client_etags):
+            response = HttpResponseNotModified()
+        else:
+            response = HttpResponse(snapshot.payload, content_type='application/json')
+        response['ETag'] = etag
+        return response
+    
+    def retrieve(self, request, *args, **kwargs):
+        return self._payload_response(request, self.get_object())
+    
     @action(detail=False, methods=['get'])
     def latest(self, request):
         """최신 랭킹 조회"""
         period = request.query_params.get('period', 'weekly')
         language = request.query_params.get('language', 'all')
+        mode = request.query_params.get('mode', 'all')
         
         snapshot = self.get_queryset().filter(
-            period=period    
-        ).first()
+            period=period,
+            language=language,
+            mode=mode,
+        ).order_by('-start_date', '-generated_at').first()
         
         if not snapshot:
             return Response({'detail': '랭킹이 아직 생성되지 않았습니다.'}, status=404)
         
-        serializer = SnapshotDetailSerializer(snapshot)
-        return Response(serializer.data)
+        return self._payload_response(request, snapshot)
+    
+    def _my_period_score(self, user, snapshot):
+        """
+        스냅샷 기간 내 사용자 평균 WPM (idx_session_user_started 사용)
+
+        랭킹 집계(RANKING_SQL)와 같은 기준으로 의심 세션을 빼고 스냅샷 워터마크 이하만 보며,
+        세션 수가 스냅샷의 최소 세션 수에 못 미치면 랭킹 대상이 아니므로 None.
+        """
+        range_start, range_end = get_period_datetimes(snapshot.start_date, snapshot.end_date)
+        sessions = TypingSession.objects.filter(
+            Q(suspicion_score__isnull=True) | Q(suspicion_score__lt=settings.ANTICHEAT_EXCLUDE_SCORE),
+            user=user,
+            started_at__gte=range_start,
+            started_at__lt=range_end,
+        )
+        if snapshot.source_session_id is not None:
+            sessions = sessions.filter(id__lte=snapshot.source_session_id)
+        if snapshot.mode != 'all':
+            sessions = sessions.filter(mode=snapshot.mode)
+        if snapshot.language != 'all':
+            sessions = sessions.filter(language=snapshot.language)
+        result = sessions.aggregate(score=Avg('wpm'), count=Count('id'))
+        if result['count'] < max(snapshot.min_sessions, 1):
+            return None
+        return result['score']
     
     @action(detail=False, methods=['get'])
     def me(self, request):
@@ -54,27 +113,71 @@ class SnapshotViewSet(viewsets.ReadOnlyModelViewSet):
         
         period = request.query_params.get('period', 'weekly')
         language = request.query_params.get('language', 'all')
+        mode = request.query_params.get('mode', 'all')
         
-        snapshot = self.get_queryset().filter(period=period).first()
+        snapshot = self.get_queryset().filter(
+            period=period,
+            language=language,
+            mode=mode,
+        ).order_by('-start_date', '-generated_at').first()
         
         if not snapshot:
             return Response({'detail': '랭킹이 아직 생성되지 않았습니다.'}, status=404)
         
         # 내 엔트리 찾기
-        my_entry = snapshot.entries.filter(user=request.user).first()
+        my_entry = snapshot.entries.select_related('user').filter(user=request.user).first()
         
         # 근처 랭커 (내 순위 ±2)
         neighbors = []
+        percentile = None
         if my_entry:
-            neighbors = snapshot.entries.filter(
+            neighbors = snapshot.entries.select_related('user').filter(
                 rank__gte=max(1, my_entry.rank - 2),
                 rank__lte=my_entry.rank + 2
             ).exclude(user=request.user)
+            percentile = round(my_entry.rank / snapshot.entry_count * 100, 2)
+        else:
+            # 스냅샷 밖 사용자는 기간 내 내 평균 WPM을 점수 분포에서 이진 탐색
+            my_score = self._my_period_score(request.user, snapshot)
+            if my_score is not None:
+                percentile = score_percentile(snapshot.id, my_score)
         
         data = {
             'snapshot': SnapshotSerializer(snapshot).data,
             'my_entry': EntrySerializer(my_entry).data if my_entry else None,
             'neighbors': EntrySerializer(neighbors, many=True).data,
+            'percentile': percentile,
+        }
+        
+        return Response(data)
+    
+    @action(detail=False, methods=['get'])
+    def live(self, request):
+        """실시간 내 순위 조회 (스냅샷 이후 세션까지 반영)"""
+        if not request.user.is_authenticated:
+            return Response({'detail': '로그인이 필요합니다.'}, status=401)
+        
+        period = request.query_params.get('period', 'weekly')
+        language = request.query_params.get('language', 'all')
+        mode = request.query_params.get('mode', 'all')
+        
+        if period not in dict(Snapshot.PERIOD_CHOICES):
+            return Response({'detail': '지원하지 않는 기간입니다.'}, status=400)
+        # 조합마다 프로세스 내 인덱스가 생기므로 허용된 값만 받음
+        if mode not in LEADERBOARD_MODES:
+            return Response({'detail': '지원하지 않는 모드입니다.'}, status=400)
+        if language not in LEADERBOARD_LANGUAGES:
+            return Response({'detail': '지원하지 않는 언어입니다.'}, status=400)
+        
+        index = get_live_index(period, mode, language)
+        
+        data = {
+            'period': period,
+            'start_date': index.start_date,
+            'end_date': index.end_date,
+            'mode': mode,
+            'language': language,
+            **live_user_rank(index, request.user.id),
         }
         
         return Response(data)
@@ -87,9 +190,12 @@ class EntryViewSet(viewsets.ReadOnlyModelViewSet):
     
     def get_queryset(self):
         snapshot_id = self.request.query_params.get('snapshot')
-        queryset = Entry.objects.all()
+        # 스테이징 중인 스냅샷은 숨기고, 교체된 세대는 유예 기간 동안 계속 조회 허용
+        queryset = Entry.objects.filter(
+            Q(snapshot__is_active=True) | Q(snapshot__retired_at__isnull=False)
+        )
         
         if snapshot_id:
             queryset = queryset.filter(snapshot_id=snapshot_id)
         
-        return queryset.order_by('rank')[:100]  # 상위 100명만
+        return queryset.select_related('user').order_by('rank')
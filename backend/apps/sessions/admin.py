@@ -1,22 +1,29 @@
 from django.contrib import admin
-from .models import TypingSession, TypingEvent
+from .models import TypingSession, TypingEvent, TypingEventBlob, SessionOutbox, ClientSessionKey, SessionArchive, SessionText, SessionDimension
 
 
 @admin.register(TypingSession)
 class TypingSessionAdmin(admin.ModelAdmin):
-    list_display = ['id', 'user', 'mode', 'language', 'wpm', 'accuracy', 'duration_ms', 'started_at']
-    list_filter = ['mode', 'language', 'started_at']
-    search_fields = ['user__username', 'text_content', 'guest_session_id']
+    list_display = [
+        'id', 'user', 'mode', 'language', 'wpm', 'accuracy', 'duration_ms',
+        'score_status', 'suspicion_score', 'started_at'
+    ]
+    list_filter = ['mode', 'language', 'score_status', 'started_at']
+    search_fields = ['user__username', 'text__content', 'guest_session_id']
     ordering = ['-started_at']
-    readonly_fields = ['created_at', 'updated_at']
+    readonly_fields = [
+        'text_content', 'screened_at', 'created_at', 'updated_at',
+        'meta_submode', 'meta_time_limit_sec', 'meta_device', 'meta_browser', 'meta_keyboard_layout'
+    ]
+    raw_id_fields = ['text']
     date_hierarchy = 'started_at'
     
     fieldsets = (
         ('사용자 정보', {
-            'fields': ('user', 'guest_session_id')
+            'fields': ('user', 'guest_session_id', 'client_session_id')
         }),
         ('연습 정보', {
-            'fields': ('pack', 'text_item', 'text_content', 'mode', 'language')
+            'fields': ('pack', 'text_item', 'text', 'text_content', 'mode', 'language')
         }),
         ('시간', {
             'fields': ('started_at', 'ended_at', 'duration_ms')
@@ -24,8 +31,14 @@ class TypingSessionAdmin(admin.ModelAdmin):
         ('결과', {
             'fields': ('input_length', 'correct_length', 'error_count', 'accuracy', 'wpm', 'cpm')
         }),
+        ('서버 검증', {
+            'fields': ('score_status', 'score_check', 'suspicion_score', 'suspicion_reasons', 'screened_at')
+        }),
         ('확장', {
-            'fields': ('metadata',),
+            'fields': (
+                'metadata', 'meta_submode', 'meta_time_limit_sec',
+                'meta_device', 'meta_browser', 'meta_keyboard_layout'
+            ),
             'classes': ('collapse',)
         }),
         ('메타 정보', {
@@ -40,3 +53,56 @@ class TypingEventAdmin(admin.ModelAdmin):
     list_filter = ['is_correct']
     search_fields = ['session__id']
     ordering = ['session', 't_ms']
+
+
+@admin.register(TypingEventBlob)
+class TypingEventBlobAdmin(admin.ModelAdmin):
+    list_display = ['session', 'event_count', 'format_version', 'created_at']
+    search_fields = ['session__id']
+    ordering = ['-created_at']
+    raw_id_fields = ['session']
+    exclude = ['data']
+
+
+@admin.register(SessionOutbox)
+class SessionOutboxAdmin(admin.ModelAdmin):
+    list_display = ['id', 'session', 'attempts', 'available_at', 'processed_at', 'created_at']
+    list_filter = ['processed_at']
+    search_fields = ['session__id', 'last_error']
+    ordering = ['-id']
+    raw_id_fields = ['session']
+
+
+@admin.register(ClientSessionKey)
+class ClientSessionKeyAdmin(admin.ModelAdmin):
+    list_display = ['client_session_id', 'session', 'created_at']
+    search_fields = ['client_session_id', 'session__id']
+    ordering = ['-created_at']
+    raw_id_fields = ['session']
+
+
+@admin.register(SessionArchive)
+class SessionArchiveAdmin(admin.ModelAdmin):
+    list_display = ['user', 'month', 'session_count', 'byte_size', 'first_started_at', 'last_started_at', 'created_at']
+    list_filter = ['month']
+    search_fields = ['user__username', 'path']
+    ordering = ['-created_at']
+    raw_id_fields = ['user']
+    readonly_fields = ['path', 'checksum', 'created_at']
+
+
+@admin.register(SessionText)
+class SessionTextAdmin(admin.ModelAdmin):
+    list_display = ['id', '__str__', 'content_hash', 'created_at']
+    search_fields = ['content', 'content_hash']
+    ordering = ['-id']
+    readonly_fields = ['content_hash', 'content', 'created_at']
+
+
+@admin.register(SessionDimension)
+class SessionDimensionAdmin(admin.ModelAdmin):
+    list_display = ['id', 'kind', 'value', 'created_at']
+    list_filter = ['kind']
+    search_fields = ['value']
+    ordering = ['kind', 'value']
+    readonly_fields = ['created_at']
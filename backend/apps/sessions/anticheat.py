@@ -0,0 +1,207 @@
+"""
+sessions 부정행위 탐지 - 세션/키 입력 통계 기반 의심 점수
+
+세션을 chunk_size 단위로 읽어 묶음마다 이벤트 배열을 하나로 이어 붙이고,
+세션 번호 배열 + bincount로 세션별 통계를 한 번에 계산한다.
+메모리는 묶음 크기에만 비례하므로 하루치 세션도 일정한 메모리로 처리한다.
+
+신호 (가중치 합을 1로 잘라 suspicion_score로 기록):
+- impossible_speed: 입력 길이/시간 대비 사람이 낼 수 없는 속도 (언어별 상한: 한글 타수, 영문 WPM/타수)
+- invalid_duration: 입력이 있는데 소요 시간이 0 이하 (속도를 계산할 수 없는 잘못된 입력)
+- paste_burst: 간격 BURST_INTERVAL_MS 미만 연속 입력, 한 이벤트에 여러 글자 입력 비율
+- robotic_rhythm: 입력 간격 변동계수(표준편차/평균)가 지나치게 낮음
+- score_mismatch: 서버 점수 재계산(score_status)과 제출값 불일치
+"""
+import json
+from decimal import Decimal
+
+import numpy as np
+from django.conf import settings
+from django.db import connection
+from django.utils import timezone
+from psycopg2.extras import execute_values
+
+from apps.texts.hangul import keystroke_counts
+from .event_store import load_event_arrays
+from .models import TypingSession
+
+
+SIGNAL_WEIGHTS = {
+    'impossible_speed': 1.0,
+    'invalid_duration': 1.0,
+    'paste_burst': 0.8,
+    'robotic_rhythm': 0.6,
+    'score_mismatch': 0.4,
+}
+
+# 언어별 속도 상한 (kpm: 분당 타수, wpm: 분당 단어 수, None이면 검사하지 않음)
+# 한글은 2벌식 타수로만 판단하고 (어절 길이가 문장마다 달라 WPM 척도가 맞지 않음),
+# 영문은 WPM과 분당 타자 수(글자당 1타, 250 WPM × 평균 5타 + 여유)를 함께 본다.
+SPEED_LIMITS = {
+    'ko': {'kpm': 1800, 'wpm': None},
+    'en': {'kpm': 1500, 'wpm': 250},
+}
+
+BURST_INTERVAL_MS = 10
+PASTE_RATIO = 0.2
+
+MIN_INTERVALS = 20
+MIN_INTERVAL_CV = 0.15
+MAX_INTERVAL_MS = 2000
+
+CHUNK_SIZE = 1000
+
+SESSION_FIELDS = [
+    'id', 'text__content', 'legacy_text_content', 'language', 'input_length', 'duration_ms', 'wpm', 'score_status',
+]
+
+
+def _speed_limits(sessions, unit):
+    """세션별 언어 상한 배열 (검사하지 않는 단위는 inf)"""
+    limits = [SPEED_LIMITS.get(session.language, SPEED_LIMITS['en'])[unit] for session in sessions]
+    return np.array([np.inf if limit is None else limit for limit in limits], dtype=np.float64)
+
+
+def _session_signals(sessions):
+    """세션 값만으로 판단하는 신호 (언어별 속도 상한, 소요 시간 오류, 점수 불일치)"""
+    typed_texts = [session.text_content[:session.input_length] for session in sessions]
+    keystrokes = np.asarray(keystroke_counts(typed_texts), dtype=np.float64)
+    duration = np.array([session.duration_ms or 0 for session in sessions], dtype=np.float64)
+    wpm = np.array([float(session.wpm or 0) for session in sessions])
+
+    # 소요 시간이 0 이하면 속도를 계산하지 않고 잘못된 입력으로 따로 표시
+    valid = duration > 0
+    invalid_duration = ~valid & (keystrokes > 0)
+    kpm = np.divide(keystrokes * 60000, duration, out=np.full(len(sessions), np.nan), where=valid)
+    kpm[keystrokes == 0] = 0
+    impossible = valid & (
+        (kpm > _speed_limits(sessions, 'kpm')) | (wpm > _speed_limits(sessions, 'wpm'))
+    )
+    mismatch = np.array([session.score_status == 'flagged' for session in sessions])
+    return kpm, impossible, invalid_duration, mismatch
+
+
+def _event_signals(arrays_list):
+    """
+    세션별 이벤트 배열 목록 → (간격 수, 변동계수, 붙여넣기 비율) 배열
+
+    이벤트가 없는 세션은 간격 수 0, 비율 0
+    """
+    size = len(arrays_list)
+    lengths = np.array([len(arrays['t_ms']) if arrays is not None else 0 for arrays in arrays_list])
+    present = [arrays for arrays in arrays_list if arrays is not None]
+    if not lengths.sum():
+        return np.zeros(size, dtype=np.int64), np.full(size, np.nan), np.zeros(size)
+
+    segment = np.repeat(np.arange(size), lengths)
+    t_ms = np.concatenate([arrays['t_ms'] for arrays in present])
+    typed_len = np.concatenate([arrays['typed_len'] for arrays in present])
+
+    # 같은 세션 안의 연속 이벤트 간격만 사용
+    same = segment[1:] == segment[:-1]
+    interval = np.diff(t_ms).astype(np.float64)[same]
+    interval_segment = segment[1:][same]
+
+    burst = np.bincount(interval_segment, weights=interval < BURST_INTERVAL_MS, minlength=size)
+    multi_char = np.bincount(segment, weights=np.maximum(typed_len - 1, 0), minlength=size)
+    paste_ratio = np.divide(burst + multi_char, lengths, out=np.zeros(size), where=lengths > 0)
+
+    # 쉬는 시간(MAX_INTERVAL_MS 초과)은 리듬 통계에서 제외
+    rhythm = (interval > 0) & (interval <= MAX_INTERVAL_MS)
+    rhythm_segment = interval_segment[rhythm]
+    interval = interval[rhythm]
+    counts = np.bincount(rhythm_segment, minlength=size)
+    sums = np.bincount(rhythm_segment, weights=interval, minlength=size)
+    squares = np.bincount(rhythm_segment, weights=interval * interval, minlength=size)
+    means = np.divide(sums, counts, out=np.zeros(size), where=counts > 0)
+    variance = np.maximum(np.divide(squares, counts, out=np.zeros(size), where=counts > 0) - means * means, 0)
+    cv = np.divide(np.sqrt(variance), means, out=np.full(size, np.nan), where=means > 0)
+
+    return counts, cv, paste_ratio
+
+
+def score_sessions(sessions, event_arrays):
+    """
+    세션 묶음 의심 점수 계산
+    반환값: [(session_id, 점수, 근거 dict)]
+    """
+    if not sessions:
+        return []
+    kpm, impossible, invalid_duration, mismatch = _session_signals(sessions)
+    counts, cv, paste_ratio = _event_signals([event_arrays.get(session.id) for session in sessions])
+
+    robotic = (counts >= MIN_INTERVALS) & (cv < MIN_INTERVAL_CV)
+    pasted = paste_ratio >= PASTE_RATIO
+
+    signals = {
+        'impossible_speed': impossible,
+        'invalid_duration': invalid_duration,
+        'paste_burst': pasted,
+        'robotic_rhythm': robotic,
+        'score_mismatch': mismatch,
+    }
+    scores = np.minimum(sum(mask * SIGNAL_WEIGHTS[name] for name, mask in signals.items()), 1.0)
+
+    results = []
+    for index, session in enumerate(sessions):
+        reasons = {
+            'signals': [name for name, mask in signals.items() if mask[index]],
+            'kpm': round(float(kpm[index]), 1) if np.isfinite(kpm[index]) else None,
+            'paste_ratio': round(float(paste_ratio[index]), 3),
+            'interval_cv': round(float(cv[index]), 3) if np.isfinite(cv[index]) else None,
+        }
+        results.append((session.id, round(float(scores[index]), 3), reasons))
+    return results
+
+
+def save_suspicion(results, screened_at=None):
+    """(session_id, 점수, 근거) 목록을 UPDATE ... FROM (VALUES ...) 한 번으로 기록"""
+    if not results:
+        return
+    screened_at = screened_at or timezone.now()
+    table = TypingSession._meta.db_table
+    sql = (
+        f'UPDATE {table} AS t SET suspicion_score = v.score, '
+        f'suspicion_reasons = v.reasons, screened_at = v.screened_at '
+        f'FROM (VALUES %s) AS v (id, score, reasons, screened_at) WHERE t.id = v.id'
+    )
+    template = '(%s, %s::numeric(4, 3), %s::jsonb, %s::timestamptz)'
+    values = [
+        (session_id, Decimal(str(score)), json.dumps(reasons), screened_at)
+        for session_id, score, reasons in results
+    ]
+    with connection.cursor() as cursor:
+        execute_values(cursor.cursor, sql, values, template=template, page_size=len(values))
+
+
+def screen_sessions(start, end, chunk_size=CHUNK_SIZE, rescreen=False):
+    """
+    [start, end) 기간 세션을 묶음 단위로 검사해 의심 점수 기록
+    반환값: (검사 수, 점수 구간별 수 {'clean', 'suspicious', 'excluded'})
+    """
+    queryset = TypingSession.objects.filter(started_at__gte=start, started_at__lt=end)
+    if not rescreen:
+        queryset = queryset.filter(screened_at__isnull=True)
+
+    threshold = settings.ANTICHEAT_EXCLUDE_SCORE
+    totals = {'clean': 0, 'suspicious': 0, 'excluded': 0}
+    screened = 0
+    last_id = 0
+    while True:
+        sessions = list(queryset.filter(id__gt=last_id).order_by('id').select_related('text').only(*SESSION_FIELDS)[:chunk_size])
+        if not sessions:
+            break
+        last_id = sessions[-1].id
+
+        results = score_sessions(sessions, load_event_arrays([session.id for session in sessions]))
+        save_suspicion(results)
+
+        screened += len(results)
+        for _, score, _ in results:
+            if score >= threshold:
+                totals['excluded'] += 1
+            elif score > 0:
+                totals['suspicious'] += 1
+            else:
+                totals['clean'] += 1
+    return screened, totals
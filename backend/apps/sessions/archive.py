@@ -0,0 +1,286 @@
+"""
+sessions 보관 - 오래된 세션을 (사용자, 월) 단위 압축 파일로 옮기고 기록 조회 시 이어 읽기
+
+- archive_sessions: settings.SESSION_HOT_DAYS보다 오래된 로그인 사용자 세션을
+  gzip NDJSON 파일(session_archive 스토리지)로 스트리밍해 쓰고 SessionArchive에 기록한 뒤,
+  같은 트랜잭션에서 세션과 이벤트/블롭/아웃박스/클라이언트 키 행을 묶음 단위로 지운다.
+- SessionArchiveReader: 커서 페이지네이션이 보관 구간에 닿으면 SessionArchive 목록으로
+  필요한 파일만 열어 저장되지 않은 TypingSession 인스턴스로 돌려준다.
+
+파일 한 줄은 세션 한 건 (concrete 필드 attname → 값, 문장은 text_content, 이벤트는 packed 블롭 base64)이며
+(started_at, id) 내림차순으로 쓴다. 게스트 세션은 보관하지 않는다 (파티션 보존 기간으로 정리).
+누적 통계/일일 통계/개인 최고 기록은 그대로 남는다. 따라서 필터 없는 세션 통계(누적 통계)는
+보관 세션을 포함하지만, 언어/모드 등 필터 통계는 세션 테이블만 집계하므로 보관 세션이 빠진다.
+"""
+import base64
+import gzip
+import hashlib
+import io
+import json
+import tempfile
+import uuid
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from itertools import islice
+
+from django.conf import settings
+from django.core.files import File
+from django.core.files.storage import storages
+from django.db import connection, transaction
+from django.db.models import Count, DateField, Exists, OuterRef
+from django.db.models.functions import TruncMonth
+from django.utils import timezone
+
+from apps.stats.models import PersonalBest
+from .eventpack import FORMAT_VERSION, encode_events
+from .metadata import matches as metadata_matches
+from .models import (
+    ClientSessionKey, SessionArchive, SessionOutbox, TypingEvent, TypingEventBlob, TypingSession,
+)
+from .partitions import month_bounds
+
+
+ARCHIVE_STORAGE = 'session_archive'
+CHUNK_SIZE = 1000
+DELETE_BATCH_SIZE = 1000
+
+
+def _storage():
+    return storages[ARCHIVE_STORAGE]
+
+
+def _fields():
+    return {field.attname: field for field in TypingSession._meta.concrete_fields}
+
+
+def _json_default(value):
+    # DjangoJSONEncoder는 마이크로초를 잘라 커서 키가 달라지므로 isoformat 그대로 사용
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (Decimal, uuid.UUID)):
+        return str(value)
+    raise TypeError(f'{type(value).__name__}은 JSON으로 저장할 수 없습니다.')
+
+
+def session_key(session):
+    """커서 정렬 키 (started_at, id)"""
+    return session.started_at, session.id
+
+
+def archive_cutoff(days=None, today=None):
+    """이 시각 이전에 시작한 세션이 보관 대상 (Asia/Seoul 자정 기준)"""
+    days = settings.SESSION_HOT_DAYS if days is None else days
+    return timezone.make_aware(datetime.combine((today or timezone.localdate()) - timedelta(days=days), time.min))
+
+
+def archivable_sessions(cutoff):
+    """cutoff 이전 로그인 사용자 세션 중 아웃박스 후처리가 끝난 세션"""
+    pending = SessionOutbox.objects.filter(session_id=OuterRef('pk'), processed_at__isnull=True)
+    return TypingSession.objects.filter(started_at__lt=cutoff, user__isnull=False).filter(~Exists(pending))
+
+
+def archive_groups(cutoff, user_ids=None):
+    """보관할 (사용자, 월) 묶음 [{'user_id', 'month', 'count'}] (사용자/월 순)"""
+    queryset = archivable_sessions(cutoff)
+    if user_ids:
+        queryset = queryset.filter(user_id__in=user_ids)
+    return list(
+        queryset.annotate(month=TruncMonth('started_at', output_field=DateField()))
+        .values('user_id', 'month')
+        .annotate(count=Count('id'))
+        .order_by('user_id', 'month')
+    )
+
+
+def _packed_events(session_ids):
+    """세션별 packed 이벤트 {session_id: (format_version, event_count, data)} (행 저장분은 여기서 압축)"""
+    packed = {
+        session_id: (format_version, event_count, bytes(data))
+        for session_id, format_version, event_count, data in TypingEventBlob.objects.filter(
+            session_id__in=session_ids
+        ).values_list('session_id', 'format_version', 'event_count', 'data').iterator()
+    }
+    missing = [session_id for session_id in session_ids if session_id not in packed]
+    if missing:
+        rows = {}
+        for event in TypingEvent.objects.filter(session_id__in=missing).order_by('session_id', 't_ms', 'id').values(
+            'session_id', 't_ms', 'expected', 'typed', 'is_correct', 'position'
+        ).iterator():
+            rows.setdefault(event.pop('session_id'), []).append(event)
+        for session_id, events in rows.items():
+            packed[session_id] = (FORMAT_VERSION, len(events), encode_events(events))
+    return packed
+
+
+def encode_record(session, fields, events=None):
+    """세션 → NDJSON 한 줄 (bytes, 줄바꿈 포함)"""
+    record = {attname: getattr(session, attname) for attname in fields if attname != 'legacy_text_content'}
+    # 파일만으로 기록을 복원할 수 있도록 중복 제거 전 문장 그대로 저장
+    record['text_content'] = session.text_content
+    if events is not None:
+        format_version, event_count, data = events
+        record['events'] = {
+            'format_version': format_version,
+            'event_count': event_count,
+            'data': base64.b64encode(data).decode('ascii'),
+        }
+    return json.dumps(record, default=_json_default, ensure_ascii=False).encode('utf-8') + b'\n'
+
+
+def session_from_record(record, fields=None):
+    """보관 레코드 → 저장되지 않은 TypingSession (이벤트 제외)"""
+    fields = fields or _fields()
+    values = {
+        attname: field.to_python(record[attname])
+        for attname, field in fields.items() if attname in record
+    }
+    return TypingSession(text_content=record.get('text_content', ''), **values)
+
+
+def iter_archive_records(entry):
+    """보관 파일의 레코드 dict를 파일 순서((started_at, id) 내림차순)대로"""
+    with _storage().open(entry.path, 'rb') as raw:
+        with gzip.GzipFile(fileobj=raw, mode='rb') as compressed:
+            for line in io.TextIOWrapper(compressed, encoding='utf-8'):
+                if line.strip():
+                    yield json.loads(line)
+
+
+def _write_archive(queryset, output, chunk_size):
+    """
+    세션을 output 파일에 gzip NDJSON으로 스트리밍 (묶음마다 이벤트 한 번에 조회)
+    반환값: (세션 ID 목록, 가장 이른 started_at, 가장 늦은 started_at)
+    """
+    fields = _fields()
+    session_ids = []
+    first_started_at = last_started_at = None
+    sessions = queryset.select_related('text').order_by('-started_at', '-id').iterator(chunk_size=chunk_size)
+    with gzip.GzipFile(fileobj=output, mode='wb') as compressed:
+        while chunk := list(islice(sessions, chunk_size)):
+            events = _packed_events([session.id for session in chunk])
+            for session in chunk:
+                compressed.write(encode_record(session, fields, events.get(session.id)))
+                session_ids.append(session.id)
+            last_started_at = last_started_at or chunk[0].started_at
+            first_started_at = chunk[-1].started_at
+    return session_ids, first_started_at, last_started_at
+
+
+def _delete_sessions(session_ids, start, end):
+    """보관한 세션과 딸린 행 삭제 (DB FK가 없으므로 직접 정리, 최고 기록은 세션 연결만 해제)"""
+    quote = connection.ops.quote_name
+    with connection.cursor() as cursor:
+        for model in (TypingEvent, TypingEventBlob, SessionOutbox, ClientSessionKey):
+            cursor.execute(
+                f'DELETE FROM {quote(model._meta.db_table)} WHERE session_id = ANY(%s)',
+                [session_ids],
+            )
+        cursor.execute(
+            f'UPDATE {quote(PersonalBest._meta.db_table)} SET session_id = NULL WHERE session_id = ANY(%s)',
+            [session_ids],
+        )
+        # started_at 범위로 해당 월 파티션만 건드림
+        cursor.execute(
+            f'DELETE FROM {quote(TypingSession._meta.db_table)} '
+            f'WHERE id = ANY(%s) AND started_at >= %s AND started_at < %s',
+            [session_ids, start, end],
+        )
+
+
+def archive_group(user_id, month, cutoff, chunk_size=CHUNK_SIZE):
+    """
+    한 사용자의 한 달치 보관 대상 세션을 파일로 옮기고 세션 테이블에서 삭제
+    파일 저장 후 목록 기록과 삭제는 한 트랜잭션이라, 중간에 실패해도 세션이 양쪽에 겹치지 않는다
+    (실패하면 올린 파일을 지운다).
+    반환값: SessionArchive (대상이 없으면 None)
+    """
+    start, end = month_bounds(month)
+    end = min(end, cutoff)
+    queryset = archivable_sessions(cutoff).filter(user_id=user_id, started_at__gte=start, started_at__lt=end)
+
+    with tempfile.TemporaryFile() as output:
+        session_ids, first_started_at, last_started_at = _write_archive(queryset, output, chunk_size)
+        if not session_ids:
+            return None
+
+        output.seek(0)
+        digest = hashlib.sha256()
+        for block in iter(lambda: output.read(1 << 20), b''):
+            digest.update(block)
+        byte_size = output.tell()
+        output.seek(0)
+        path = _storage().save(f'{user_id}/{month:%Y%m}/{uuid.uuid4().hex}.ndjson.gz', File(output))
+
+    try:
+        with transaction.atomic():
+            archive = SessionArchive.objects.create(
+                user_id=user_id,
+                month=month,
+                path=path,
+                session_count=len(session_ids),
+                first_started_at=first_started_at,
+                last_started_at=last_started_at,
+                byte_size=byte_size,
+                checksum=digest.hexdigest(),
+            )
+            for index in range(0, len(session_ids), DELETE_BATCH_SIZE):
+                _delete_sessions(session_ids[index:index + DELETE_BATCH_SIZE], start, end)
+    except Exception:
+        # 목록 기록/삭제가 롤백되면 세션이 그대로 남으므로 방금 올린 파일은 지움
+        _storage().delete(path)
+        raise
+    return archive
+
+
+class SessionArchiveReader:
+    """
+    한 사용자의 보관 세션을 (started_at, id) 내림차순으로 읽기
+
+    SessionArchive의 started_at 범위로 필요한 파일만 열고, 파일 안에서도
+    정렬 순서를 따라 필요한 만큼만 읽는다.
+    """
+
+    def __init__(self, user_id, language=None, mode=None, metadata=None):
+        self.user_id = user_id
+        self.filters = {name: value for name, value in (('language', language), ('mode', mode)) if value}
+        # 보관 시점에 투영 열이 없었을 수 있으므로 metadata JSON에서 다시 추출해 비교
+        self.metadata_filters = metadata or {}
+        self.fields = _fields()
+
+    def _matches(self, session):
+        if self.metadata_filters and not metadata_matches(session.metadata, self.metadata_filters):
+            return False
+        return all(getattr(session, name) == value for name, value in self.filters.items())
+
+    def sessions(self, before=None, after=None, limit=20):
+        """
+        정렬 키가 before보다 작고 after보다 큰 보관 세션 최대 limit개 (내림차순)
+        before는 커서 위치, after는 세션 테이블 페이지에서 이미 limit개를 채운 마지막 키
+        """
+        entries = SessionArchive.objects.filter(user_id=self.user_id)
+        if before is not None:
+            entries = entries.filter(first_started_at__lte=before[0])
+        if after is not None:
+            entries = entries.filter(last_started_at__gte=after[0])
+
+        found = []
+        for entry in entries.order_by('-last_started_at', '-id'):
+            # 이미 limit개를 찾았고 이 파일이 모두 그보다 이전이면 더 볼 필요 없음
+            if len(found) >= limit and entry.last_started_at < found[-1].started_at:
+                break
+            taken = 0
+            for record in iter_archive_records(entry):
+                session = session_from_record(record, self.fields)
+                key = session_key(session)
+                if before is not None and key >= before:
+                    continue
+                if after is not None and key <= after:
+                    break
+                if not self._matches(session):
+                    continue
+                found.append(session)
+                taken += 1
+                if taken >= limit:
+                    break
+            found = sorted(found, key=session_key, reverse=True)[:limit]
+        return found
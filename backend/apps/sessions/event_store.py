@@ -0,0 +1,72 @@
+"""
+sessions 키 입력 이벤트 저장/조회
+
+settings.TYPING_EVENT_STORAGE에 따라 세션당 압축 블롭(packed) 또는
+이벤트당 행(rows)으로 저장하고, 조회는 저장 방식과 관계없이 같은 형태로 돌려준다.
+"""
+from django.conf import settings
+
+from .eventpack import FORMAT_VERSION, decode_arrays, encode_events, events_to_arrays
+from .models import TypingEvent, TypingEventBlob
+
+
+def build_event_blob(session, events):
+    return TypingEventBlob(
+        session=session,
+        format_version=FORMAT_VERSION,
+        event_count=len(events),
+        data=encode_events(events),
+    )
+
+
+def save_events(sessions_with_events):
+    """
+    [(세션, 이벤트 목록)] 저장 (세션은 저장된 상태여야 함)
+    반환값: 저장한 이벤트 수
+    """
+    storage = settings.TYPING_EVENT_STORAGE
+    pairs = [(session, events) for session, events in sessions_with_events if events]
+    if storage == 'off' or not pairs:
+        return 0
+
+    if storage == 'rows':
+        TypingEvent.objects.bulk_create(
+            [TypingEvent(session=session, **event) for session, events in pairs for event in events],
+            batch_size=1000,
+        )
+    else:
+        TypingEventBlob.objects.bulk_create([build_event_blob(session, events) for session, events in pairs])
+    return sum(len(events) for _, events in pairs)
+
+
+def load_events(session):
+    """세션 이벤트 dict 목록 (블롭 우선, 없으면 행)"""
+    blob = TypingEventBlob.objects.filter(session=session).first()
+    if blob is not None:
+        return blob.decode()
+    return list(
+        session.events.order_by('t_ms', 'id').values('t_ms', 'expected', 'typed', 'is_correct', 'position')
+    )
+
+
+def load_event_arrays(session_ids):
+    """
+    세션별 분석용 NumPy 열 배열 {session_id: arrays}
+    블롭이 없는 세션은 행 데이터로 같은 형태의 배열을 만들어 돌려준다.
+    """
+    arrays = {
+        session_id: decode_arrays(bytes(data))
+        for session_id, data in TypingEventBlob.objects.filter(
+            session_id__in=session_ids
+        ).values_list('session_id', 'data').iterator()
+    }
+    missing = [session_id for session_id in session_ids if session_id not in arrays]
+    if missing:
+        rows = {}
+        for event in TypingEvent.objects.filter(session_id__in=missing).order_by('session_id', 't_ms', 'id').values(
+            'session_id', 't_ms', 'expected', 'typed', 'is_correct', 'position'
+        ).iterator():
+            rows.setdefault(event.pop('session_id'), []).append(event)
+        for session_id, events in rows.items():
+            arrays[session_id] = events_to_arrays(events)
+    return arrays
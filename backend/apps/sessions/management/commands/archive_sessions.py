@@ -0,0 +1,51 @@
+"""
+오래된 세션 보관 커맨드 (매일 새벽 실행 권장)
+Usage: python manage.py archive_sessions [--days 90] [--user 1] [--chunk-size 1000] [--dry-run]
+
+SESSION_HOT_DAYS보다 오래된 로그인 사용자 세션을 (사용자, 월) 단위 gzip NDJSON 파일로 옮기고
+세션 테이블에서 삭제한다. 기록 목록 API는 보관 파일을 이어서 읽는다.
+"""
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from apps.sessions.archive import CHUNK_SIZE, archive_cutoff, archive_group, archive_groups
+
+
+class Command(BaseCommand):
+    help = '오래된 세션을 보관 파일로 옮기고 세션 테이블에서 삭제합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days', type=int, default=settings.SESSION_HOT_DAYS, help='세션 테이블에 남겨 둘 일 수'
+        )
+        parser.add_argument('--user', type=int, action='append', help='대상 사용자 ID (여러 번 지정 가능)')
+        parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE, help='한 번에 읽을 세션 수')
+        parser.add_argument('--dry-run', action='store_true', help='보관 대상만 출력')
+
+    def handle(self, *args, **options):
+        cutoff = archive_cutoff(options['days'])
+        groups = archive_groups(cutoff, options['user'])
+        total = sum(group['count'] for group in groups)
+
+        self.stdout.write(f'🗄️ 세션 보관 시작... ({cutoff:%Y-%m-%d} 이전, {len(groups)}개 묶음 / {total}개 세션)')
+        if options['dry_run']:
+            for group in groups:
+                self.stdout.write(f"     → 사용자 {group['user_id']} {group['month']:%Y-%m}: {group['count']}개")
+            return
+
+        started = time.monotonic()
+        files = sessions = byte_size = 0
+        for group in groups:
+            archive = archive_group(group['user_id'], group['month'], cutoff, chunk_size=options['chunk_size'])
+            if archive is None:
+                continue
+            files += 1
+            sessions += archive.session_count
+            byte_size += archive.byte_size
+            self.stdout.write(f'     → {archive.path} ({archive.session_count}개)')
+
+        elapsed = time.monotonic() - started
+        self.stdout.write(self.style.SUCCESS(
+            f'✅ 보관 완료! 파일 {files}개 / 세션 {sessions}개 / {byte_size / 1024:.1f}KB ({elapsed:.1f}s)'
+        ))
@@ -0,0 +1,29 @@
+"""
+세션 메타데이터 투영 열 백필 커맨드 (METADATA_PROJECTIONS 추가/변경 후 실행)
+Usage: python manage.py backfill_session_metadata [--chunk-size 1000]
+
+metadata가 있는 세션의 meta_* 열과 차원(SessionDimension) 연결을 다시 채운다.
+묶음마다 커밋하며, 다시 실행해도 같은 결과가 된다.
+"""
+import time
+
+from django.core.management.base import BaseCommand
+from apps.sessions.metadata import CHUNK_SIZE, PROJECTED_FIELDS, backfill_metadata
+
+
+class Command(BaseCommand):
+    help = '세션 metadata의 선언된 키를 타입 있는 열/차원 테이블로 다시 채웁니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE, help='한 번에 처리할 세션 수')
+
+    def handle(self, *args, **options):
+        self.stdout.write(f"🏷️ 메타데이터 투영 백필 시작... ({', '.join(PROJECTED_FIELDS)})")
+        started = time.monotonic()
+        total = 0
+        for count, last_id in backfill_metadata(chunk_size=options['chunk_size']):
+            total += count
+            self.stdout.write(f'     → {total}개 세션 처리 (마지막 ID {last_id})')
+
+        elapsed = time.monotonic() - started
+        self.stdout.write(self.style.SUCCESS(f'✅ 백필 완료! {total}개 세션 ({elapsed:.1f}s)'))
@@ -0,0 +1,32 @@
+"""
+세션 연습 문장 중복 제거 백필 커맨드 (SessionText 도입 후 한 번 실행)
+Usage: python manage.py backfill_session_texts [--chunk-size 1000]
+
+text_content 열에 문장이 남아 있는 세션을 내용 해시로 SessionText에 연결하고 열을 비운다.
+묶음마다 커밋하므로 중간에 멈춰도 다시 실행하면 남은 세션부터 이어서 처리한다.
+"""
+import time
+
+from django.core.management.base import BaseCommand
+from apps.sessions.models import SessionText
+from apps.sessions.text_store import CHUNK_SIZE, backfill_texts
+
+
+class Command(BaseCommand):
+    help = '세션의 연습 문장을 내용 해시 기준 SessionText로 옮겨 중복을 제거합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE, help='한 번에 옮길 세션 수')
+
+    def handle(self, *args, **options):
+        self.stdout.write('🧵 세션 문장 중복 제거 시작...')
+        started = time.monotonic()
+        moved = 0
+        for count in backfill_texts(chunk_size=options['chunk_size']):
+            moved += count
+            self.stdout.write(f'     → {moved}개 세션 처리')
+
+        elapsed = time.monotonic() - started
+        self.stdout.write(self.style.SUCCESS(
+            f'✅ 중복 제거 완료! {moved}개 세션 → 문장 {SessionText.objects.count()}개 ({elapsed:.1f}s)'
+        ))
@@ -0,0 +1,43 @@
+"""
+부정행위 의심 세션 탐지 커맨드 (랭킹 스냅샷 생성 전에 실행)
+Usage: python manage.py detect_cheating [--date 2026-01-30] [--days 1] [--chunk-size 1000] [--rescreen]
+"""
+import time
+from datetime import date, timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from apps.leaderboard.services import get_period_datetimes
+from apps.sessions.anticheat import CHUNK_SIZE, screen_sessions
+
+
+class Command(BaseCommand):
+    help = '기간 내 세션의 입력 통계를 검사해 부정행위 의심 점수를 기록합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--date', help='마지막 검사일 (YYYY-MM-DD, 기본: 오늘)')
+        parser.add_argument('--days', type=int, default=1, help='검사할 일 수 (마지막 검사일 포함)')
+        parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE, help='한 번에 읽을 세션 수')
+        parser.add_argument('--rescreen', action='store_true', help='이미 검사한 세션도 다시 검사')
+
+    def handle(self, *args, **options):
+        end_date = timezone.localdate()
+        if options['date']:
+            try:
+                end_date = date.fromisoformat(options['date'])
+            except ValueError:
+                raise CommandError(f"잘못된 날짜 형식입니다: {options['date']}")
+        start_date = end_date - timedelta(days=options['days'] - 1)
+        start, end = get_period_datetimes(start_date, end_date)
+
+        self.stdout.write(f'🕵️ 부정행위 탐지 시작... ({start_date} ~ {end_date})')
+        started = time.monotonic()
+        screened, totals = screen_sessions(
+            start, end, chunk_size=options['chunk_size'], rescreen=options['rescreen']
+        )
+        elapsed = time.monotonic() - started
+
+        self.stdout.write(f"     → 정상 {totals['clean']} / 의심 {totals['suspicious']} / "
+                          f"랭킹 제외(≥{settings.ANTICHEAT_EXCLUDE_SCORE}) {totals['excluded']}")
+        self.stdout.write(self.style.SUCCESS(f'✅ 탐지 완료! {screened}개 세션 검사 ({elapsed:.1f}s)'))
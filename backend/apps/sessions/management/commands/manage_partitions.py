@@ -0,0 +1,46 @@
+"""
+세션 테이블 월 파티션 관리 커맨드 (배포 시 실행, 미리 만들기는 run_worker가 매일 반복)
+Usage: python manage.py manage_partitions [--months-ahead 3] [--retain-months 24 [--drop]] [--dry-run]
+"""
+from django.core.management.base import BaseCommand, CommandError
+from apps.sessions.partitions import (
+    DEFAULT_MONTHS_AHEAD,
+    ensure_partitions,
+    expire_partitions,
+    expired_partitions,
+    list_partitions,
+)
+
+
+class Command(BaseCommand):
+    help = '세션 테이블의 앞으로 쓸 월 파티션을 만들고 보존 기간이 지난 파티션을 분리/삭제합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--months-ahead', type=int, default=DEFAULT_MONTHS_AHEAD, help='미리 만들 개월 수')
+        parser.add_argument('--retain-months', type=int, help='보존 개월 수 (이번 달 포함, 지정 시에만 만료 처리)')
+        parser.add_argument('--drop', action='store_true', help='만료 파티션을 분리 대신 삭제')
+        parser.add_argument('--dry-run', action='store_true', help='변경 없이 대상만 출력')
+
+    def handle(self, *args, **options):
+        retain_months = options['retain_months']
+        if retain_months is not None and retain_months < 1:
+            raise CommandError('--retain-months는 1 이상이어야 합니다.')
+
+        self.stdout.write('🗂️ 세션 파티션 관리 시작...')
+        if options['dry_run']:
+            self.stdout.write(f'     → 현재 파티션 {len(list_partitions())}개')
+            if retain_months is not None:
+                for _, name in expired_partitions(retain_months):
+                    self.stdout.write(f"     → 만료 대상: {name}")
+            return
+
+        created = ensure_partitions(options['months_ahead'])
+        for name in created:
+            self.stdout.write(f'  ✅ 생성: {name}')
+
+        if retain_months is not None:
+            action = '삭제' if options['drop'] else '분리'
+            for name in expire_partitions(retain_months, drop=options['drop']):
+                self.stdout.write(f'  🧹 {action}: {name}')
+
+        self.stdout.write(self.style.SUCCESS(f'✅ 파티션 관리 완료! (신규 {len(created)}개)'))
@@ -0,0 +1,61 @@
+"""
+TypingEvent 행 → 세션별 압축 블롭 일괄 변환 커맨드
+Usage: python manage.py pack_typing_events [--batch-size 500] [--delete-rows]
+"""
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from apps.sessions.event_store import build_event_blob
+from apps.sessions.models import TypingEvent, TypingEventBlob, TypingSession
+
+
+class Command(BaseCommand):
+    help = '이벤트당 1행으로 저장된 TypingEvent를 세션별 압축 블롭으로 변환합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500, help='한 번에 변환할 세션 수')
+        parser.add_argument('--delete-rows', action='store_true', help='변환한 세션의 이벤트 행 삭제')
+
+    def handle(self, *args, **options):
+        self.stdout.write('📦 타이핑 이벤트 압축 변환 시작...')
+        started = time.monotonic()
+        totals = {'sessions': 0, 'events': 0, 'bytes': 0}
+        last_session_id = 0
+
+        while True:
+            session_ids = list(
+                TypingEvent.objects.filter(
+                    session_id__gt=last_session_id,
+                    session__event_blob__isnull=True,
+                ).order_by('session_id').values_list('session_id', flat=True).distinct()[:options['batch_size']]
+            )
+            if not session_ids:
+                break
+            last_session_id = session_ids[-1]
+
+            events_by_session = {}
+            for event in TypingEvent.objects.filter(session_id__in=session_ids).order_by(
+                'session_id', 't_ms', 'id'
+            ).values('session_id', 't_ms', 'expected', 'typed', 'is_correct', 'position').iterator():
+                events_by_session.setdefault(event.pop('session_id'), []).append(event)
+
+            blobs = [
+                build_event_blob(TypingSession(id=session_id), events)
+                for session_id, events in events_by_session.items()
+            ]
+            with transaction.atomic():
+                TypingEventBlob.objects.bulk_create(blobs, ignore_conflicts=True)
+                if options['delete_rows']:
+                    TypingEvent.objects.filter(session_id__in=session_ids).delete()
+
+            totals['sessions'] += len(blobs)
+            totals['events'] += sum(blob.event_count for blob in blobs)
+            totals['bytes'] += sum(len(blob.data) for blob in blobs)
+            self.stdout.write(f"     → {totals['sessions']}개 세션, {totals['events']}개 이벤트 변환")
+
+        elapsed = time.monotonic() - started
+        self.stdout.write(self.style.SUCCESS(
+            f"✅ 변환 완료! {totals['sessions']}개 세션 / {totals['events']}개 이벤트 → "
+            f"{totals['bytes'] / 1024:,.1f}KB ({elapsed:.1f}s)"
+        ))
@@ -0,0 +1,57 @@
+"""
+저장된 이벤트로 세션 점수 서버 재계산 커맨드 (백필)
+Usage: python manage.py rescore_sessions [--batch-size 1000] [--all]
+
+배치마다 바뀐 점수로 일일/주간·월간/누적 통계와 개인 최고 기록을 다시 계산한다.
+보관된 세션이 있는 사용자는 누적 통계/최고 기록을 건너뛰므로 경고로 알린다.
+"""
+import time
+
+from django.core.management.base import BaseCommand
+from django.db.models import Exists, OuterRef, Q
+from apps.sessions.models import TypingEvent, TypingEventBlob, TypingSession
+from apps.sessions.scoring import rescore_sessions
+
+
+class Command(BaseCommand):
+    help = '이벤트가 저장된 세션의 wpm/정확도/cpm/오타 수를 서버에서 다시 계산합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000, help='한 번에 계산할 세션 수')
+        parser.add_argument('--all', action='store_true', help='이미 검증된 세션도 다시 계산')
+
+    def handle(self, *args, **options):
+        self.stdout.write('🧮 세션 점수 재계산 시작...')
+        started = time.monotonic()
+        # 조인 대신 EXISTS로 이벤트가 있는 세션만 (행이 불어나지 않아 DISTINCT 불필요)
+        queryset = TypingSession.objects.filter(
+            Q(Exists(TypingEventBlob.objects.filter(session_id=OuterRef('pk'))))
+            | Q(Exists(TypingEvent.objects.filter(session_id=OuterRef('pk'))))
+        ).select_related('text')
+        if not options['all']:
+            queryset = queryset.filter(score_status='unverified')
+
+        scored = flagged = 0
+        skipped_users = set()
+        last_id = 0
+        while True:
+            sessions = list(queryset.filter(id__gt=last_id).order_by('id')[:options['batch_size']])
+            if not sessions:
+                break
+            last_id = sessions[-1].id
+
+            batch_scored, batch_flagged, batch_skipped = rescore_sessions(sessions)
+            scored += batch_scored
+            flagged += batch_flagged
+            skipped_users |= batch_skipped
+            self.stdout.write(f'     → {scored}개 세션 계산 ({flagged}개 불일치)')
+
+        if skipped_users:
+            self.stdout.write(self.style.WARNING(
+                f'⚠️ 보관된 세션이 있는 사용자 {len(skipped_users)}명은 누적 통계/최고 기록을 다시 계산하지 않았습니다.'
+            ))
+
+        elapsed = time.monotonic() - started
+        self.stdout.write(self.style.SUCCESS(
+            f'✅ 재계산 완료! {scored}개 세션 중 {flagged}개 불일치 ({elapsed:.1f}s)'
+        ))
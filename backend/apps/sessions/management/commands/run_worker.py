@@ -0,0 +1,77 @@
+"""
+세션 후처리 워커
+Usage: python manage.py run_worker [--batch-size 100] [--once]
+
+여러 프로세스를 동시에 띄워도 안전하다 (SKIP LOCKED로 서로 다른 행을 가져감).
+시작할 때와 하루마다 앞으로 쓸 세션 월 파티션도 만든다 (manage_partitions와 같은 작업).
+파티션 생성이 실패해도 워커는 멈추지 않고 로그를 남긴 뒤 잠시 후 다시 시도한다.
+"""
+import logging
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+from apps.sessions.outbox import OUTBOX_BATCH_SIZE, process_batch, purge_processed
+from apps.sessions.partitions import ensure_partitions
+
+
+PURGE_INTERVAL_SECONDS = 3600
+PARTITION_INTERVAL_SECONDS = 86400
+PARTITION_RETRY_SECONDS = 600
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = '세션 아웃박스를 처리합니다 (일일 통계/스트릭/뱃지/챌린지).'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=OUTBOX_BATCH_SIZE, help='한 번에 가져올 이벤트 수')
+        parser.add_argument('--idle-sleep', type=float, default=1.0, help='대기 이벤트가 없을 때 쉬는 시간 (초)')
+        parser.add_argument('--once', action='store_true', help='대기 이벤트를 모두 처리하면 종료')
+
+    def handle(self, *args, **options):
+        self.stdout.write('⚙️ 세션 후처리 워커 시작...')
+        last_purge = time.monotonic()
+        next_partition_check = time.monotonic()
+        totals = {'processed': 0, 'failed': 0}
+
+        try:
+            while True:
+                close_old_connections()
+                if time.monotonic() >= next_partition_check:
+                    next_partition_check = time.monotonic() + self._ensure_partitions()
+
+                processed, failed = process_batch(options['batch_size'])
+                totals['processed'] += processed
+                totals['failed'] += failed
+                if processed or failed:
+                    self.stdout.write(f'  ✅ {processed}개 처리, {failed}개 실패')
+
+                if time.monotonic() - last_purge > PURGE_INTERVAL_SECONDS:
+                    purged = purge_processed()
+                    self.stdout.write(f'  🧹 처리 완료 이벤트 {purged}개 정리')
+                    last_purge = time.monotonic()
+
+                if not (processed or failed):
+                    if options['once']:
+                        break
+                    time.sleep(options['idle_sleep'])
+        except KeyboardInterrupt:
+            pass
+
+        self.stdout.write(self.style.SUCCESS(
+            f"✅ 워커 종료 ({totals['processed']}개 처리 / {totals['failed']}개 실패)"
+        ))
+
+    def _ensure_partitions(self):
+        """앞으로 쓸 파티션 생성. 반환값: 다음 확인까지 기다릴 시간 (초)"""
+        try:
+            created = ensure_partitions()
+        except Exception:
+            logger.exception('세션 파티션 생성 실패')
+            self.stderr.write(f'  ⚠️ 세션 파티션 생성 실패 - {PARTITION_RETRY_SECONDS}초 후 다시 시도')
+            return PARTITION_RETRY_SECONDS
+        if created:
+            self.stdout.write(f'  🗂️ 세션 파티션 {len(created)}개 생성: {", ".join(created)}')
+        return PARTITION_INTERVAL_SECONDS
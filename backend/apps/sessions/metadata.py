@@ -0,0 +1,196 @@
+"""
+sessions 메타데이터 투영 - metadata JSON의 선언된 키를 타입 있는 인덱스 열로
+
+METADATA_PROJECTIONS에 열마다 (metadata 경로, 변환, 차원 종류)를 선언한다.
+- 값 열(차원 종류 None): 변환 결과를 TypingSession 열에 그대로 저장
+- 차원 열: 문자열 값을 SessionDimension(kind, value) 한 행으로 정규화해 FK로 저장
+
+세션 저장(save/bulk_create) 시점에 채우고, 선언을 추가/변경한 뒤에는
+backfill_session_metadata로 기존 세션을 묶음 단위로 다시 채운다.
+목록 API 필터 이름은 열 이름에서 meta_를 뺀 것이다 (?submode=time_attack&keyboard_layout=dubeolsik).
+"""
+from django.db import connection
+from psycopg2.extras import execute_values
+
+from .models import SessionDimension, TypingSession
+
+
+CHUNK_SIZE = 1000
+
+MAX_POSITIVE_INT = 2 ** 31 - 1
+
+
+def _as_string(max_length):
+    def cast(value):
+        if isinstance(value, str) and value.strip():
+            return value.strip()[:max_length]
+        return None
+    return cast
+
+
+def _as_positive_int(value):
+    if isinstance(value, bool):
+        return None
+    try:
+        number = int(value)
+    except (TypeError, ValueError):
+        return None
+    return number if 0 <= number <= MAX_POSITIVE_INT else None
+
+
+# 열 이름: (metadata 경로, 변환, 차원 종류)
+METADATA_PROJECTIONS = {
+    'meta_submode': (('submode',), _as_string(30), None),
+    'meta_time_limit_sec': (('settings', 'timeLimitSec'), _as_positive_int, None),
+    'meta_device': (('device',), _as_string(100), 'device'),
+    'meta_browser': (('browser',), _as_string(100), 'browser'),
+    'meta_keyboard_layout': (('keyboard_layout',), _as_string(100), 'keyboard_layout'),
+}
+
+PROJECTED_FIELDS = list(METADATA_PROJECTIONS)
+
+FILTER_PARAMS = {column.removeprefix('meta_'): column for column in METADATA_PROJECTIONS}
+
+
+def _lookup(metadata, path):
+    value = metadata
+    for key in path:
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+    return value
+
+
+def extract(metadata):
+    """metadata → {열 이름: 변환된 값 또는 None} (차원 열은 문자열 값)"""
+    if not isinstance(metadata, dict):
+        return dict.fromkeys(METADATA_PROJECTIONS)
+    return {
+        column: cast(_lookup(metadata, path))
+        for column, (path, cast, _) in METADATA_PROJECTIONS.items()
+    }
+
+
+def intern_dimensions(pairs):
+    """
+    (kind, value) 목록을 SessionDimension에 넣고 {(kind, value): id} 반환
+    이미 있는 값은 조회만 하고, 없는 값만 한 번의 upsert로 넣는다.
+    """
+    pairs = set(pairs)
+    if not pairs:
+        return {}
+
+    ids = {}
+    for kind, value, dimension_id in SessionDimension.objects.filter(
+        kind__in={kind for kind, _ in pairs}, value__in={value for _, value in pairs}
+    ).values_list('kind', 'value', 'id'):
+        ids[(kind, value)] = dimension_id
+    missing = [pair for pair in pairs if pair not in ids]
+    if missing:
+        table = connection.ops.quote_name(SessionDimension._meta.db_table)
+        sql = (
+            f'INSERT INTO {table} (kind, value, created_at) VALUES %s '
+            f'ON CONFLICT (kind, value) DO UPDATE SET kind = EXCLUDED.kind '
+            f'RETURNING kind, value, id'
+        )
+        with connection.cursor() as cursor:
+            # 동시 저장으로 충돌한 행도 id를 돌려받도록 DO UPDATE (값은 그대로)
+            rows = execute_values(
+                cursor.cursor, sql, missing, template='(%s, %s, now())', page_size=len(missing), fetch=True
+            )
+        ids.update({(kind, value): dimension_id for kind, value, dimension_id in rows})
+    return ids
+
+
+def _projected_rows(metadata_list):
+    """metadata 목록 → 열 값 dict 목록 (차원 열은 SessionDimension id)"""
+    extracted = [extract(metadata) for metadata in metadata_list]
+    dimensions = intern_dimensions(
+        (kind, values[column])
+        for values in extracted
+        for column, (_, _, kind) in METADATA_PROJECTIONS.items()
+        if kind is not None and values[column] is not None
+    )
+    for values in extracted:
+        for column, (_, _, kind) in METADATA_PROJECTIONS.items():
+            if kind is not None and values[column] is not None:
+                values[column] = dimensions[(kind, values[column])]
+    return extracted
+
+
+def project_metadata(sessions):
+    """세션들의 metadata를 투영 열에 채움 (저장 전 호출, bulk_create용)"""
+    sessions = list(sessions)
+    for session, values in zip(sessions, _projected_rows(session.metadata for session in sessions)):
+        for column, value in values.items():
+            attname = TypingSession._meta.get_field(column).attname
+            setattr(session, attname, value)
+    return sessions
+
+
+def metadata_filters(params):
+    """
+    쿼리 파라미터 → {열 이름: 값} (값 열은 변환한 값, 차원 열은 문자열)
+    변환할 수 없는 값은 None으로 두어 결과가 비게 한다.
+    """
+    filters = {}
+    for param, column in FILTER_PARAMS.items():
+        raw = params.get(param)
+        if raw:
+            _, cast, _ = METADATA_PROJECTIONS[column]
+            filters[column] = cast(raw)
+    return filters
+
+
+def filter_metadata(queryset, filters):
+    """metadata_filters 결과로 투영 열 필터 (차원 열은 값으로 조인)"""
+    for column, value in filters.items():
+        if value is None:
+            return queryset.none()
+        kind = METADATA_PROJECTIONS[column][2]
+        queryset = queryset.filter(**{f'{column}__value' if kind else column: value})
+    return queryset
+
+
+def matches(metadata, filters):
+    """저장되지 않은 세션(보관 파일)용 - metadata가 필터를 모두 만족하는지"""
+    if any(value is None for value in filters.values()):
+        return False
+    values = extract(metadata)
+    return all(values[column] == value for column, value in filters.items())
+
+
+def backfill_metadata(chunk_size=CHUNK_SIZE):
+    """
+    metadata가 있는 세션의 투영 열을 묶음 단위로 다시 채움 (UPDATE ... FROM (VALUES ...))
+    반환값: 묶음마다 (처리한 세션 수, 마지막 세션 ID) - 제너레이터
+    """
+    fields = [TypingSession._meta.get_field(column) for column in PROJECTED_FIELDS]
+    table = connection.ops.quote_name(TypingSession._meta.db_table)
+    assignments = ', '.join(f'{field.column} = v.{field.column}' for field in fields)
+    sql = (
+        f'UPDATE {table} AS t SET {assignments} '
+        f'FROM (VALUES %s) AS v (id, started_at, {", ".join(field.column for field in fields)}) '
+        f'WHERE t.id = v.id AND t.started_at = v.started_at'
+    )
+    # NULL만 있는 열도 타입이 정해지도록 열 타입으로 캐스트 (FK는 대상 PK 타입)
+    template = '(%s, %s::timestamptz, ' + ', '.join(f'%s::{field.db_type(connection)}' for field in fields) + ')'
+
+    queryset = TypingSession.objects.filter(metadata__isnull=False)
+    last_id = 0
+    while True:
+        rows = list(
+            queryset.filter(id__gt=last_id).order_by('id').values_list('id', 'started_at', 'metadata')[:chunk_size]
+        )
+        if not rows:
+            break
+        last_id = rows[-1][0]
+
+        projected = _projected_rows(metadata for _, _, metadata in rows)
+        values = [
+            (session_id, started_at, *(values[column] for column in PROJECTED_FIELDS))
+            for (session_id, started_at, _), values in zip(rows, projected)
+        ]
+        with connection.cursor() as cursor:
+            execute_values(cursor.cursor, sql, values, template=template, page_size=len(values))
+        yield len(rows), last_id
@@ -0,0 +1,33 @@
+# Generated by Django 4.2.30 on 2026-10-17 22:05
+
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('typing_sessions', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SessionOutbox',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('attempts', models.PositiveSmallIntegerField(default=0, verbose_name='시도 횟수')),
+                ('available_at', models.DateTimeField(default=django.utils.timezone.now, help_text='실패 시 재시도 대기', verbose_name='처리 가능 시각')),
+                ('processed_at', models.DateTimeField(blank=True, null=True, verbose_name='처리 시각')),
+                ('last_error', models.TextField(blank=True, verbose_name='마지막 오류')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='생성일')),
+                ('session', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='outbox_events', to='typing_sessions.typingsession', verbose_name='세션')),
+            ],
+            options={
+                'verbose_name': '세션 아웃박스',
+                'verbose_name_plural': '세션 아웃박스들',
+                'ordering': ['id'],
+                'indexes': [models.Index(condition=models.Q(('processed_at__isnull', True)), fields=['available_at', 'id'], name='idx_outbox_pending')],
+            },
+        ),
+    ]
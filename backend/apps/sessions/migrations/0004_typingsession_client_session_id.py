@@ -0,0 +1,22 @@
+# Generated by Django 4.2.30 on 2026-10-17 22:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('typing_sessions', '0003_session_outbox'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='typingsession',
+            name='client_session_id',
+            field=models.UUIDField(blank=True, help_text='클라이언트가 생성한 UUID - 재전송 시 중복 저장 방지', null=True, verbose_name='클라이언트 세션 ID'),
+        ),
+        migrations.AddConstraint(
+            model_name='typingsession',
+            constraint=models.UniqueConstraint(condition=models.Q(('client_session_id__isnull', False)), fields=('client_session_id',), name='uq_session_client_id'),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 4.2.30 on 2026-10-17 22:08
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('typing_sessions', '0004_typingsession_client_session_id'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TypingEventBlob',
+            fields=[
+                ('session', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='event_blob', serialize=False, to='typing_sessions.typingsession', verbose_name='세션')),
+                ('format_version', models.PositiveSmallIntegerField(default=1, verbose_name='포맷 버전')),
+                ('event_count', models.PositiveIntegerField(default=0, verbose_name='이벤트 수')),
+                ('data', models.BinaryField(verbose_name='압축 이벤트')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='생성일')),
+            ],
+            options={
+                'verbose_name': '타이핑 이벤트 묶음',
+                'verbose_name_plural': '타이핑 이벤트 묶음들',
+            },
+        ),
+    ]
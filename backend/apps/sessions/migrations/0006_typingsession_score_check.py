@@ -0,0 +1,23 @@
+# Generated by Django 4.2.30 on 2026-10-17 22:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('typing_sessions', '0005_typing_event_blob'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='typingsession',
+            name='score_check',
+            field=models.JSONField(blank=True, help_text='클라이언트 제출값(claimed)과 차이가 큰 지표(diverged)', null=True, verbose_name='점수 검증 결과'),
+        ),
+        migrations.AddField(
+            model_name='typingsession',
+            name='score_status',
+            field=models.CharField(choices=[('unverified', '미검증'), ('verified', '검증됨'), ('flagged', '불일치')], db_index=True, default='unverified', help_text='이벤트가 제출된 세션은 서버가 점수를 다시 계산', max_length=20, verbose_name='점수 검증 상태'),
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 4.2.30 on 2026-10-17 22:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('typing_sessions', '0006_typingsession_score_check'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='typingsession',
+            name='screened_at',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='검사 시각'),
+        ),
+        migrations.AddField(
+            model_name='typingsession',
+            name='suspicion_reasons',
+            field=models.JSONField(blank=True, help_text='탐지된 신호 목록과 측정값', null=True, verbose_name='의심 근거'),
+        ),
+        migrations.AddField(
+            model_name='typingsession',
+            name='suspicion_score',
+            field=models.DecimalField(blank=True, decimal_places=3, help_text='0~1, detect_cheating 배치가 기록 (미검사는 NULL)', max_digits=4, null=True, verbose_name='부정행위 의심 점수'),
+        ),
+        migrations.AddIndex(
+            model_name='typingsession',
+            index=models.Index(fields=['started_at', 'suspicion_score'], name='idx_session_suspicion'),
+        ),
+    ]
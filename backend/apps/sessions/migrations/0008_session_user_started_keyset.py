@@ -0,0 +1,21 @@
+# Generated by Django 4.2.30 on 2026-10-17 22:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('typing_sessions', '0007_typingsession_suspicion'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='typingsession',
+            name='idx_session_user_started',
+        ),
+        migrations.AddIndex(
+            model_name='typingsession',
+            index=models.Index(fields=['user', '-started_at', '-id'], name='idx_session_user_started'),
+        ),
+    ]
@@ -0,0 +1,152 @@
+# Generated by Django 4.2.30 on 2026-10-17 22:19
+
+from datetime import date, datetime, time
+
+from django.db import migrations, models
+from django.utils import timezone
+import django.db.models.deletion
+
+
+MONTHS_AHEAD = 3
+
+
+def _add_months(month, months):
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _month_start(moment):
+    local = timezone.localtime(moment)
+    return date(local.year, local.month, 1)
+
+
+def backfill_client_keys(apps, schema_editor):
+    TypingSession = apps.get_model('typing_sessions', 'TypingSession')
+    ClientSessionKey = apps.get_model('typing_sessions', 'ClientSessionKey')
+    rows = TypingSession.objects.filter(client_session_id__isnull=False).values_list(
+        'client_session_id', 'id', 'created_at'
+    )
+    ClientSessionKey.objects.bulk_create(
+        (
+            ClientSessionKey(client_session_id=client_session_id, session_id=session_id, created_at=created_at)
+            for client_session_id, session_id, created_at in rows.iterator()
+        ),
+        batch_size=1000,
+    )
+
+
+def partition_sessions(apps, schema_editor):
+    """
+    세션 테이블을 started_at 월 단위 RANGE 파티션 테이블로 교체
+
+    기존 테이블을 옆으로 옮기고 같은 컬럼/CHECK 제약의 파티션 부모를 만든 뒤,
+    데이터가 있는 달부터 MONTHS_AHEAD개월 뒤까지 월 파티션 + default 파티션을 만들고
+    인덱스를 Django 이름 그대로 다시 만든 다음 행을 옮기고 FK 제약을 다시 건다.
+    """
+    TypingSession = apps.get_model('typing_sessions', 'TypingSession')
+    table = TypingSession._meta.db_table
+    old = f'{table}_unpartitioned'
+    quote = schema_editor.quote_name
+    execute = schema_editor.execute
+    tz = timezone.get_current_timezone()
+
+    execute(f'ALTER TABLE {quote(table)} RENAME TO {quote(old)}')
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            'SELECT indexrelid::regclass::text FROM pg_index WHERE indrelid = %s::regclass AND NOT indisprimary',
+            [old],
+        )
+        for (index_name,) in cursor.fetchall():
+            execute(f'DROP INDEX {index_name}')
+        cursor.execute(f'SELECT MIN(started_at) FROM {quote(old)}')
+        earliest = cursor.fetchone()[0]
+    execute(f'ALTER TABLE {quote(old)} DROP CONSTRAINT {quote(table + "_pkey")}')
+
+    execute(
+        f'CREATE TABLE {quote(table)} '
+        f'(LIKE {quote(old)} INCLUDING DEFAULTS INCLUDING CONSTRAINTS INCLUDING IDENTITY) '
+        f'PARTITION BY RANGE (started_at)'
+    )
+    execute(f'ALTER TABLE {quote(table)} ADD CONSTRAINT {quote(table + "_pkey")} PRIMARY KEY (id, started_at)')
+
+    current = _month_start(timezone.now())
+    month = _month_start(earliest) if earliest else current
+    while month <= _add_months(current, MONTHS_AHEAD):
+        start = timezone.make_aware(datetime.combine(month, time.min), tz)
+        end = timezone.make_aware(datetime.combine(_add_months(month, 1), time.min), tz)
+        execute(
+            f'CREATE TABLE {quote(f"{table}_p{month:%Y%m}")} PARTITION OF {quote(table)} '
+            f'FOR VALUES FROM (%s) TO (%s)',
+            [start, end],
+        )
+        month = _add_months(month, 1)
+    execute(f'CREATE TABLE {quote(f"{table}_default")} PARTITION OF {quote(table)} DEFAULT')
+
+    for sql in schema_editor._model_indexes_sql(TypingSession):
+        execute(sql)
+    for constraint in TypingSession._meta.constraints:
+        if isinstance(constraint, models.UniqueConstraint):
+            schema_editor.add_constraint(TypingSession, constraint)
+
+    execute(f'INSERT INTO {quote(table)} SELECT * FROM {quote(old)}')
+    # LIKE는 FK를 복사하지 않고 기존 테이블과 함께 사라지므로 파티션 부모에 다시 생성 (PostgreSQL 11+)
+    for field in TypingSession._meta.local_concrete_fields:
+        if field.remote_field and field.db_constraint:
+            execute(schema_editor._create_fk_sql(TypingSession, field, '_fk_%(to_table)s_%(to_column)s'))
+    execute(
+        f"SELECT setval(pg_get_serial_sequence(%s, 'id'), "
+        f"COALESCE((SELECT MAX(id) FROM {quote(table)}), 1), "
+        f"(SELECT MAX(id) FROM {quote(table)}) IS NOT NULL)",
+        [table],
+    )
+    execute(f'DROP TABLE {quote(old)}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('typing_sessions', '0008_session_user_started_keyset'),
+        ('stats', '0007_personalbest_session_db_constraint'),
+    ]
+
+    operations = [
+        migrations.RemoveConstraint(
+            model_name='typingsession',
+            name='uq_session_client_id',
+        ),
+        migrations.AlterField(
+            model_name='sessionoutbox',
+            name='session',
+            field=models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.CASCADE, related_name='outbox_events', to='typing_sessions.typingsession', verbose_name='세션'),
+        ),
+        migrations.AlterField(
+            model_name='typingevent',
+            name='session',
+            field=models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.CASCADE, related_name='events', to='typing_sessions.typingsession', verbose_name='세션'),
+        ),
+        migrations.AlterField(
+            model_name='typingeventblob',
+            name='session',
+            field=models.OneToOneField(db_constraint=False, on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='event_blob', serialize=False, to='typing_sessions.typingsession', verbose_name='세션'),
+        ),
+        migrations.AlterField(
+            model_name='typingsession',
+            name='client_session_id',
+            field=models.UUIDField(blank=True, help_text='클라이언트가 생성한 UUID - 재전송 시 중복 저장 방지 (유일성은 ClientSessionKey)', null=True, verbose_name='클라이언트 세션 ID'),
+        ),
+        migrations.CreateModel(
+            name='ClientSessionKey',
+            fields=[
+                ('client_session_id', models.UUIDField(primary_key=True, serialize=False, verbose_name='클라이언트 세션 ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='생성일')),
+                ('session', models.OneToOneField(db_constraint=False, on_delete=django.db.models.deletion.CASCADE, related_name='client_key', to='typing_sessions.typingsession', verbose_name='세션')),
+            ],
+            options={
+                'verbose_name': '클라이언트 세션 키',
+                'verbose_name_plural': '클라이언트 세션 키들',
+            },
+        ),
+        migrations.RunPython(backfill_client_keys, migrations.RunPython.noop),
+        # 되돌리려면 파티션을 일반 테이블로 다시 옮겨야 하므로 역방향은 지원하지 않음
+        migrations.RunPython(partition_sessions),
+    ]
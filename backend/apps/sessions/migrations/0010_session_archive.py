@@ -0,0 +1,37 @@
+# Generated by Django 4.2.30 on 2026-10-17 22:25
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('typing_sessions', '0009_partition_typingsession'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SessionArchive',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('month', models.DateField(help_text='보관한 세션의 started_at 월 (매월 1일)', verbose_name='월')),
+                ('path', models.CharField(help_text='session_archive 스토리지 기준 경로', max_length=255, unique=True, verbose_name='파일 경로')),
+                ('session_count', models.PositiveIntegerField(verbose_name='세션 수')),
+                ('first_started_at', models.DateTimeField(verbose_name='가장 이른 시작 시간')),
+                ('last_started_at', models.DateTimeField(verbose_name='가장 늦은 시작 시간')),
+                ('byte_size', models.BigIntegerField(verbose_name='파일 크기 (bytes)')),
+                ('checksum', models.CharField(max_length=64, verbose_name='SHA-256')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='보관일')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='session_archives', to=settings.AUTH_USER_MODEL, verbose_name='사용자')),
+            ],
+            options={
+                'verbose_name': '세션 보관 파일',
+                'verbose_name_plural': '세션 보관 파일들',
+                'ordering': ['user', '-last_started_at'],
+                'indexes': [models.Index(fields=['user', '-last_started_at'], name='idx_archive_user_last')],
+            },
+        ),
+    ]
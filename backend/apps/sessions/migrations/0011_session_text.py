@@ -0,0 +1,53 @@
+# Generated by Django 4.2.30 on 2026-10-17 22:27
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('typing_sessions', '0010_session_archive'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SessionText',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('content_hash', models.CharField(help_text='content의 UTF-8 SHA-256 (hex)', max_length=64, unique=True, verbose_name='내용 해시')),
+                ('content', models.TextField(verbose_name='문장 내용')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='생성일')),
+            ],
+            options={
+                'verbose_name': '세션 문장',
+                'verbose_name_plural': '세션 문장들',
+            },
+        ),
+        # 기존 문장은 같은 열에 그대로 두고 (backfill_session_texts가 옮김) NOT NULL만 해제
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.RenameField(
+                    model_name='typingsession',
+                    old_name='text_content',
+                    new_name='legacy_text_content',
+                ),
+                migrations.AlterField(
+                    model_name='typingsession',
+                    name='legacy_text_content',
+                    field=models.TextField(blank=True, db_column='text_content', editable=False, help_text='backfill_session_texts로 SessionText에 옮기기 전 세션만 값이 있음', null=True, verbose_name='연습한 문장 내용 (이전 저장분)'),
+                ),
+            ],
+            database_operations=[
+                migrations.RunSQL(
+                    'ALTER TABLE typing_sessions_typingsession ALTER COLUMN text_content DROP NOT NULL',
+                    'ALTER TABLE typing_sessions_typingsession ALTER COLUMN text_content SET NOT NULL',
+                ),
+            ],
+        ),
+        migrations.AddField(
+            model_name='typingsession',
+            name='text',
+            field=models.ForeignKey(blank=True, help_text='원본 문장 삭제 시에도 기록 유지를 위해 저장 (내용은 text_content로 접근)', null=True, on_delete=django.db.models.deletion.PROTECT, related_name='sessions', to='typing_sessions.sessiontext', verbose_name='연습한 문장'),
+        ),
+    ]
@@ -0,0 +1,73 @@
+# Generated by Django 4.2.30 on 2026-10-17 22:29
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('typing_sessions', '0011_session_text'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SessionDimension',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('device', '기기'), ('browser', '브라우저'), ('keyboard_layout', '키보드 배열')], max_length=30, verbose_name='종류')),
+                ('value', models.CharField(max_length=100, verbose_name='값')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='생성일')),
+            ],
+            options={
+                'verbose_name': '세션 메타데이터 차원',
+                'verbose_name_plural': '세션 메타데이터 차원들',
+                'ordering': ['kind', 'value'],
+            },
+        ),
+        migrations.AddField(
+            model_name='typingsession',
+            name='meta_submode',
+            field=models.CharField(blank=True, editable=False, help_text='metadata.submode', max_length=30, null=True, verbose_name='세부 모드'),
+        ),
+        migrations.AddField(
+            model_name='typingsession',
+            name='meta_time_limit_sec',
+            field=models.PositiveIntegerField(blank=True, editable=False, help_text='metadata.settings.timeLimitSec', null=True, verbose_name='제한 시간 (초)'),
+        ),
+        migrations.AddField(
+            model_name='typingsession',
+            name='meta_browser',
+            field=models.ForeignKey(blank=True, db_index=False, editable=False, help_text='metadata.browser', null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='typing_sessions.sessiondimension', verbose_name='브라우저'),
+        ),
+        migrations.AddField(
+            model_name='typingsession',
+            name='meta_device',
+            field=models.ForeignKey(blank=True, db_index=False, editable=False, help_text='metadata.device', null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='typing_sessions.sessiondimension', verbose_name='기기'),
+        ),
+        migrations.AddField(
+            model_name='typingsession',
+            name='meta_keyboard_layout',
+            field=models.ForeignKey(blank=True, db_index=False, editable=False, help_text='metadata.keyboard_layout', null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='typing_sessions.sessiondimension', verbose_name='키보드 배열'),
+        ),
+        migrations.AddConstraint(
+            model_name='sessiondimension',
+            constraint=models.UniqueConstraint(fields=('kind', 'value'), name='uq_dimension_kind_value'),
+        ),
+        migrations.AddIndex(
+            model_name='typingsession',
+            index=models.Index(condition=models.Q(('meta_submode__isnull', False)), fields=['meta_submode', 'meta_time_limit_sec', '-started_at'], name='idx_session_meta_submode'),
+        ),
+        migrations.AddIndex(
+            model_name='typingsession',
+            index=models.Index(condition=models.Q(('meta_device__isnull', False)), fields=['meta_device', '-started_at'], name='idx_session_meta_device'),
+        ),
+        migrations.AddIndex(
+            model_name='typingsession',
+            index=models.Index(condition=models.Q(('meta_browser__isnull', False)), fields=['meta_browser', '-started_at'], name='idx_session_meta_browser'),
+        ),
+        migrations.AddIndex(
+            model_name='typingsession',
+            index=models.Index(condition=models.Q(('meta_keyboard_layout__isnull', False)), fields=['meta_keyboard_layout', '-started_at'], name='idx_session_meta_keyboard'),
+        ),
+    ]
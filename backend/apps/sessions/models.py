@@ -1,9 +1,85 @@
 from django.db import models
 from django.conf import settings
+from django.utils import timezone
+
+
+class SessionText(models.Model):
+    """
+    세션 연습 문장 저장소 - 내용 해시(SHA-256)로 중복 제거
+    
+    같은 문장을 친 세션들은 한 행을 참조한다. 원본 TextItem과 연결하지 않으므로
+    문장이 삭제돼도 세션 기록의 문장은 유지되고, 참조 중인 행은 삭제할 수 없다(PROTECT).
+    """
+    
+    content_hash = models.CharField(
+        max_length=64,
+        unique=True,
+        verbose_name='내용 해시',
+        help_text='content의 UTF-8 SHA-256 (hex)'
+    )
+    content = models.TextField(
+        verbose_name='문장 내용'
+    )
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+        verbose_name='생성일'
+    )
+    
+    class Meta:
+        verbose_name = '세션 문장'
+        verbose_name_plural = '세션 문장들'
+    
+    def __str__(self):
+        return self.content[:30]
+
+
+class SessionDimension(models.Model):
+    """
+    세션 메타데이터 차원 값 (기기/브라우저/키보드 배열)
+    
+    metadata의 문자열 값을 종류별 한 행으로 정규화하고, 세션은 meta_* FK로 참조한다 (apps.sessions.metadata).
+    """
+    
+    KIND_CHOICES = [
+        ('device', '기기'),
+        ('browser', '브라우저'),
+        ('keyboard_layout', '키보드 배열'),
+    ]
+    
+    kind = models.CharField(
+        max_length=30,
+        choices=KIND_CHOICES,
+        verbose_name='종류'
+    )
+    value = models.CharField(
+        max_length=100,
+        verbose_name='값'
+    )
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+        verbose_name='생성일'
+    )
+    
+    class Meta:
+        verbose_name = '세션 메타데이터 차원'
+        verbose_name_plural = '세션 메타데이터 차원들'
+        ordering = ['kind', 'value']
+        constraints = [
+            models.UniqueConstraint(fields=['kind', 'value'], name='uq_dimension_kind_value'),
+        ]
+    
+    def __str__(self):
+        return f"{self.get_kind_display()}: {self.value}"
 
 
 class TypingSession(models.Model):
-    """타자 연습 세션 모델 - 원천 데이터"""
+    """
+    타자 연습 세션 모델 - 원천 데이터
+    
+    테이블은 started_at 월 단위 RANGE 파티션이다 (apps.sessions.partitions).
+    PK는 DB에서 (id, started_at)이므로 이 테이블을 참조하는 FK는 db_constraint=False로 두고,
+    파티션 키 없는 유니크 제약을 걸 수 없는 client_session_id는 ClientSessionKey로 보장한다.
+    """
     
     MODE_CHOICES = [
         ('practice', '연습'),
@@ -16,6 +92,12 @@ class TypingSession(models.Model):
         ('en', '영어'),
     ]
     
+    SCORE_STATUS_CHOICES = [
+        ('unverified', '미검증'),
+        ('verified', '검증됨'),
+        ('flagged', '불일치'),
+    ]
+    
     # 사용자/연결 정보
     user = models.ForeignKey(
         settings.AUTH_USER_MODEL,
@@ -60,9 +142,22 @@ class TypingSession(models.Model):
         verbose_name='언어',
         db_index=True
     )
-    text_content = models.TextField(
-        verbose_name='연습한 문장 내용',
-        help_text='원본 문장 삭제 시에도 기록 유지를 위해 저장'
+    text = models.ForeignKey(
+        SessionText,
+        on_delete=models.PROTECT,
+        related_name='sessions',
+        null=True,
+        blank=True,
+        verbose_name='연습한 문장',
+        help_text='원본 문장 삭제 시에도 기록 유지를 위해 저장 (내용은 text_content로 접근)'
+    )
+    legacy_text_content = models.TextField(
+        null=True,
+        blank=True,
+        editable=False,
+        db_column='text_content',
+        verbose_name='연습한 문장 내용 (이전 저장분)',
+        help_text='backfill_session_texts로 SessionText에 옮기기 전 세션만 값이 있음'
     )
     
     # 시간 정보
@@ -116,6 +211,41 @@ class TypingSession(models.Model):
         verbose_name='CPM (분당 문자수)'
     )
     
+    # 서버 검증
+    score_status = models.CharField(
+        max_length=20,
+        choices=SCORE_STATUS_CHOICES,
+        default='unverified',
+        verbose_name='점수 검증 상태',
+        help_text='이벤트가 제출된 세션은 서버가 점수를 다시 계산',
+        db_index=True
+    )
+    score_check = models.JSONField(
+        null=True,
+        blank=True,
+        verbose_name='점수 검증 결과',
+        help_text='클라이언트 제출값(claimed)과 차이가 큰 지표(diverged)'
+    )
+    suspicion_score = models.DecimalField(
+        max_digits=4,
+        decimal_places=3,
+        null=True,
+        blank=True,
+        verbose_name='부정행위 의심 점수',
+        help_text='0~1, detect_cheating 배치가 기록 (미검사는 NULL)'
+    )
+    suspicion_reasons = models.JSONField(
+        null=True,
+        blank=True,
+        verbose_name='의심 근거',
+        help_text='탐지된 신호 목록과 측정값'
+    )
+    screened_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name='검사 시각'
+    )
+    
     # 확장 필드
     metadata = models.JSONField(
         null=True,
@@ -123,12 +253,68 @@ class TypingSession(models.Model):
         verbose_name='메타데이터',
         help_text='기기/브라우저/키보드 등 확장 정보'
     )
+    
+    # metadata에서 저장 시 투영하는 열 (apps.sessions.metadata.METADATA_PROJECTIONS)
+    meta_submode = models.CharField(
+        max_length=30,
+        null=True,
+        blank=True,
+        editable=False,
+        verbose_name='세부 모드',
+        help_text='metadata.submode'
+    )
+    meta_time_limit_sec = models.PositiveIntegerField(
+        null=True,
+        blank=True,
+        editable=False,
+        verbose_name='제한 시간 (초)',
+        help_text='metadata.settings.timeLimitSec'
+    )
+    meta_device = models.ForeignKey(
+        SessionDimension,
+        on_delete=models.PROTECT,
+        related_name='+',
+        null=True,
+        blank=True,
+        editable=False,
+        db_index=False,
+        verbose_name='기기',
+        help_text='metadata.device'
+    )
+    meta_browser = models.ForeignKey(
+        SessionDimension,
+        on_delete=models.PROTECT,
+        related_name='+',
+        null=True,
+        blank=True,
+        editable=False,
+        db_index=False,
+        verbose_name='브라우저',
+        help_text='metadata.browser'
+    )
+    meta_keyboard_layout = models.ForeignKey(
+        SessionDimension,
+        on_delete=models.PROTECT,
+        related_name='+',
+        null=True,
+        blank=True,
+        editable=False,
+        db_index=False,
+        verbose_name='키보드 배열',
+        help_text='metadata.keyboard_layout'
+    )
     guest_session_id = models.CharField(
         max_length=100,
         blank=True,
         verbose_name='게스트 세션 ID',
         help_text='비로그인 사용자 식별용'
     )
+    client_session_id = models.UUIDField(
+        null=True,
+        blank=True,
+        verbose_name='클라이언트 세션 ID',
+        help_text='클라이언트가 생성한 UUID - 재전송 시 중복 저장 방지 (유일성은 ClientSessionKey)'
+    )
     
     # 타임스탬프
     created_at = models.DateTimeField(
@@ -145,9 +331,30 @@ class TypingSession(models.Model):
         verbose_name_plural = '타자 세션들'
         ordering = ['-started_at']
         indexes = [
-            models.Index(fields=['user', '-started_at'], name='idx_session_user_started'),
+            models.Index(fields=['user', '-started_at', '-id'], name='idx_session_user_started'),
             models.Index(fields=['mode', 'language', '-started_at'], name='idx_session_mode_lang'),
             models.Index(fields=['pack', '-started_at'], name='idx_session_pack_started'),
+            models.Index(fields=['started_at', 'suspicion_score'], name='idx_session_suspicion'),
+            models.Index(
+                fields=['meta_submode', 'meta_time_limit_sec', '-started_at'],
+                name='idx_session_meta_submode',
+                condition=models.Q(meta_submode__isnull=False),
+            ),
+            models.Index(
+                fields=['meta_device', '-started_at'],
+                name='idx_session_meta_device',
+                condition=models.Q(meta_device__isnull=False),
+            ),
+            models.Index(
+                fields=['meta_browser', '-started_at'],
+                name='idx_session_meta_browser',
+                condition=models.Q(meta_browser__isnull=False),
+            ),
+            models.Index(
+                fields=['meta_keyboard_layout', '-started_at'],
+                name='idx_session_meta_keyboard',
+                condition=models.Q(meta_keyboard_layout__isnull=False),
+            ),
         ]
         constraints = [
             models.CheckConstraint(
@@ -168,6 +375,34 @@ class TypingSession(models.Model):
         user_str = self.user.username if self.user else f'Guest'
         return f"{user_str} - {self.wpm}WPM / {self.accuracy}% ({self.started_at.strftime('%Y-%m-%d %H:%M')})"
 
+    # text_content 설정 후 아직 SessionText에 연결하지 않은 값
+    _pending_text = None
+
+    @property
+    def text_content(self):
+        """연습한 문장 내용 (목록 조회 시 select_related('text') 필요)"""
+        if self._pending_text is not None:
+            return self._pending_text
+        if self.text_id is not None:
+            return self.text.content
+        return self.legacy_text_content or ''
+
+    @text_content.setter
+    def text_content(self, value):
+        self._pending_text = value
+
+    def save(self, *args, **kwargs):
+        if self._pending_text is not None:
+            from .text_store import attach_texts
+            attach_texts([self])
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None or 'metadata' in update_fields:
+            from .metadata import PROJECTED_FIELDS, project_metadata
+            project_metadata([self])
+            if update_fields is not None:
+                kwargs['update_fields'] = {*update_fields, *PROJECTED_FIELDS}
+        super().save(*args, **kwargs)
+
 
 class TypingEvent(models.Model):
     """키 입력/오타 이벤트 로그 (선택적 기능, 기본 비활성)"""
@@ -176,6 +411,7 @@ class TypingEvent(models.Model):
         TypingSession,
         on_delete=models.CASCADE,
         related_name='events',
+        db_constraint=False,
         verbose_name='세션',
         db_index=True
     )
@@ -219,3 +455,184 @@ class TypingEvent(models.Model):
     def __str__(self):
         status = '✓' if self.is_correct else '✗'
         return f"{status} [{self.expected}] -> [{self.typed}] at {self.t_ms}ms"
+
+
+class TypingEventBlob(models.Model):
+    """세션 단위 키 입력 이벤트 압축 저장 (포맷: apps.sessions.eventpack)"""
+    
+    session = models.OneToOneField(
+        TypingSession,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='event_blob',
+        db_constraint=False,
+        verbose_name='세션'
+    )
+    format_version = models.PositiveSmallIntegerField(
+        default=1,
+        verbose_name='포맷 버전'
+    )
+    event_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name='이벤트 수'
+    )
+    data = models.BinaryField(
+        verbose_name='압축 이벤트'
+    )
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+        verbose_name='생성일'
+    )
+    
+    class Meta:
+        verbose_name = '타이핑 이벤트 묶음'
+        verbose_name_plural = '타이핑 이벤트 묶음들'
+    
+    def __str__(self):
+        return f"세션 {self.session_id} - {self.event_count}개 이벤트"
+    
+    def decode(self):
+        """이벤트 dict 목록"""
+        from .eventpack import decode_events
+        
+        return decode_events(bytes(self.data))
+    
+    def arrays(self):
+        """분석용 NumPy 열 배열"""
+        from .eventpack import decode_arrays
+        
+        return decode_arrays(bytes(self.data))
+
+
+class SessionOutbox(models.Model):
+    """세션 후처리 아웃박스 - 세션과 같은 트랜잭션에 기록, run_worker가 처리"""
+    
+    session = models.ForeignKey(
+        TypingSession,
+        on_delete=models.CASCADE,
+        related_name='outbox_events',
+        db_constraint=False,
+        verbose_name='세션'
+    )
+    attempts = models.PositiveSmallIntegerField(
+        default=0,
+        verbose_name='시도 횟수'
+    )
+    available_at = models.DateTimeField(
+        default=timezone.now,
+        verbose_name='처리 가능 시각',
+        help_text='실패 시 재시도 대기'
+    )
+    processed_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name='처리 시각'
+    )
+    last_error = models.TextField(
+        blank=True,
+        verbose_name='마지막 오류'
+    )
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+        verbose_name='생성일'
+    )
+    
+    class Meta:
+        verbose_name = '세션 아웃박스'
+        verbose_name_plural = '세션 아웃박스들'
+        ordering = ['id']
+        indexes = [
+            models.Index(
+                fields=['available_at', 'id'],
+                name='idx_outbox_pending',
+                condition=models.Q(processed_at__isnull=True),
+            ),
+        ]
+    
+    def __str__(self):
+        status = '✓' if self.processed_at else f'대기 ({self.attempts}회 시도)'
+        return f"세션 {self.session_id} 후처리 - {status}"
+
+
+class ClientSessionKey(models.Model):
+    """client_session_id 유일성 키 - 세션과 같은 트랜잭션에 기록 (중복 제출 시 PK 충돌)"""
+    
+    client_session_id = models.UUIDField(
+        primary_key=True,
+        verbose_name='클라이언트 세션 ID'
+    )
+    session = models.OneToOneField(
+        TypingSession,
+        on_delete=models.CASCADE,
+        related_name='client_key',
+        db_constraint=False,
+        verbose_name='세션'
+    )
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+        verbose_name='생성일'
+    )
+    
+    class Meta:
+        verbose_name = '클라이언트 세션 키'
+        verbose_name_plural = '클라이언트 세션 키들'
+    
+    def __str__(self):
+        return f"{self.client_session_id} → 세션 {self.session_id}"
+
+
+class SessionArchive(models.Model):
+    """
+    세션 보관 파일 목록 (manifest)
+    
+    archive_sessions가 오래된 세션을 (사용자, 월) 단위 gzip NDJSON 파일로 옮기고 한 행씩 기록한다.
+    파일 안의 세션은 (started_at, id) 내림차순이라 기록 조회가 앞에서부터 읽다 멈출 수 있다.
+    """
+    
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='session_archives',
+        verbose_name='사용자'
+    )
+    month = models.DateField(
+        verbose_name='월',
+        help_text='보관한 세션의 started_at 월 (매월 1일)'
+    )
+    path = models.CharField(
+        max_length=255,
+        unique=True,
+        verbose_name='파일 경로',
+        help_text='session_archive 스토리지 기준 경로'
+    )
+    session_count = models.PositiveIntegerField(
+        verbose_name='세션 수'
+    )
+    first_started_at = models.DateTimeField(
+        verbose_name='가장 이른 시작 시간'
+    )
+    last_started_at = models.DateTimeField(
+        verbose_name='가장 늦은 시작 시간'
+    )
+    byte_size = models.BigIntegerField(
+        verbose_name='파일 크기 (bytes)'
+    )
+    checksum = models.CharField(
+        max_length=64,
+        verbose_name='SHA-256'
+    )
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+        verbose_name='보관일'
+    )
+    
+    class Meta:
+        verbose_name = '세션 보관 파일'
+        verbose_name_plural = '세션 보관 파일들'
+        ordering = ['user', '-last_started_at']
+        indexes = [
+            models.Index(fields=['user', '-last_started_at'], name='idx_archive_user_last'),
+        ]
+    
+    def __str__(self):
+        return f"{self.user} - {self.month:%Y-%m} ({self.session_count}개)"
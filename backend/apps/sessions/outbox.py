@@ -0,0 +1,159 @@
+"""
+sessions 후처리 아웃박스
+
+세션 저장과 같은 트랜잭션에 SessionOutbox 행을 남기고, run_worker가
+SELECT ... FOR UPDATE SKIP LOCKED로 배치를 가져가 일일 통계/스트릭/뱃지/챌린지를
+갱신하고 키 입력 프로필을 누적하며, 워커 프로세스에 적재된 실시간 순위 인덱스에도 반영한다. 배치 안의 이벤트는 사용자별로 묶어 일일 통계는 (사용자, 날짜, 언어)당,
+스트릭/뱃지는 사용자당 한 번만 반영한다. 사용자별 후처리와 처리 완료 표시는
+같은 세이브포인트에서 커밋되므로 재시도해도 두 번 반영되지 않고, 여러 워커가 동시에 돌아도 같은 행을 잡지 않는다.
+세션 사용자가 그 사이 삭제된 이벤트(user=None)는 후처리할 대상이 없으므로 바로 처리 완료로 표시한다.
+"""
+import logging
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .models import SessionOutbox
+
+
+logger = logging.getLogger(__name__)
+
+OUTBOX_BATCH_SIZE = 100
+MAX_ATTEMPTS = 10
+
+
+def enqueue_session(session):
+    """세션 후처리 예약 (세션 저장 트랜잭션 안에서 호출)"""
+    if session.user_id is None:
+        return None
+    return SessionOutbox.objects.create(session=session)
+
+
+def enqueue_sessions(sessions):
+    """세션 여러 개 후처리 일괄 예약"""
+    return SessionOutbox.objects.bulk_create(
+        [SessionOutbox(session=session) for session in sessions if session.user_id is not None]
+    )
+
+
+def update_daily_stats(user, sessions):
+    from apps.stats.services import record_sessions_daily
+
+    record_sessions_daily(sessions)
+
+
+def update_streak(user, sessions):
+    from apps.goals.models import UserStreak
+
+    UserStreak.objects.get_or_create(user=user)
+    streak = UserStreak.objects.select_for_update().get(user=user)
+    for activity_date in sorted({timezone.localdate(session.started_at) for session in sessions}):
+        if streak.last_active_date is None or activity_date >= streak.last_active_date:
+            streak.update_streak(activity_date)
+
+
+def update_challenge(user, sessions):
+    from apps.challenges.services import record_challenge_progress
+
+    record_challenge_progress(user, sessions)
+
+
+def update_keystroke_profiles(user, sessions):
+    from apps.stats.keystrokes import update_session_profiles
+
+    update_session_profiles(user, sessions)
+
+
+def award_badges(user, sessions):
+    from apps.achievements.views import check_and_award_badges
+
+    check_and_award_badges(user)
+
+
+def update_live_rank(user, sessions):
+    from apps.leaderboard.live import record_sessions
+
+    # 후처리 세이브포인트가 롤백되면 반영하지 않도록 커밋 후 실행
+    transaction.on_commit(lambda: record_sessions(sessions))
+
+
+# 사용자별 세션 묶음에 순서대로 실행 (스트릭 뱃지가 갱신된 스트릭을 보도록 스트릭 → 뱃지)
+HANDLERS = [
+    update_daily_stats,
+    update_streak,
+    update_challenge,
+    update_keystroke_profiles,
+    award_badges,
+    update_live_rank,
+]
+
+
+def _retry_delay(attempts):
+    return timedelta(seconds=min(2 ** attempts, 3600))
+
+
+def process_batch(batch_size=OUTBOX_BATCH_SIZE):
+    """
+    처리 대기 이벤트 한 배치 처리
+    반환값: (처리 완료 수, 실패 수)
+    """
+    processed = failed = 0
+    with transaction.atomic():
+        events = list(
+            SessionOutbox.objects.select_for_update(skip_locked=True, of=('self',))
+            .select_related('session', 'session__user')
+            .filter(
+                processed_at__isnull=True,
+                available_at__lte=timezone.now(),
+                attempts__lt=MAX_ATTEMPTS,
+            )
+            .order_by('available_at', 'id')[:batch_size]
+        )
+
+        orphaned = [event.id for event in events if event.session.user_id is None]
+        if orphaned:
+            SessionOutbox.objects.filter(id__in=orphaned).update(
+                processed_at=timezone.now(),
+                attempts=F('attempts') + 1,
+                last_error='',
+            )
+            processed += len(orphaned)
+
+        by_user = {}
+        for event in events:
+            if event.session.user_id is not None:
+                by_user.setdefault(event.session.user_id, []).append(event)
+
+        for user_events in by_user.values():
+            sessions = [event.session for event in user_events]
+            ids = [event.id for event in user_events]
+            try:
+                with transaction.atomic():
+                    for handler in HANDLERS:
+                        handler(sessions[0].user, sessions)
+                    SessionOutbox.objects.filter(id__in=ids).update(
+                        processed_at=timezone.now(),
+                        attempts=F('attempts') + 1,
+                        last_error='',
+                    )
+                processed += len(user_events)
+            except Exception as exc:
+                logger.exception('사용자 %s 세션 후처리 실패', sessions[0].user_id)
+                for event in user_events:
+                    event.attempts += 1
+                    event.available_at = timezone.now() + _retry_delay(event.attempts)
+                    event.last_error = f'{type(exc).__name__}: {exc}'
+                SessionOutbox.objects.bulk_update(user_events, ['attempts', 'available_at', 'last_error'])
+                failed += len(user_events)
+
+    return processed, failed
+
+
+def purge_processed(older_than=timedelta(days=7)):
+    """처리 완료 후 보관 기간이 지난 이벤트 삭제"""
+    deleted, _ = SessionOutbox.objects.filter(
+        processed_at__lt=timezone.now() - older_than
+    ).delete()
+    return deleted
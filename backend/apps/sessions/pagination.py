@@ -0,0 +1,117 @@
+"""
+sessions 페이지네이션 - (started_at, id) 키셋 커서
+
+OFFSET/COUNT 없이 마지막 항목의 (started_at, id)보다 이전 세션만 조회하므로
+idx_session_user_started 인덱스를 따라 몇 번째 페이지든 첫 페이지와 같은 비용이 든다.
+
+뷰가 get_archive_reader()로 보관 리더를 주면 보관 파일(apps.sessions.archive)의 세션을
+같은 정렬 키로 병합하므로, 커서가 보관 경계를 넘어가도 목록이 끊기지 않는다.
+"""
+import base64
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+EPOCH = datetime(1970, 1, 1, tzinfo=dt_timezone.utc)
+# 세션 PK(bigint) 범위 - 벗어난 커서는 DB 오류 대신 잘못된 커서로 처리
+MAX_SESSION_ID = 2 ** 63 - 1
+
+
+class SessionCursorPagination(BasePagination):
+    """최신순 세션 목록 커서 페이지네이션 (다음 페이지 방향)"""
+    cursor_query_param = 'cursor'
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    ordering = ('-started_at', '-id')
+    invalid_cursor_message = '잘못된 커서입니다.'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+
+        position = self.decode_cursor(request)
+        queryset = queryset.order_by(*self.ordering)
+        if position is not None:
+            started_at, session_id = position
+            queryset = queryset.filter(
+                Q(started_at__lt=started_at) | Q(started_at=started_at, id__lt=session_id)
+            )
+
+        results = list(queryset[:self.page_size + 1])
+        archive = self.get_archive_reader(view)
+        if archive is not None:
+            # 세션 테이블로 한 페이지를 넘게 채웠으면 그 마지막 키 이후의 보관 세션만 필요
+            after = self.sort_key(results[-1]) if len(results) > self.page_size else None
+            archived = archive.sessions(before=position, after=after, limit=self.page_size + 1)
+            if archived:
+                results = sorted(results + archived, key=self.sort_key, reverse=True)[:self.page_size + 1]
+
+        self.has_next = len(results) > self.page_size
+        self.page = results[:self.page_size]
+        return self.page
+
+    @staticmethod
+    def sort_key(session):
+        return session.started_at, session.id
+
+    def get_archive_reader(self, view):
+        get_reader = getattr(view, 'get_archive_reader', None)
+        return get_reader() if get_reader is not None else None
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return min(max(size, 1), self.max_page_size)
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            micros, session_id = base64.urlsafe_b64decode(encoded.encode('ascii')).decode('ascii').split(':')
+            session_id = int(session_id)
+            if not 0 <= session_id <= MAX_SESSION_ID:
+                raise ValueError(session_id)
+            return EPOCH + timedelta(microseconds=int(micros)), session_id
+        except (TypeError, ValueError, UnicodeError, OverflowError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def encode_cursor(self, session):
+        micros = (session.started_at - EPOCH) // timedelta(microseconds=1)
+        return base64.urlsafe_b64encode(f'{micros}:{session.id}'.encode('ascii')).decode('ascii')
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.encode_cursor(self.page[-1]))
+
+    def get_first_link(self):
+        return remove_query_param(self.request.build_absolute_uri(), self.cursor_query_param)
+
+    def get_paginated_response(self, data):
+        return Response(OrderedDict([
+            ('next', self.get_next_link()),
+            ('first', self.get_first_link()),
+            ('results', data),
+        ]))
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'first': {'type': 'string', 'format': 'uri'},
+                'results': schema,
+            },
+        }
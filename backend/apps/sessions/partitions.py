@@ -0,0 +1,179 @@
+"""
+TypingSession 월 단위 RANGE 파티션 관리
+
+부모 테이블은 started_at으로 파티션되며 월별 파티션 이름은 <테이블>_pYYYYMM,
+범위 밖 세션(먼 과거/미래 started_at)은 <테이블>_default에 들어간다.
+경계는 Asia/Seoul 자정 기준이라 일/월 단위 조회가 한 파티션으로 좁혀진다.
+
+- ensure_partitions: 앞으로 쓸 월 파티션 미리 생성 (default에 쌓인 해당 월 행은 옮긴 뒤 연결)
+  여러 워커가 동시에 불러도 어드바이저리 락으로 한 프로세스만 만든다.
+- expire_partitions: 보존 기간이 지난 파티션 분리(detach) 또는 삭제(drop) - 메타데이터 작업
+"""
+import re
+from datetime import date, datetime, time
+
+from django.db import connection, transaction
+from django.utils import timezone
+
+from apps.stats.models import PersonalBest
+from .models import ClientSessionKey, SessionOutbox, TypingEvent, TypingEventBlob, TypingSession
+
+
+DEFAULT_MONTHS_AHEAD = 3
+# 파티션 생성/정리를 직렬화하는 pg_advisory_xact_lock 키 (트랜잭션 종료 시 자동 해제)
+PARTITION_LOCK_KEY = 0x7479706570617274
+
+
+def _table():
+    return TypingSession._meta.db_table
+
+
+def _quote(name):
+    return connection.ops.quote_name(name)
+
+
+def add_months(month, months):
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def month_start(day):
+    return date(day.year, day.month, 1)
+
+
+def month_bounds(month):
+    """월 파티션의 [시작, 끝) 시각 (Asia/Seoul 자정)"""
+    tz = timezone.get_current_timezone()
+    start = timezone.make_aware(datetime.combine(month, time.min), tz)
+    end = timezone.make_aware(datetime.combine(add_months(month, 1), time.min), tz)
+    return start, end
+
+
+def partition_name(month):
+    return f'{_table()}_p{month:%Y%m}'
+
+
+def default_partition_name():
+    return f'{_table()}_default'
+
+
+def list_partitions():
+    """월 파티션 목록 [(월 시작일, 파티션 이름)] (default 제외, 월 순)"""
+    pattern = re.compile(re.escape(_table()) + r'_p(\d{4})(\d{2})$')
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT child.relname
+            FROM pg_inherits
+            JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+            WHERE pg_inherits.inhparent = %s::regclass
+            """,
+            [_table()],
+        )
+        names = [row[0] for row in cursor.fetchall()]
+
+    partitions = []
+    for name in names:
+        match = pattern.match(name)
+        if match:
+            partitions.append((date(int(match.group(1)), int(match.group(2)), 1), name))
+    return sorted(partitions)
+
+
+def create_partition(month):
+    """
+    월 파티션 생성 (이미 있으면 False)
+
+    default 파티션에 그 달 세션이 들어와 있으면 새 테이블로 옮긴 뒤 ATTACH한다.
+    다른 워커와 겹치지 않도록 락을 잡은 뒤 존재 여부를 다시 확인한다.
+    """
+    name = partition_name(month)
+    if any(existing == name for _, existing in list_partitions()):
+        return False
+
+    start, end = month_bounds(month)
+    table, default = _quote(_table()), _quote(default_partition_name())
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute('SELECT pg_advisory_xact_lock(%s)', [PARTITION_LOCK_KEY])
+        if any(existing == name for _, existing in list_partitions()):
+            return False
+        cursor.execute(
+            f'SELECT EXISTS (SELECT 1 FROM {default} WHERE started_at >= %s AND started_at < %s)',
+            [start, end],
+        )
+        if not cursor.fetchone()[0]:
+            cursor.execute(
+                f'CREATE TABLE {_quote(name)} PARTITION OF {table} FOR VALUES FROM (%s) TO (%s)',
+                [start, end],
+            )
+            return True
+
+        cursor.execute(f'CREATE TABLE {_quote(name)} (LIKE {table} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)')
+        cursor.execute(
+            f"""
+            WITH moved AS (
+                DELETE FROM {default} WHERE started_at >= %s AND started_at < %s RETURNING *
+            )
+            INSERT INTO {_quote(name)} SELECT * FROM moved
+            """,
+            [start, end],
+        )
+        cursor.execute(
+            f'ALTER TABLE {table} ATTACH PARTITION {_quote(name)} FOR VALUES FROM (%s) TO (%s)',
+            [start, end],
+        )
+    return True
+
+
+def ensure_partitions(months_ahead=DEFAULT_MONTHS_AHEAD, today=None):
+    """이번 달부터 months_ahead개월 뒤까지 파티션 생성. 반환값: 생성한 파티션 이름 목록"""
+    current = month_start(today or timezone.localdate())
+    created = []
+    for offset in range(months_ahead + 1):
+        month = add_months(current, offset)
+        if create_partition(month):
+            created.append(partition_name(month))
+    return created
+
+
+def expired_partitions(retain_months, today=None):
+    """보존 기간(이번 달 포함 retain_months개월) 이전의 월 파티션 [(월, 이름)]"""
+    cutoff = add_months(month_start(today or timezone.localdate()), -(retain_months - 1))
+    return [(month, name) for month, name in list_partitions() if month < cutoff]
+
+
+def expire_partitions(retain_months, drop=False, today=None):
+    """
+    보존 기간이 지난 파티션 분리 또는 삭제
+
+    분리(detach)한 파티션은 일반 테이블로 남아 보관/내보내기에 쓸 수 있다.
+    어느 쪽이든 세션 테이블에서 빠지므로 클라이언트 키는 지우고 최고 기록은 세션 연결만 해제하며,
+    삭제(drop) 시에는 DB FK가 없으므로 이벤트/블롭/아웃박스 행도 먼저 지운다.
+    반환값: 처리한 파티션 이름 목록
+    """
+    table = _quote(_table())
+    handled = []
+    for _, name in expired_partitions(retain_months, today):
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute('SELECT pg_advisory_xact_lock(%s)', [PARTITION_LOCK_KEY])
+            if not any(existing == name for _, existing in list_partitions()):
+                continue
+            cursor.execute(f'ALTER TABLE {table} DETACH PARTITION {_quote(name)}')
+            # 남은 키로 재전송이 들어오면 세션 없이 키 PK만 충돌하므로 함께 정리
+            cursor.execute(
+                f'DELETE FROM {_quote(ClientSessionKey._meta.db_table)} '
+                f'WHERE session_id IN (SELECT id FROM {_quote(name)})'
+            )
+            cursor.execute(
+                f'UPDATE {_quote(PersonalBest._meta.db_table)} SET session_id = NULL '
+                f'WHERE session_id IN (SELECT id FROM {_quote(name)})'
+            )
+            if drop:
+                for model in (TypingEvent, TypingEventBlob, SessionOutbox):
+                    cursor.execute(
+                        f'DELETE FROM {_quote(model._meta.db_table)} '
+                        f'WHERE session_id IN (SELECT id FROM {_quote(name)})'
+                    )
+                cursor.execute(f'DROP TABLE {_quote(name)}')
+        handled.append(name)
+    return handled
@@ -0,0 +1,147 @@
+"""
+sessions 서버 점수 계산
+
+제출된 키 입력 이벤트 배열과 text_content로 wpm/정확도/cpm/오타 수를 한 번의
+벡터 연산으로 다시 계산한다. 위치별 마지막 입력을 최종 입력으로 보고 원문과 비교하므로
+클라이언트(useTypingEngine)의 계산 방식과 같은 기준이며, 제출값과 허용 오차 이상
+차이 나는 지표는 score_check.diverged에 남긴다.
+"""
+from decimal import Decimal
+
+import numpy as np
+
+from .eventpack import events_to_arrays
+
+
+# 지표별 허용 오차: (절대값, 비율) 중 큰 쪽
+DIVERGENCE_TOLERANCE = {
+    'wpm': (2, 0.10),
+    'cpm': (10, 0.10),
+    'accuracy': (2, 0),
+    'error_count': (1, 0.05),
+    'duration_ms': (500, 0.10),
+}
+
+SCORED_FIELDS = [
+    'duration_ms', 'input_length', 'correct_length', 'error_count',
+    'accuracy', 'wpm', 'cpm', 'score_status', 'score_check',
+]
+
+
+_WHITESPACE = np.array([ord(ch) for ch in ' \t\n\r'], dtype=np.uint32)
+
+
+def _text_codes(text):
+    return np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32)
+
+
+def score_arrays(arrays, text_content, claimed_duration_ms=0):
+    """
+    이벤트 열 배열 → 서버 계산 지표 dict
+
+    duration_ms는 마지막 이벤트 시각(세션 시작 기준), 이벤트 시각이 없으면 제출값 사용
+    """
+    positions = arrays['position']
+    count = len(positions)
+    duration_ms = int(arrays['t_ms'].max()) if count else 0
+    if duration_ms <= 0:
+        duration_ms = claimed_duration_ms
+
+    input_length = correct_length = words = 0
+    if count:
+        # 위치별 마지막 이벤트 = 최종 입력 (빈 입력은 지운 것으로 처리)
+        reversed_positions = positions[::-1]
+        final_positions, reversed_index = np.unique(reversed_positions, return_index=True)
+        last = count - 1 - reversed_index
+        typed = arrays['typed'][last]
+        kept = arrays['typed_len'][last] > 0
+        final_positions = final_positions[kept]
+        typed = typed[kept]
+
+        text = _text_codes(text_content)
+        in_range = (final_positions >= 0) & (final_positions < len(text))
+        target = np.zeros(len(final_positions), dtype=np.uint32)
+        target[in_range] = text[final_positions[in_range]]
+
+        input_length = int(len(final_positions))
+        correct_length = int(np.count_nonzero(in_range & (typed == target)))
+
+        # 입력 문자열의 단어 수 (공백이 아닌 연속 구간 수)
+        is_word = ~np.isin(typed, _WHITESPACE)
+        words = int(np.count_nonzero(is_word[1:] & ~is_word[:-1])) + int(is_word[:1].sum())
+
+    minutes = duration_ms / 60000
+    return {
+        'duration_ms': duration_ms,
+        'input_length': input_length,
+        'correct_length': correct_length,
+        'error_count': input_length - correct_length,
+        'accuracy': round(correct_length / input_length * 100, 2) if input_length else 100.0,
+        'wpm': round(words / minutes, 2) if minutes else 0.0,
+        'cpm': round(correct_length / minutes, 2) if minutes else 0.0,
+    }
+
+
+def _diverges(field, claimed, server):
+    if claimed is None:
+        return False
+    absolute, ratio = DIVERGENCE_TOLERANCE[field]
+    return abs(float(claimed) - float(server)) > max(absolute, abs(float(server)) * ratio)
+
+
+def apply_server_score(session, arrays):
+    """
+    세션 인스턴스에 서버 계산 지표를 덮어쓰고 검증 상태 기록 (저장은 호출자가)
+    반환값: 차이가 큰 지표 목록
+    """
+    scored = score_arrays(arrays, session.text_content, session.duration_ms)
+    claimed = {field: getattr(session, field) for field in DIVERGENCE_TOLERANCE}
+    diverged = [field for field in DIVERGENCE_TOLERANCE if _diverges(field, claimed[field], scored[field])]
+
+    session.duration_ms = scored['duration_ms']
+    session.input_length = scored['input_length']
+    session.correct_length = scored['correct_length']
+    session.error_count = scored['error_count']
+    session.accuracy = Decimal(str(scored['accuracy']))
+    session.wpm = Decimal(str(min(scored['wpm'], 9999.99)))
+    session.cpm = Decimal(str(min(scored['cpm'], 9999.99)))
+    session.score_status = 'flagged' if diverged else 'verified'
+    session.score_check = {
+        'claimed': {field: float(value) if value is not None else None for field, value in claimed.items()},
+        'diverged': diverged,
+    }
+    return diverged
+
+
+def score_session_events(session, events):
+    """제출된 이벤트 dict 목록으로 서버 점수 적용 (이벤트가 없으면 미검증 유지)"""
+    if not events:
+        return None
+    return apply_server_score(session, events_to_arrays(events))
+
+
+def rescore_sessions(sessions):
+    """
+    저장된 이벤트로 세션 묶음 재계산 후 일괄 저장 (백필용)
+    바뀐 점수로 일일/주간·월간/누적 통계와 개인 최고 기록도 같은 트랜잭션에서 다시 계산한다.
+    반환값: (재계산 수, 불일치 수, 누적 통계를 다시 계산하지 못한 보관 사용자 ID 집합)
+    """
+    from django.db import transaction
+    from apps.stats.services import rebuild_session_rollups
+    from .event_store import load_event_arrays
+    from .models import TypingSession
+
+    sessions = list(sessions)
+    arrays = load_event_arrays([session.id for session in sessions])
+    scored = []
+    flagged = 0
+    for session in sessions:
+        if session.id not in arrays:
+            continue
+        if apply_server_score(session, arrays[session.id]):
+            flagged += 1
+        scored.append(session)
+    with transaction.atomic():
+        TypingSession.objects.bulk_update(scored, SCORED_FIELDS)
+        skipped = rebuild_session_rollups(scored)
+    return len(scored), flagged, skipped
@@ -1,5 +1,8 @@
 from rest_framework import serializers
+from apps.texts.hangul import keystrokes_per_minute
+from .event_store import save_events
 from .models import TypingSession, TypingEvent
+from .scoring import score_session_events
 
 
 class TypingEventSerializer(serializers.ModelSerializer):
@@ -8,6 +11,11 @@ class TypingEventSerializer(serializers.ModelSerializer):
     class Meta:
         model = TypingEvent
         fields = ['id', 't_ms', 'expected', 'typed', 'is_correct', 'position']
+        # 공백 입력도 한 글자 (앞뒤 공백 제거 시 지운 것으로 계산됨)
+        extra_kwargs = {
+            'expected': {'trim_whitespace': False},
+            'typed': {'trim_whitespace': False},
+        }
 
 
 class TypingSessionSerializer(serializers.ModelSerializer):
@@ -15,6 +23,8 @@ class TypingSessionSerializer(serializers.ModelSerializer):
     username = serializers.CharField(source='user.username', read_only=True, default='Guest')
     mode_display = serializers.CharField(source='get_mode_display', read_only=True)
     language_display = serializers.CharField(source='get_language_display', read_only=True)
+    kpm = serializers.SerializerMethodField()
+    text_content = serializers.CharField(read_only=True)
     
     class Meta:
         model = TypingSession
@@ -23,24 +33,44 @@ class TypingSessionSerializer(serializers.ModelSerializer):
             'mode', 'mode_display', 'language', 'language_display', 'text_content',
             'started_at', 'ended_at', 'duration_ms',
             'input_length', 'correct_length', 'error_count',
-            'accuracy', 'wpm', 'cpm', 'metadata', 'guest_session_id',
-            'created_at', 'updated_at'
+            'accuracy', 'wpm', 'cpm', 'kpm', 'score_status', 'score_check',
+            'metadata', 'guest_session_id', 'client_session_id', 'created_at', 'updated_at'
         ]
-        read_only_fields = ['id', 'user', 'created_at', 'updated_at']
+        read_only_fields = ['id', 'user', 'score_status', 'score_check', 'created_at', 'updated_at']
+    
+    def get_kpm(self, obj):
+        """서버 계산 분당 타수 (2벌식 기준, 한글은 자모 입력 수로 계산)"""
+        return keystrokes_per_minute(obj.text_content, obj.duration_ms)
 
 
 class TypingSessionCreateSerializer(serializers.ModelSerializer):
     """세션 생성 직렬화"""
     events = TypingEventSerializer(many=True, required=False, write_only=True)
+    # 재전송은 뷰에서 기존 세션을 돌려주므로 유일성 검증으로 막지 않음
+    client_session_id = serializers.UUIDField(required=False, allow_null=True)
+    # 모델에서는 SessionText로 중복 제거해 저장하는 속성
+    text_content = serializers.CharField(style={'base_template': 'textarea.html'})
     
     class Meta:
         model = TypingSession
         fields = [
-            'pack', 'text_item', 'mode', 'language', 'text_content',
+            'id', 'pack', 'text_item', 'mode', 'language', 'text_content',
             'started_at', 'ended_at', 'duration_ms',
             'input_length', 'correct_length', 'error_count',
-            'accuracy', 'wpm', 'cpm', 'metadata', 'guest_session_id', 'events'
+            'accuracy', 'wpm', 'cpm', 'metadata', 'guest_session_id',
+            'client_session_id', 'events'
         ]
+        read_only_fields = ['id']
+    
+    def build_instance(self):
+        """검증된 데이터로 저장 전 세션 생성 (bulk_create용, events 제외)"""
+        validated_data = {key: value for key, value in self.validated_data.items() if key != 'events'}
+        request = self.context.get('request')
+        
+        if request and request.user.is_authenticated:
+            validated_data['user'] = request.user
+        
+        return TypingSession(**validated_data)
     
     def create(self, validated_data):
         events_data = validated_data.pop('events', [])
@@ -49,17 +79,20 @@ class TypingSessionCreateSerializer(serializers.ModelSerializer):
         if request and request.user.is_authenticated:
             validated_data['user'] = request.user
         
-        session = super().create(validated_data)
+        # 이벤트가 있으면 wpm/정확도/cpm/오타 수는 서버 계산값으로 저장
+        session = TypingSession(**validated_data)
+        score_session_events(session, events_data)
+        session.save()
         
-        # 이벤트 저장 (옵션: 비활성화하려면 이 부분을 주석 처리)
-        # for event_data in events_data:
-        #     TypingEvent.objects.create(session=session, **event_data)
+        # 이벤트 저장 (settings.TYPING_EVENT_STORAGE: packed/rows/off)
+        save_events([(session, events_data)])
         
         return session
 
 
 class TypingSessionListSerializer(serializers.ModelSerializer):
     """세션 목록 직렬화"""
+    text_content = serializers.CharField(read_only=True)
     
     class Meta:
         model = TypingSession
@@ -0,0 +1,90 @@
+"""
+sessions 연습 문장 저장소 - 내용 해시로 중복 제거한 SessionText 연결
+
+세션마다 문장 전체를 복사하지 않고, 같은 내용은 SessionText 한 행을 참조한다.
+새 문장은 INSERT ... ON CONFLICT (content_hash) DO NOTHING으로 넣으므로
+동시에 같은 문장을 저장해도 한 행만 남는다.
+"""
+import hashlib
+
+from django.db import connection
+from psycopg2.extras import execute_values
+
+from .models import SessionText, TypingSession
+
+
+CHUNK_SIZE = 1000
+
+
+def content_hash(content):
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+
+def intern_texts(contents):
+    """
+    문장 목록을 SessionText에 넣고 {내용: SessionText id} 반환
+    이미 있는 문장은 조회만 하고, 없는 문장만 한 번의 upsert로 넣는다.
+    """
+    by_hash = {content_hash(content): content for content in set(contents)}
+    if not by_hash:
+        return {}
+
+    ids = dict(SessionText.objects.filter(content_hash__in=by_hash).values_list('content_hash', 'id'))
+    missing = [(digest, content) for digest, content in by_hash.items() if digest not in ids]
+    if missing:
+        table = connection.ops.quote_name(SessionText._meta.db_table)
+        sql = (
+            f'INSERT INTO {table} (content_hash, content, created_at) VALUES %s '
+            f'ON CONFLICT (content_hash) DO UPDATE SET content_hash = EXCLUDED.content_hash '
+            f'RETURNING content_hash, id'
+        )
+        with connection.cursor() as cursor:
+            # 동시 저장으로 충돌한 행도 id를 돌려받도록 DO UPDATE (값은 그대로)
+            rows = execute_values(
+                cursor.cursor, sql, missing, template='(%s, %s, now())', page_size=len(missing), fetch=True
+            )
+        ids.update(rows)
+    return {content: ids[digest] for digest, content in by_hash.items()}
+
+
+def attach_texts(sessions):
+    """text_content를 설정한 세션들을 SessionText에 연결 (저장 전 호출, bulk_create용)"""
+    pending = [session for session in sessions if session._pending_text is not None]
+    ids = intern_texts(session._pending_text for session in pending)
+    texts = {content: SessionText(id=text_id, content=content) for content, text_id in ids.items()}
+    for session in pending:
+        # 저장 직후 응답 직렬화에서 다시 조회하지 않도록 관계 캐시까지 채움
+        session.text = texts[session._pending_text]
+        session.legacy_text_content = None
+        session._pending_text = None
+    return sessions
+
+
+def backfill_texts(chunk_size=CHUNK_SIZE):
+    """
+    legacy text_content 열에 문장이 남은 세션을 묶음 단위로 SessionText로 옮김
+    반환값: 묶음마다 (옮긴 세션 수) - 제너레이터
+    """
+    table = connection.ops.quote_name(TypingSession._meta.db_table)
+    queryset = TypingSession.objects.filter(text__isnull=True, legacy_text_content__isnull=False)
+    last_id = 0
+    while True:
+        rows = list(
+            queryset.filter(id__gt=last_id).order_by('id').values_list('id', 'started_at', 'legacy_text_content')[:chunk_size]
+        )
+        if not rows:
+            break
+        last_id = rows[-1][0]
+
+        ids = intern_texts(content for _, _, content in rows)
+        sql = (
+            f'UPDATE {table} AS t SET text_id = v.text_id, text_content = NULL '
+            f'FROM (VALUES %s) AS v (id, started_at, text_id) '
+            f'WHERE t.id = v.id AND t.started_at = v.started_at'
+        )
+        values = [(session_id, started_at, ids[content]) for session_id, started_at, content in rows]
+        with connection.cursor() as cursor:
+            execute_values(
+                cursor.cursor, sql, values, template='(%s, %s::timestamptz, %s)', page_size=len(values)
+            )
+        yield len(rows)
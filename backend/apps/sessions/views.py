@@ -1,24 +1,48 @@
-from rest_framework import viewsets, permissions, status
+from rest_framework import mixins, viewsets, permissions, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
-from django.db.models import Avg, Max, Sum, Count
-from django.utils import timezone
-from datetime import date
-from .models import TypingSession
+from django.db import IntegrityError, transaction
+from django.db.models import Avg, Max, Sum, Count, Q
+from apps.leaderboard.live import record_session, record_sessions
+from apps.stats.services import (
+    EMPTY_USER_STATS,
+    bump_user_stats_version,
+    get_user_stats,
+    record_session_rollups,
+)
+from .archive import SessionArchiveReader
+from .event_store import save_events
+from .metadata import FILTER_PARAMS, filter_metadata, metadata_filters, project_metadata
+from .models import ClientSessionKey, TypingSession
+from .outbox import enqueue_session, enqueue_sessions
+from .pagination import SessionCursorPagination
+from .scoring import score_session_events
 from .serializers import (
     TypingSessionSerializer, 
     TypingSessionCreateSerializer,
     TypingSessionListSerializer,
     UserStatsSerializer
 )
+from .text_store import attach_texts
+
 
+BULK_CREATE_MAX = 100
 
-class TypingSessionViewSet(viewsets.ModelViewSet):
-    """타자 세션 API"""
+
+class TypingSessionViewSet(mixins.CreateModelMixin,
+                           mixins.RetrieveModelMixin,
+                           mixins.ListModelMixin,
+                           viewsets.GenericViewSet):
+    """
+    타자 세션 API
+    
+    세션은 저장 후 변경/삭제하지 않는다 (누적/기간 통계와 최고 기록은 저장 시점에만 증분 반영).
+    """
     permission_classes = [permissions.AllowAny]
+    pagination_class = SessionCursorPagination
     
     def get_queryset(self):
-        queryset = TypingSession.objects.all()
+        queryset = TypingSession.objects.select_related('text')
         
         # 로그인한 사용자는 자신의 기록만
         if self.request.user.is_authenticated:
@@ -39,98 +63,226 @@ class TypingSessionViewSet(viewsets.ModelViewSet):
             queryset = queryset.filter(language=language)
         if mode:
             queryset = queryset.filter(mode=mode)
+        # metadata 투영 열 필터 (?submode=time_attack&keyboard_layout=...)
+        queryset = filter_metadata(queryset, metadata_filters(self.request.query_params))
         
-        return queryset.order_by('-started_at')
+        return queryset.order_by('-started_at', '-id')
+    
+    def get_archive_reader(self):
+        """기록 목록에 이어 붙일 보관 세션 리더 (보관은 로그인 사용자 세션만)"""
+        if self.action != 'list' or not self.request.user.is_authenticated:
+            return None
+        return SessionArchiveReader(
+            self.request.user.id,
+            language=self.request.query_params.get('language'),
+            mode=self.request.query_params.get('mode'),
+            metadata=metadata_filters(self.request.query_params),
+        )
     
     def get_serializer_class(self):
-        if self.action == 'create':
+        if self.action in ('create', 'bulk'):
             return TypingSessionCreateSerializer
         if self.action == 'list':
             return TypingSessionListSerializer
         return TypingSessionSerializer
     
-    def perform_create(self, serializer):
-        session = serializer.save()
+    def create(self, request, *args, **kwargs):
+        """
+        세션 생성
+        
+        client_session_id가 이미 저장된 세션이면 후처리 없이 기존 세션을 200으로 반환한다.
+        """
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        client_session_id = serializer.validated_data.get('client_session_id')
         
-        # 스트릭 업데이트 (로그인 사용자만)
+        guest_session_id = serializer.validated_data.get('guest_session_id')
+        if client_session_id:
+            replay = self._replayed_response(client_session_id, guest_session_id)
+            if replay is not None:
+                return replay
+        
+        try:
+            self.perform_create(serializer)
+        except IntegrityError:
+            # 같은 UUID 동시 제출 - 먼저 저장된 쪽을 반환
+            if not client_session_id:
+                raise
+            return self._replayed_response(client_session_id, guest_session_id)
+        
+        headers = self.get_success_headers(serializer.data)
+        return Response(serializer.data, status=status.HTTP_201_CREATED, headers=headers)
+    
+    def _owns(self, session, guest_session_id):
+        """저장된 세션이 요청자 것인지 (게스트는 같은 guest_session_id로 제출한 경우만)"""
         if self.request.user.is_authenticated:
-            self._update_daily_stats(session)
-            self._update_streak(session)
+            return session.user_id == self.request.user.id
+        return session.user_id is None and bool(guest_session_id) and session.guest_session_id == guest_session_id
     
-    def _update_daily_stats(self, session):
-        """일일 통계 업데이트 (write-through)"""
-        from apps.stats.models import UserDaily
-        
-        today = timezone.localdate()
-        user_daily, created = UserDaily.objects.get_or_create(
-            user=session.user,
-            date=today,
-            language=session.language,
-            defaults={
-                'total_sessions': 0,
-                'total_duration_ms': 0,
-                'avg_wpm': 0,
-                'avg_accuracy': 0,
-            }
-        )
+    def _replayed_response(self, client_session_id, guest_session_id=None):
+        """이미 저장된 client_session_id면 기존 세션 응답 (다른 사용자/게스트의 ID면 409)"""
+        key = ClientSessionKey.objects.select_related('session').filter(pk=client_session_id).first()
+        if key is None:
+            return None
+        session = key.session
+        if not self._owns(session, guest_session_id):
+            return Response(
+                {'detail': '이미 사용된 client_session_id입니다.'},
+                status=status.HTTP_409_CONFLICT
+            )
+        return Response(self.get_serializer(session).data, status=status.HTTP_200_OK)
+    
+    def perform_create(self, serializer):
+        # 누적 통계는 같은 트랜잭션에서 갱신, 일일 통계/스트릭/뱃지/챌린지는 run_worker가 아웃박스로 처리
+        with transaction.atomic():
+            session = serializer.save()
+            if session.client_session_id:
+                # 파티션 테이블에는 UUID 단독 유니크 인덱스를 둘 수 없어 키 테이블로 중복 차단
+                ClientSessionKey.objects.create(client_session_id=session.client_session_id, session=session)
+            record_session_rollups([session])
+            enqueue_session(session)
+            transaction.on_commit(lambda: bump_user_stats_version([session.user_id]))
+            # 실시간 순위 인덱스는 커밋 후 메모리에서 바로 반영 (조회 시 DB를 읽지 않도록)
+            transaction.on_commit(lambda: record_session(session))
+    
+    @action(detail=False, methods=['post'])
+    def bulk(self, request):
+        """
+        세션 일괄 제출 (오프라인 동기화/교실용)
         
-        # 업데이트
-        user_daily.total_sessions += 1
-        user_daily.total_duration_ms += session.duration_ms
-        user_daily.total_chars += session.input_length
-        user_daily.total_errors += session.error_count
-        
-        # 평균 재계산 (간단 버전)
-        sessions_today = TypingSession.objects.filter(
-            user=session.user, 
-            language=session.language,
-            started_at__date=today
-        )
-        agg = sessions_today.aggregate(
-            avg_wpm=Avg('wpm'),
-            avg_accuracy=Avg('accuracy'),
-            best_wpm=Max('wpm'),
-            best_accuracy=Max('accuracy'),
-        )
-        user_daily.avg_wpm = agg.get('avg_wpm') or 0
-        user_daily.avg_accuracy = agg.get('avg_accuracy') or 0
-        user_daily.best_wpm = agg.get('best_wpm')
-        user_daily.best_accuracy = agg.get('best_accuracy')
-        user_daily.save()
+        항목별로 검증해 통과한 세션만 한 번에 저장하고, 항목별 결과를 반환한다.
+        후처리는 아웃박스에서 (사용자, 날짜, 언어) 단위로 묶어 반영된다.
+        """
+        items = request.data.get('sessions') if isinstance(request.data, dict) else request.data
+        if not isinstance(items, list) or not items:
+            return Response(
+                {'detail': '세션 목록이 필요합니다.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if len(items) > BULK_CREATE_MAX:
+            return Response(
+                {'detail': f'한 번에 최대 {BULK_CREATE_MAX}개까지 제출할 수 있습니다.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        results = [None] * len(items)
+        valid = []
+        events_by_session = {}
+        for index, item in enumerate(items):
+            serializer = self.get_serializer(data=item)
+            if serializer.is_valid():
+                session = serializer.build_instance()
+                events = serializer.validated_data.get('events', [])
+                score_session_events(session, events)
+                events_by_session[id(session)] = events
+                valid.append((index, session))
+            else:
+                results[index] = {'index': index, 'status': 'error', 'errors': serializer.errors}
+        
+        for attempt in range(2):
+            pending = self._skip_replayed(valid, results)
+            try:
+                with transaction.atomic():
+                    sessions = TypingSession.objects.bulk_create(
+                        project_metadata(attach_texts([session for _, session in pending]))
+                    )
+                    ClientSessionKey.objects.bulk_create([
+                        ClientSessionKey(client_session_id=session.client_session_id, session=session)
+                        for session in sessions if session.client_session_id
+                    ])
+                    save_events((session, events_by_session[id(session)]) for session in sessions)
+                    record_session_rollups(sessions)
+                    enqueue_sessions(sessions)
+                    transaction.on_commit(
+                        lambda: bump_user_stats_version(session.user_id for session in sessions)
+                    )
+                    transaction.on_commit(lambda: record_sessions(sessions))
+                break
+            except IntegrityError:
+                # 같은 UUID가 동시에 저장됨 - 다시 걸러서 한 번 더 시도
+                if attempt:
+                    raise
+        
+        for (index, _), session in zip(pending, sessions):
+            results[index] = {'index': index, 'status': 'created', 'id': session.id}
+        for result in results:
+            if 'of' in result:
+                # 목록 안에서 반복된 항목은 처음 저장된 세션 ID로
+                result['id'] = results[result.pop('of')]['id']
+        
+        counts = {'created': 0, 'duplicate': 0, 'error': 0}
+        for result in results:
+            counts[result['status']] += 1
+        
+        if counts['error'] == len(items):
+            response_status = status.HTTP_400_BAD_REQUEST
+        elif counts['error']:
+            response_status = status.HTTP_207_MULTI_STATUS
+        elif counts['created']:
+            response_status = status.HTTP_201_CREATED
+        else:
+            response_status = status.HTTP_200_OK
+        
+        return Response({
+            'created': counts['created'],
+            'duplicate': counts['duplicate'],
+            'failed': counts['error'],
+            'results': results,
+        }, status=response_status)
     
-    def _update_streak(self, session):
-        """스트릭 업데이트"""
-        from apps.goals.models import UserStreak
+    def _skip_replayed(self, valid, results):
+        """이미 저장됐거나 목록 안에서 반복된 client_session_id 항목을 결과에 표시하고 제외"""
+        client_ids = {session.client_session_id for _, session in valid if session.client_session_id}
+        stored = {
+            key.client_session_id: key.session
+            for key in ClientSessionKey.objects.select_related('session').filter(pk__in=client_ids)
+        } if client_ids else {}
         
-        streak, created = UserStreak.objects.get_or_create(user=session.user)
-        streak.update_streak(timezone.localdate())
+        pending = []
+        seen = {}
+        for index, session in valid:
+            client_id = session.client_session_id
+            existing = stored.get(client_id) if client_id else None
+            if existing is not None:
+                if self._owns(existing, session.guest_session_id):
+                    results[index] = {'index': index, 'status': 'duplicate', 'id': existing.id}
+                else:
+                    results[index] = {
+                        'index': index, 'status': 'error',
+                        'errors': {'client_session_id': ['이미 사용된 client_session_id입니다.']},
+                    }
+            elif client_id and client_id in seen:
+                results[index] = {'index': index, 'status': 'duplicate', 'of': seen[client_id]}
+            else:
+                if client_id:
+                    seen[client_id] = index
+                pending.append((index, session))
+        return pending
     
     @action(detail=False, methods=['get'])
     def stats(self, request):
-        """사용자 통계 조회"""
-        queryset = self.get_queryset()
-        
-        if not queryset.exists():
-            return Response({
-                'total_sessions': 0,
-                'avg_wpm': 0,
-                'avg_accuracy': 0,
-                'best_wpm': None,
-                'total_time_ms': 0,
-                'korean_sessions': 0,
-                'english_sessions': 0,
-            })
-        
-        stats = queryset.aggregate(
+        """
+        사용자 통계 조회
+        
+        필터 없는 로그인 사용자 요청은 누적 통계(UserLifetimeStats) 캐시로 응답하고,
+        게스트/필터 요청은 조건부 집계 쿼리 한 번으로 계산한다.
+        필터 요청은 세션 테이블만 집계하므로 보관(archive_sessions)된 세션은 포함하지 않는다.
+        """
+        filtered = any(request.query_params.get(key) for key in ('language', 'mode', *FILTER_PARAMS))
+        if request.user.is_authenticated and not filtered:
+            return Response(UserStatsSerializer(get_user_stats(request.user.id)).data)
+        
+        stats = self.get_queryset().order_by().aggregate(
             total_sessions=Count('id'),
             avg_wpm=Avg('wpm'),
             avg_accuracy=Avg('accuracy'),
             best_wpm=Max('wpm'),
             total_time_ms=Sum('duration_ms'),
+            korean_sessions=Count('id', filter=Q(language='ko')),
+            english_sessions=Count('id', filter=Q(language='en')),
         )
-        
-        stats['korean_sessions'] = queryset.filter(language='ko').count()
-        stats['english_sessions'] = queryset.filter(language='en').count()
+        if not stats['total_sessions']:
+            stats = EMPTY_USER_STATS
         
         serializer = UserStatsSerializer(stats)
         return Response(serializer.data)
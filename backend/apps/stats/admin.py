@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import UserDaily
+from .models import UserDaily, UserWeekly, UserMonthly, KeystrokeProfile, UserLifetimeStats, PersonalBest
 
 
 @admin.register(UserDaily)
@@ -10,3 +10,40 @@ class UserDailyAdmin(admin.ModelAdmin):
     ordering = ['-date']
     date_hierarchy = 'date'
     readonly_fields = ['created_at', 'updated_at']
+
+
+@admin.register(UserWeekly, UserMonthly)
+class PeriodStatsAdmin(admin.ModelAdmin):
+    list_display = ['user', 'period_start', 'language', 'mode', 'total_sessions', 'avg_wpm', 'avg_accuracy', 'best_wpm']
+    list_filter = ['language', 'mode', 'period_start']
+    search_fields = ['user__username']
+    ordering = ['-period_start']
+    date_hierarchy = 'period_start'
+    readonly_fields = ['created_at', 'updated_at']
+
+
+@admin.register(KeystrokeProfile)
+class KeystrokeProfileAdmin(admin.ModelAdmin):
+    list_display = ['user', 'language', 'kind', 'key', 'total_count', 'error_rate', 'latency_mean', 'latency_p90']
+    list_filter = ['language', 'kind']
+    search_fields = ['user__username', 'key']
+    ordering = ['user', 'language', 'kind', '-error_rate']
+    exclude = ['latency_histogram']
+    readonly_fields = ['updated_at']
+
+
+@admin.register(UserLifetimeStats)
+class UserLifetimeStatsAdmin(admin.ModelAdmin):
+    list_display = ['user', 'total_sessions', 'korean_sessions', 'english_sessions', 'best_wpm', 'updated_at']
+    search_fields = ['user__username']
+    ordering = ['-total_sessions']
+    readonly_fields = ['created_at', 'updated_at']
+
+
+@admin.register(PersonalBest)
+class PersonalBestAdmin(admin.ModelAdmin):
+    list_display = ['user', 'language', 'mode', 'text_item', 'best_wpm', 'best_accuracy', 'session_count', 'achieved_at']
+    list_filter = ['language', 'mode']
+    search_fields = ['user__username']
+    raw_id_fields = ['text_item', 'session']
+    readonly_fields = ['updated_at']
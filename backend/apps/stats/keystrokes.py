@@ -0,0 +1,184 @@
+"""
+stats 키 입력 분석 - 글자/바이그램별 오타율·입력 간격 프로필
+
+세션 이벤트(apps.sessions.event_store.load_event_arrays의 열 배열)를 NumPy로
+한 번에 그룹 집계한 뒤, 저장된 KeystrokeProfile 행에 병렬 Welford 공식으로 합친다.
+기존 세션을 다시 읽지 않으므로 세션 수가 늘어도 갱신 비용은 세션 크기에만 비례한다.
+
+- 글자 키: 기대 문자 (첫 코드포인트, 공백 제외)
+- 바이그램 키: 직전 기대 문자 + 현재 기대 문자 (세션 경계는 잇지 않음)
+- 입력 간격: 직전 이벤트와의 t_ms 차이, MAX_LATENCY_MS 초과는 쉬는 시간으로 보고 제외
+"""
+from array import array
+
+import numpy as np
+from django.db import transaction
+
+from .models import KeystrokeProfile
+
+
+# 입력 간격 히스토그램 구간 상한 (ms) - 마지막 구간은 상한 이상 ~ MAX_LATENCY_MS
+LATENCY_BUCKETS_MS = [50, 75, 100, 125, 150, 175, 200, 250, 300, 350, 400, 500, 650, 800, 1000, 1500]
+MAX_LATENCY_MS = 2000
+HISTOGRAM_SIZE = len(LATENCY_BUCKETS_MS) + 1
+
+_BUCKET_EDGES = np.array(LATENCY_BUCKETS_MS, dtype=np.float64)
+_SPACE = 0x20
+_BIGRAM_SHIFT = 21  # 유니코드 코드포인트 최대 21비트
+
+PROFILE_UPDATE_FIELDS = [
+    'total_count', 'error_count', 'error_rate',
+    'latency_count', 'latency_mean', 'latency_m2', 'latency_p90', 'latency_histogram',
+]
+
+
+def _session_columns(arrays):
+    """세션 하나 → (글자 키, 바이그램 키, 오타 여부, 간격, 간격 유효 여부, 바이그램 유효 여부)"""
+    codes = arrays['expected'].astype(np.uint64)
+    is_error = ~arrays['is_correct']
+    latency = np.empty(len(codes), dtype=np.float64)
+    latency[0:1] = np.nan
+    latency[1:] = np.diff(arrays['t_ms'])
+    has_latency = (latency > 0) & (latency <= MAX_LATENCY_MS)
+
+    present = (codes != 0) & (codes != _SPACE)
+    previous = np.empty_like(codes)
+    previous[0:1] = 0
+    previous[1:] = codes[:-1]
+    bigram_present = present & (previous != 0) & (previous != _SPACE)
+    bigrams = (previous << np.uint64(_BIGRAM_SHIFT)) | codes
+
+    return codes, present, bigrams, bigram_present, is_error, latency, has_latency
+
+
+def _group(keys, is_error, latency, has_latency):
+    """키별 집계 (입력 수, 오타 수, 간격 수/평균/제곱편차 합, 히스토그램)"""
+    unique, inverse = np.unique(keys, return_inverse=True)
+    size = len(unique)
+
+    totals = np.bincount(inverse, minlength=size)
+    errors = np.bincount(inverse, weights=is_error, minlength=size)
+
+    latency_inverse = inverse[has_latency]
+    latency = latency[has_latency]
+    counts = np.bincount(latency_inverse, minlength=size)
+    sums = np.bincount(latency_inverse, weights=latency, minlength=size)
+    squares = np.bincount(latency_inverse, weights=latency * latency, minlength=size)
+    means = np.divide(sums, counts, out=np.zeros(size), where=counts > 0)
+    m2 = np.maximum(squares - counts * means * means, 0)
+
+    buckets = np.digitize(latency, _BUCKET_EDGES)
+    histograms = np.bincount(
+        latency_inverse * HISTOGRAM_SIZE + buckets, minlength=size * HISTOGRAM_SIZE
+    ).reshape(size, HISTOGRAM_SIZE)
+
+    return unique, totals, errors, counts, means, m2, histograms
+
+
+def compute_profile_deltas(session_arrays):
+    """
+    세션 열 배열 목록 → {(kind, key): (입력 수, 오타 수, 간격 수, 간격 평균, 제곱편차 합, 히스토그램)}
+    """
+    columns = [_session_columns(arrays) for arrays in session_arrays if len(arrays['t_ms'])]
+    if not columns:
+        return {}
+    codes, present, bigrams, bigram_present, is_error, latency, has_latency = (
+        np.concatenate(parts) for parts in zip(*columns)
+    )
+
+    deltas = {}
+    for kind, keys, mask, decode in (
+        ('char', codes, present, lambda key: chr(key)),
+        ('bigram', bigrams, bigram_present, lambda key: chr(key >> _BIGRAM_SHIFT) + chr(key & ((1 << _BIGRAM_SHIFT) - 1))),
+    ):
+        if not mask.any():
+            continue
+        grouped = _group(keys[mask], is_error[mask], latency[mask], has_latency[mask])
+        for key, total, error, count, mean, m2, histogram in zip(*grouped):
+            deltas[(kind, decode(int(key)))] = (
+                int(total), int(error), int(count), float(mean), float(m2), histogram,
+            )
+    return deltas
+
+
+def histogram_percentile(histogram, percentile):
+    """히스토그램 → 백분위 근사값 (구간 내 선형 보간)"""
+    total = histogram.sum()
+    if not total:
+        return None
+    target = total * percentile / 100
+    cumulative = np.cumsum(histogram)
+    index = int(np.searchsorted(cumulative, target))
+    lower = LATENCY_BUCKETS_MS[index - 1] if index > 0 else 0
+    upper = LATENCY_BUCKETS_MS[index] if index < len(LATENCY_BUCKETS_MS) else MAX_LATENCY_MS
+    before = cumulative[index - 1] if index > 0 else 0
+    return round(lower + (target - before) / histogram[index] * (upper - lower), 1)
+
+
+def _load_histogram(data):
+    if not data:
+        return np.zeros(HISTOGRAM_SIZE, dtype=np.int64)
+    return np.frombuffer(bytes(data), dtype=np.uint32).astype(np.int64)
+
+
+def _merge(profile, delta):
+    total, errors, count, mean, m2, histogram = delta
+
+    profile.total_count += total
+    profile.error_count += errors
+    profile.error_rate = round(profile.error_count / profile.total_count, 4) if profile.total_count else 0
+
+    merged = profile.latency_count + count
+    if count:
+        difference = mean - profile.latency_mean
+        profile.latency_m2 += m2 + difference * difference * profile.latency_count * count / merged
+        profile.latency_mean += difference * count / merged
+        profile.latency_count = merged
+
+        histogram = _load_histogram(profile.latency_histogram) + histogram
+        profile.latency_histogram = array('I', histogram.tolist()).tobytes()
+        profile.latency_p90 = histogram_percentile(histogram, 90)
+
+
+def update_profiles(user, language, session_arrays):
+    """
+    세션 묶음의 이벤트를 사용자 프로필에 증분 반영
+    반환값: 갱신한 프로필 행 수
+    """
+    deltas = compute_profile_deltas(session_arrays)
+    if not deltas:
+        return 0
+
+    with transaction.atomic():
+        KeystrokeProfile.objects.bulk_create(
+            [KeystrokeProfile(user=user, language=language, kind=kind, key=key) for kind, key in deltas],
+            ignore_conflicts=True,
+        )
+        profiles = [
+            profile
+            for profile in KeystrokeProfile.objects.select_for_update().filter(
+                user=user,
+                language=language,
+                key__in={key for _, key in deltas},
+            ).order_by('id')
+            if (profile.kind, profile.key) in deltas
+        ]
+        for profile in profiles:
+            _merge(profile, deltas[(profile.kind, profile.key)])
+        KeystrokeProfile.objects.bulk_update(profiles, PROFILE_UPDATE_FIELDS)
+    return len(profiles)
+
+
+def update_session_profiles(user, sessions):
+    """세션 목록의 이벤트를 언어별로 모아 프로필 갱신 (이벤트가 없는 세션은 건너뜀)"""
+    from apps.sessions.event_store import load_event_arrays
+
+    arrays = load_event_arrays([session.id for session in sessions])
+    by_language = {}
+    for session in sessions:
+        if session.id in arrays:
+            by_language.setdefault(session.language, []).append(arrays[session.id])
+    return sum(
+        update_profiles(user, language, session_arrays)
+        for language, session_arrays in by_language.items()
+    )
@@ -0,0 +1,62 @@
+"""
+키 입력 프로필 재구성 커맨드 (최초 적재/포맷 변경 시)
+Usage: python manage.py rebuild_keystroke_profiles [--user 1] [--batch-size 500]
+
+평소에는 run_worker가 세션마다 증분 갱신하므로 실행할 필요가 없다.
+"""
+import time
+
+from django.core.management.base import BaseCommand
+from django.db.models import Q
+from apps.sessions.event_store import load_event_arrays
+from apps.sessions.models import TypingSession
+from apps.stats.keystrokes import update_profiles
+from apps.stats.models import KeystrokeProfile
+
+
+class Command(BaseCommand):
+    help = '저장된 키 입력 이벤트로 사용자별 키 입력 프로필을 다시 만듭니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--user', type=int, action='append', help='대상 사용자 ID (여러 번 지정 가능)')
+        parser.add_argument('--batch-size', type=int, default=500, help='한 번에 읽을 세션 수')
+
+    def handle(self, *args, **options):
+        sessions = TypingSession.objects.filter(user__isnull=False).filter(
+            Q(event_blob__isnull=False) | Q(events__isnull=False)
+        ).distinct()
+        profiles = KeystrokeProfile.objects.all()
+        if options['user']:
+            sessions = sessions.filter(user_id__in=options['user'])
+            profiles = profiles.filter(user_id__in=options['user'])
+
+        self.stdout.write('⌨️ 키 입력 프로필 재구성 시작...')
+        started = time.monotonic()
+        deleted, _ = profiles.delete()
+        self.stdout.write(f'  🧹 기존 프로필 {deleted}개 삭제')
+
+        last_id = 0
+        total_sessions = total_rows = 0
+        while True:
+            batch = list(
+                sessions.filter(id__gt=last_id).order_by('id').select_related('user')[:options['batch_size']]
+            )
+            if not batch:
+                break
+            last_id = batch[-1].id
+
+            arrays = load_event_arrays([session.id for session in batch])
+            groups = {}
+            for session in batch:
+                if session.id in arrays:
+                    groups.setdefault((session.user, session.language), []).append(arrays[session.id])
+            for (user, language), session_arrays in groups.items():
+                total_rows += update_profiles(user, language, session_arrays)
+
+            total_sessions += len(batch)
+            self.stdout.write(f'     → {total_sessions}개 세션 처리')
+
+        elapsed = time.monotonic() - started
+        self.stdout.write(self.style.SUCCESS(
+            f'✅ 재구성 완료! {total_sessions}개 세션 / 프로필 갱신 {total_rows}회 ({elapsed:.1f}s)'
+        ))
@@ -0,0 +1,48 @@
+"""
+사용자 주간/월간 통계 재구성 커맨드 (최초 적재/점수 재계산 후)
+Usage: python manage.py rebuild_period_stats [--user 1] [--chunk-size 500]
+
+평소에는 세션 저장 시 증분 갱신하므로 실행할 필요가 없다.
+보관(archive_sessions)된 세션이 있는 기간은 세션 테이블만으로 다시 계산할 수 없어 기존 행을 유지한다.
+"""
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from apps.stats.services import PERIOD_ROLLUPS, rebuild_period_stats
+
+
+class Command(BaseCommand):
+    help = '세션 테이블에서 사용자별 주간/월간 통계를 다시 계산합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--user', type=int, action='append', help='대상 사용자 ID (여러 번 지정 가능)')
+        parser.add_argument('--chunk-size', type=int, default=500, help='한 트랜잭션에서 처리할 사용자 수')
+
+    def handle(self, *args, **options):
+        users = get_user_model().objects.all()
+        if options['user']:
+            users = users.filter(id__in=options['user'])
+
+        self.stdout.write('📊 주간/월간 통계 재구성 시작...')
+        started = time.monotonic()
+        total_users = 0
+        totals = dict.fromkeys(PERIOD_ROLLUPS, 0)
+        last_id = 0
+        while True:
+            user_ids = list(
+                users.filter(id__gt=last_id).order_by('id').values_list('id', flat=True)[:options['chunk_size']]
+            )
+            if not user_ids:
+                break
+            last_id = user_ids[-1]
+
+            for period, rows in rebuild_period_stats(user_ids).items():
+                totals[period] += rows
+            total_users += len(user_ids)
+            self.stdout.write(f'     → {total_users}명 처리')
+
+        elapsed = time.monotonic() - started
+        self.stdout.write(self.style.SUCCESS(
+            f'✅ 재구성 완료! 주간 {totals["weekly"]}개 / 월간 {totals["monthly"]}개 ({elapsed:.1f}s)'
+        ))
@@ -0,0 +1,33 @@
+# Generated by Django 4.2.30 on 2026-10-17 22:03
+
+from django.db import migrations, models
+from django.db.models import F
+
+
+def backfill_running_sums(apps, schema_editor):
+    UserDaily = apps.get_model('stats', 'UserDaily')
+    UserDaily.objects.update(
+        sum_wpm=F('avg_wpm') * F('total_sessions'),
+        sum_accuracy=F('avg_accuracy') * F('total_sessions'),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('stats', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='userdaily',
+            name='sum_accuracy',
+            field=models.DecimalField(decimal_places=2, default=0, help_text='평균 계산용 누적 합', max_digits=12, verbose_name='정확도 합계'),
+        ),
+        migrations.AddField(
+            model_name='userdaily',
+            name='sum_wpm',
+            field=models.DecimalField(decimal_places=2, default=0, help_text='평균 계산용 누적 합', max_digits=12, verbose_name='WPM 합계'),
+        ),
+        migrations.RunPython(backfill_running_sums, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 4.2.30 on 2026-10-17 22:10
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('stats', '0003_userdaily_running_sums'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='KeystrokeProfile',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('language', models.CharField(choices=[('ko', '한글'), ('en', '영어')], default='ko', max_length=10, verbose_name='언어')),
+                ('kind', models.CharField(choices=[('char', '글자'), ('bigram', '바이그램')], max_length=10, verbose_name='종류')),
+                ('key', models.CharField(help_text='기대 문자 기준', max_length=10, verbose_name='글자/바이그램')),
+                ('total_count', models.PositiveIntegerField(default=0, verbose_name='입력 수')),
+                ('error_count', models.PositiveIntegerField(default=0, verbose_name='오타 수')),
+                ('error_rate', models.FloatField(default=0, help_text='0-1', verbose_name='오타율')),
+                ('latency_count', models.PositiveIntegerField(default=0, verbose_name='간격 표본 수')),
+                ('latency_mean', models.FloatField(default=0, verbose_name='평균 입력 간격 (ms)')),
+                ('latency_m2', models.FloatField(default=0, verbose_name='입력 간격 제곱편차 합')),
+                ('latency_p90', models.FloatField(blank=True, help_text='히스토그램 기준 근사값', null=True, verbose_name='입력 간격 p90 (ms)')),
+                ('latency_histogram', models.BinaryField(default=b'', help_text='uint32 구간별 빈도 (apps.stats.keystrokes.LATENCY_BUCKETS_MS)', verbose_name='입력 간격 히스토그램')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='수정일')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='keystroke_profiles', to=settings.AUTH_USER_MODEL, verbose_name='사용자')),
+            ],
+            options={
+                'verbose_name': '키 입력 프로필',
+                'verbose_name_plural': '키 입력 프로필들',
+                'indexes': [models.Index(fields=['user', 'language', 'kind', '-error_rate'], name='idx_keyprofile_error_rate')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='keystrokeprofile',
+            constraint=models.UniqueConstraint(fields=('user', 'language', 'kind', 'key'), name='uq_keyprofile_user_lang_kind_key'),
+        ),
+    ]
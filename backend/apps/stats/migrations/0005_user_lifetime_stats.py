@@ -0,0 +1,60 @@
+# Generated by Django 4.2.30 on 2026-10-17 22:15
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Max, Q, Sum
+import django.db.models.deletion
+
+
+def backfill_lifetime_stats(apps, schema_editor):
+    TypingSession = apps.get_model('typing_sessions', 'TypingSession')
+    UserLifetimeStats = apps.get_model('stats', 'UserLifetimeStats')
+    rows = TypingSession.objects.filter(user__isnull=False).values('user_id').annotate(
+        total_sessions=Count('id'),
+        korean_sessions=Count('id', filter=Q(language='ko')),
+        english_sessions=Count('id', filter=Q(language='en')),
+        total_duration_ms=Sum('duration_ms'),
+        total_chars=Sum('input_length'),
+        total_errors=Sum('error_count'),
+        sum_wpm=Sum('wpm'),
+        sum_accuracy=Sum('accuracy'),
+        best_wpm=Max('wpm'),
+    ).order_by()
+    UserLifetimeStats.objects.bulk_create(
+        (UserLifetimeStats(**row) for row in rows.iterator()),
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0001_initial'),
+        ('stats', '0004_keystroke_profile'),
+        ('typing_sessions', '0008_session_user_started_keyset'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserLifetimeStats',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='lifetime_stats', serialize=False, to=settings.AUTH_USER_MODEL, verbose_name='사용자')),
+                ('total_sessions', models.PositiveIntegerField(default=0, verbose_name='세션 수')),
+                ('korean_sessions', models.PositiveIntegerField(default=0, verbose_name='한글 세션 수')),
+                ('english_sessions', models.PositiveIntegerField(default=0, verbose_name='영어 세션 수')),
+                ('total_duration_ms', models.BigIntegerField(default=0, verbose_name='총 연습 시간 (ms)')),
+                ('total_chars', models.BigIntegerField(default=0, verbose_name='총 입력 문자수')),
+                ('total_errors', models.BigIntegerField(default=0, verbose_name='총 오류 수')),
+                ('sum_wpm', models.DecimalField(decimal_places=2, default=0, help_text='평균 계산용 누적 합', max_digits=14, verbose_name='WPM 합계')),
+                ('sum_accuracy', models.DecimalField(decimal_places=2, default=0, help_text='평균 계산용 누적 합', max_digits=14, verbose_name='정확도 합계')),
+                ('best_wpm', models.DecimalField(blank=True, decimal_places=2, max_digits=6, null=True, verbose_name='최고 WPM')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='생성일')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='수정일')),
+            ],
+            options={
+                'verbose_name': '누적 통계',
+                'verbose_name_plural': '누적 통계들',
+            },
+        ),
+        migrations.RunPython(backfill_lifetime_stats, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,62 @@
+# Generated by Django 4.2.30 on 2026-10-17 22:17
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('texts', '0005_textitem_keystroke_count'),
+        ('typing_sessions', '0008_session_user_started_keyset'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('stats', '0005_user_lifetime_stats'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='userlifetimestats',
+            name='best_accuracy',
+            field=models.DecimalField(blank=True, decimal_places=2, max_digits=5, null=True, verbose_name='최고 정확도 (%)'),
+        ),
+        migrations.AddField(
+            model_name='userlifetimestats',
+            name='first_session_at',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='첫 세션 시작 시각'),
+        ),
+        migrations.AddField(
+            model_name='userlifetimestats',
+            name='last_session_at',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='최근 세션 시작 시각'),
+        ),
+        migrations.CreateModel(
+            name='PersonalBest',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('language', models.CharField(choices=[('ko', '한글'), ('en', '영어')], default='ko', max_length=10, verbose_name='언어')),
+                ('mode', models.CharField(choices=[('practice', '연습'), ('challenge', '챌린지'), ('ranked', '랭킹전')], max_length=20, verbose_name='모드')),
+                ('best_wpm', models.DecimalField(decimal_places=2, max_digits=6, verbose_name='최고 WPM')),
+                ('best_accuracy', models.DecimalField(decimal_places=2, max_digits=5, verbose_name='최고 기록 정확도 (%)')),
+                ('achieved_at', models.DateTimeField(help_text='최고 기록 세션 시작 시각', verbose_name='달성 시각')),
+                ('session_count', models.PositiveIntegerField(default=0, verbose_name='세션 수')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='수정일')),
+                ('session', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='typing_sessions.typingsession', verbose_name='최고 기록 세션')),
+                ('text_item', models.ForeignKey(blank=True, help_text='NULL이면 언어/모드 전체 최고 기록', null=True, on_delete=django.db.models.deletion.CASCADE, related_name='personal_bests', to='texts.textitem', verbose_name='문장')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='personal_bests', to=settings.AUTH_USER_MODEL, verbose_name='사용자')),
+            ],
+            options={
+                'verbose_name': '개인 최고 기록',
+                'verbose_name_plural': '개인 최고 기록들',
+                'indexes': [models.Index(fields=['text_item', '-best_wpm'], name='idx_pb_text_wpm')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='personalbest',
+            constraint=models.UniqueConstraint(condition=models.Q(('text_item__isnull', False)), fields=('user', 'language', 'mode', 'text_item'), name='uq_pb_user_lang_mode_text'),
+        ),
+        migrations.AddConstraint(
+            model_name='personalbest',
+            constraint=models.UniqueConstraint(condition=models.Q(('text_item__isnull', True)), fields=('user', 'language', 'mode'), name='uq_pb_user_lang_mode_overall'),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 4.2.30 on 2026-10-17 22:19
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('typing_sessions', '0008_session_user_started_keyset'),
+        ('stats', '0006_personal_best'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='personalbest',
+            name='session',
+            field=models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='typing_sessions.typingsession', verbose_name='최고 기록 세션'),
+        ),
+    ]
@@ -0,0 +1,134 @@
+# Generated by Django 4.2.30 on 2026-10-17 22:31
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+from django.utils import timezone
+
+
+# apps.stats.services.REBUILD_PERIOD_SQL 의 마이그레이션 시점 사본
+# (이후 서비스 코드가 바뀌어도 이 마이그레이션의 결과는 달라지지 않도록 고정)
+BACKFILL_PERIOD_SQL = """
+    WITH archived AS (
+        SELECT user_id, date_trunc(%(unit)s, MAX(last_started_at) AT TIME ZONE %(tz)s)::date AS last_period
+        FROM {archives}
+        GROUP BY user_id
+    )
+    INSERT INTO {table} (
+        user_id, period_start, language, mode,
+        total_sessions, total_duration_ms, total_chars, total_errors,
+        sum_wpm, sum_accuracy, avg_wpm, avg_accuracy, best_wpm, best_accuracy,
+        created_at, updated_at
+    )
+    SELECT
+        s.user_id, date_trunc(%(unit)s, s.started_at AT TIME ZONE %(tz)s)::date AS period, s.language, s.mode,
+        COUNT(*), SUM(s.duration_ms), SUM(s.input_length), SUM(s.error_count),
+        SUM(s.wpm), SUM(s.accuracy), ROUND(SUM(s.wpm) / COUNT(*), 2), ROUND(SUM(s.accuracy) / COUNT(*), 2),
+        MAX(s.wpm), MAX(s.accuracy),
+        %(now)s, %(now)s
+    FROM {sessions} s
+    LEFT JOIN archived a ON a.user_id = s.user_id
+    WHERE s.user_id IS NOT NULL
+      AND (a.last_period IS NULL OR date_trunc(%(unit)s, s.started_at AT TIME ZONE %(tz)s)::date > a.last_period)
+    GROUP BY s.user_id, period, s.language, s.mode
+"""
+
+
+def backfill_period_stats(apps, schema_editor):
+    """기존 세션으로 주간/월간 통계 채우기 (보관된 기간은 세션이 없어 제외)"""
+    quote = schema_editor.quote_name
+    tables = {
+        'sessions': quote(apps.get_model('typing_sessions', 'TypingSession')._meta.db_table),
+        'archives': quote(apps.get_model('typing_sessions', 'SessionArchive')._meta.db_table),
+    }
+    params = {'tz': settings.TIME_ZONE, 'now': timezone.now()}
+    with schema_editor.connection.cursor() as cursor:
+        for model_name, unit in (('UserWeekly', 'week'), ('UserMonthly', 'month')):
+            table = quote(apps.get_model('stats', model_name)._meta.db_table)
+            cursor.execute(BACKFILL_PERIOD_SQL.format(table=table, **tables), {'unit': unit, **params})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('stats', '0007_personalbest_session_db_constraint'),
+        ('typing_sessions', '0010_session_archive'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserMonthly',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('period_start', models.DateField(help_text='주간은 월요일, 월간은 1일 (Asia/Seoul 기준)', verbose_name='기간 시작일')),
+                ('language', models.CharField(choices=[('ko', '한글'), ('en', '영어')], default='ko', max_length=10, verbose_name='언어')),
+                ('mode', models.CharField(default='practice', max_length=20, verbose_name='모드')),
+                ('total_sessions', models.PositiveIntegerField(default=0, verbose_name='세션 수')),
+                ('total_duration_ms', models.BigIntegerField(default=0, verbose_name='총 연습 시간 (ms)')),
+                ('total_chars', models.BigIntegerField(default=0, verbose_name='총 입력 문자수')),
+                ('total_errors', models.BigIntegerField(default=0, verbose_name='총 오류 수')),
+                ('sum_wpm', models.DecimalField(decimal_places=2, default=0, help_text='평균 계산용 누적 합', max_digits=14, verbose_name='WPM 합계')),
+                ('sum_accuracy', models.DecimalField(decimal_places=2, default=0, help_text='평균 계산용 누적 합', max_digits=14, verbose_name='정확도 합계')),
+                ('avg_wpm', models.DecimalField(decimal_places=2, default=0, max_digits=6, verbose_name='평균 WPM')),
+                ('avg_accuracy', models.DecimalField(decimal_places=2, default=0, max_digits=5, verbose_name='평균 정확도 (%)')),
+                ('best_wpm', models.DecimalField(blank=True, decimal_places=2, max_digits=6, null=True, verbose_name='최고 WPM')),
+                ('best_accuracy', models.DecimalField(blank=True, decimal_places=2, max_digits=5, null=True, verbose_name='최고 정확도 (%)')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='생성일')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='수정일')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='monthly_stats', to=settings.AUTH_USER_MODEL, verbose_name='사용자')),
+            ],
+            options={
+                'verbose_name': '월간 통계',
+                'verbose_name_plural': '월간 통계들',
+                'ordering': ['-period_start'],
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='UserWeekly',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('period_start', models.DateField(help_text='주간은 월요일, 월간은 1일 (Asia/Seoul 기준)', verbose_name='기간 시작일')),
+                ('language', models.CharField(choices=[('ko', '한글'), ('en', '영어')], default='ko', max_length=10, verbose_name='언어')),
+                ('mode', models.CharField(default='practice', max_length=20, verbose_name='모드')),
+                ('total_sessions', models.PositiveIntegerField(default=0, verbose_name='세션 수')),
+                ('total_duration_ms', models.BigIntegerField(default=0, verbose_name='총 연습 시간 (ms)')),
+                ('total_chars', models.BigIntegerField(default=0, verbose_name='총 입력 문자수')),
+                ('total_errors', models.BigIntegerField(default=0, verbose_name='총 오류 수')),
+                ('sum_wpm', models.DecimalField(decimal_places=2, default=0, help_text='평균 계산용 누적 합', max_digits=14, verbose_name='WPM 합계')),
+                ('sum_accuracy', models.DecimalField(decimal_places=2, default=0, help_text='평균 계산용 누적 합', max_digits=14, verbose_name='정확도 합계')),
+                ('avg_wpm', models.DecimalField(decimal_places=2, default=0, max_digits=6, verbose_name='평균 WPM')),
+                ('avg_accuracy', models.DecimalField(decimal_places=2, default=0, max_digits=5, verbose_name='평균 정확도 (%)')),
+                ('best_wpm', models.DecimalField(blank=True, decimal_places=2, max_digits=6, null=True, verbose_name='최고 WPM')),
+                ('best_accuracy', models.DecimalField(blank=True, decimal_places=2, max_digits=5, null=True, verbose_name='최고 정확도 (%)')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='생성일')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='수정일')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='weekly_stats', to=settings.AUTH_USER_MODEL, verbose_name='사용자')),
+            ],
+            options={
+                'verbose_name': '주간 통계',
+                'verbose_name_plural': '주간 통계들',
+                'ordering': ['-period_start'],
+                'abstract': False,
+                'indexes': [models.Index(fields=['user', '-period_start'], name='idx_userweekly_user_period'), models.Index(fields=['period_start', 'language', 'mode'], name='idx_userweekly_period')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='userweekly',
+            constraint=models.UniqueConstraint(fields=('user', 'period_start', 'language', 'mode'), name='uq_userweekly_period'),
+        ),
+        migrations.AddIndex(
+            model_name='usermonthly',
+            index=models.Index(fields=['user', '-period_start'], name='idx_usermonthly_user_period'),
+        ),
+        migrations.AddIndex(
+            model_name='usermonthly',
+            index=models.Index(fields=['period_start', 'language', 'mode'], name='idx_usermonthly_period'),
+        ),
+        migrations.AddConstraint(
+            model_name='usermonthly',
+            constraint=models.UniqueConstraint(fields=('user', 'period_start', 'language', 'mode'), name='uq_usermonthly_period'),
+        ),
+        migrations.RunPython(backfill_period_stats, migrations.RunPython.noop),
+    ]
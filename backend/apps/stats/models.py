@@ -1,3 +1,5 @@
+from datetime import timedelta
+
 from django.db import models
 from django.conf import settings
 
@@ -31,6 +33,20 @@ class UserDaily(models.Model):
         default=0,
         verbose_name='총 연습 시간 (ms)'
     )
+    sum_wpm = models.DecimalField(
+        max_digits=12,
+        decimal_places=2,
+        default=0,
+        verbose_name='WPM 합계',
+        help_text='평균 계산용 누적 합'
+    )
+    sum_accuracy = models.DecimalField(
+        max_digits=12,
+        decimal_places=2,
+        default=0,
+        verbose_name='정확도 합계',
+        help_text='평균 계산용 누적 합'
+    )
     avg_wpm = models.DecimalField(
         max_digits=6,
         decimal_places=2,
@@ -98,3 +114,464 @@ class UserDaily(models.Model):
     def total_duration_minutes(self):
         """총 연습 시간 (분)"""
         return self.total_duration_ms / 60000
+
+
+class PeriodStats(models.Model):
+    """
+    주/월 단위 집계 공통 필드 - (사용자, 기간 시작일, 언어, 모드)당 한 행
+    
+    세션 저장 시 UserDaily와 같은 upsert로 합계를 더하고, 평균은 누적 합 / 세션 수로
+    다시 계산하므로 여러 기간을 합칠 때도 합계끼리 나누면 세션 가중 평균이 된다.
+    """
+    
+    period_start = models.DateField(
+        verbose_name='기간 시작일',
+        help_text='주간은 월요일, 월간은 1일 (Asia/Seoul 기준)'
+    )
+    language = models.CharField(
+        max_length=10,
+        choices=[('ko', '한글'), ('en', '영어')],
+        default='ko',
+        verbose_name='언어'
+    )
+    mode = models.CharField(
+        max_length=20,
+        default='practice',
+        verbose_name='모드'
+    )
+    
+    # 집계 데이터
+    total_sessions = models.PositiveIntegerField(
+        default=0,
+        verbose_name='세션 수'
+    )
+    total_duration_ms = models.BigIntegerField(
+        default=0,
+        verbose_name='총 연습 시간 (ms)'
+    )
+    total_chars = models.BigIntegerField(
+        default=0,
+        verbose_name='총 입력 문자수'
+    )
+    total_errors = models.BigIntegerField(
+        default=0,
+        verbose_name='총 오류 수'
+    )
+    sum_wpm = models.DecimalField(
+        max_digits=14,
+        decimal_places=2,
+        default=0,
+        verbose_name='WPM 합계',
+        help_text='평균 계산용 누적 합'
+    )
+    sum_accuracy = models.DecimalField(
+        max_digits=14,
+        decimal_places=2,
+        default=0,
+        verbose_name='정확도 합계',
+        help_text='평균 계산용 누적 합'
+    )
+    avg_wpm = models.DecimalField(
+        max_digits=6,
+        decimal_places=2,
+        default=0,
+        verbose_name='평균 WPM'
+    )
+    avg_accuracy = models.DecimalField(
+        max_digits=5,
+        decimal_places=2,
+        default=0,
+        verbose_name='평균 정확도 (%)'
+    )
+    best_wpm = models.DecimalField(
+        max_digits=6,
+        decimal_places=2,
+        null=True,
+        blank=True,
+        verbose_name='최고 WPM'
+    )
+    best_accuracy = models.DecimalField(
+        max_digits=5,
+        decimal_places=2,
+        null=True,
+        blank=True,
+        verbose_name='최고 정확도 (%)'
+    )
+    
+    # 타임스탬프
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+        verbose_name='생성일'
+    )
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        verbose_name='수정일'
+    )
+    
+    class Meta:
+        abstract = True
+        ordering = ['-period_start']
+        constraints = [
+            models.UniqueConstraint(
+                fields=['user', 'period_start', 'language', 'mode'],
+                name='uq_%(class)s_period'
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['user', '-period_start'], name='idx_%(class)s_user_period'),
+            models.Index(fields=['period_start', 'language', 'mode'], name='idx_%(class)s_period'),
+        ]
+    
+    def __str__(self):
+        return f"{self.user.username} - {self.period_start} ({self.language}/{self.mode})"
+    
+    @property
+    def total_duration_minutes(self):
+        """총 연습 시간 (분)"""
+        return self.total_duration_ms / 60000
+
+
+class UserWeekly(PeriodStats):
+    """사용자 주 단위 집계 (월요일 시작) - 장기 추이/주간 랭킹용"""
+    
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='weekly_stats',
+        verbose_name='사용자'
+    )
+    
+    class Meta(PeriodStats.Meta):
+        verbose_name = '주간 통계'
+        verbose_name_plural = '주간 통계들'
+    
+    @staticmethod
+    def period_start_for(day):
+        return day - timedelta(days=day.weekday())
+
+
+class UserMonthly(PeriodStats):
+    """사용자 월 단위 집계 - 장기 추이/월간 랭킹용"""
+    
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='monthly_stats',
+        verbose_name='사용자'
+    )
+    
+    class Meta(PeriodStats.Meta):
+        verbose_name = '월간 통계'
+        verbose_name_plural = '월간 통계들'
+    
+    @staticmethod
+    def period_start_for(day):
+        return day.replace(day=1)
+
+
+class KeystrokeProfile(models.Model):
+    """사용자 글자/바이그램별 오타율·입력 간격 프로필 (세션마다 증분 갱신)"""
+    
+    KIND_CHOICES = [
+        ('char', '글자'),
+        ('bigram', '바이그램'),
+    ]
+    
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='keystroke_profiles',
+        verbose_name='사용자'
+    )
+    language = models.CharField(
+        max_length=10,
+        choices=[('ko', '한글'), ('en', '영어')],
+        default='ko',
+        verbose_name='언어'
+    )
+    kind = models.CharField(
+        max_length=10,
+        choices=KIND_CHOICES,
+        verbose_name='종류'
+    )
+    key = models.CharField(
+        max_length=10,
+        verbose_name='글자/바이그램',
+        help_text='기대 문자 기준'
+    )
+    
+    # 오타
+    total_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name='입력 수'
+    )
+    error_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name='오타 수'
+    )
+    error_rate = models.FloatField(
+        default=0,
+        verbose_name='오타율',
+        help_text='0-1'
+    )
+    
+    # 입력 간격 (Welford 누적 평균/제곱편차 + 히스토그램)
+    latency_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name='간격 표본 수'
+    )
+    latency_mean = models.FloatField(
+        default=0,
+        verbose_name='평균 입력 간격 (ms)'
+    )
+    latency_m2 = models.FloatField(
+        default=0,
+        verbose_name='입력 간격 제곱편차 합'
+    )
+    latency_p90 = models.FloatField(
+        null=True,
+        blank=True,
+        verbose_name='입력 간격 p90 (ms)',
+        help_text='히스토그램 기준 근사값'
+    )
+    latency_histogram = models.BinaryField(
+        default=b'',
+        verbose_name='입력 간격 히스토그램',
+        help_text="uint32 구간별 빈도 (apps.stats.keystrokes.LATENCY_BUCKETS_MS)"
+    )
+    
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        verbose_name='수정일'
+    )
+    
+    class Meta:
+        verbose_name = '키 입력 프로필'
+        verbose_name_plural = '키 입력 프로필들'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['user', 'language', 'kind', 'key'],
+                name='uq_keyprofile_user_lang_kind_key'
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=['user', 'language', 'kind', '-error_rate'],
+                name='idx_keyprofile_error_rate'
+            ),
+        ]
+    
+    def __str__(self):
+        return f"{self.user.username} [{self.key}] {self.error_rate:.1%} ({self.language}/{self.kind})"
+    
+    @property
+    def latency_std(self):
+        """입력 간격 표준편차 (ms)"""
+        if self.latency_count < 2:
+            return None
+        return (self.latency_m2 / (self.latency_count - 1)) ** 0.5
+
+
+class UserLifetimeStats(models.Model):
+    """사용자 누적 통계 - 세션 저장 시 증분 갱신 (프로필/통계 헤더는 PK 조회 1회)"""
+    
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='lifetime_stats',
+        verbose_name='사용자'
+    )
+    
+    # 집계 데이터
+    total_sessions = models.PositiveIntegerField(
+        default=0,
+        verbose_name='세션 수'
+    )
+    korean_sessions = models.PositiveIntegerField(
+        default=0,
+        verbose_name='한글 세션 수'
+    )
+    english_sessions = models.PositiveIntegerField(
+        default=0,
+        verbose_name='영어 세션 수'
+    )
+    total_duration_ms = models.BigIntegerField(
+        default=0,
+        verbose_name='총 연습 시간 (ms)'
+    )
+    total_chars = models.BigIntegerField(
+        default=0,
+        verbose_name='총 입력 문자수'
+    )
+    total_errors = models.BigIntegerField(
+        default=0,
+        verbose_name='총 오류 수'
+    )
+    sum_wpm = models.DecimalField(
+        max_digits=14,
+        decimal_places=2,
+        default=0,
+        verbose_name='WPM 합계',
+        help_text='평균 계산용 누적 합'
+    )
+    sum_accuracy = models.DecimalField(
+        max_digits=14,
+        decimal_places=2,
+        default=0,
+        verbose_name='정확도 합계',
+        help_text='평균 계산용 누적 합'
+    )
+    best_wpm = models.DecimalField(
+        max_digits=6,
+        decimal_places=2,
+        null=True,
+        blank=True,
+        verbose_name='최고 WPM'
+    )
+    best_accuracy = models.DecimalField(
+        max_digits=5,
+        decimal_places=2,
+        null=True,
+        blank=True,
+        verbose_name='최고 정확도 (%)'
+    )
+    first_session_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name='첫 세션 시작 시각'
+    )
+    last_session_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name='최근 세션 시작 시각'
+    )
+    
+    # 타임스탬프
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+        verbose_name='생성일'
+    )
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        verbose_name='수정일'
+    )
+    
+    class Meta:
+        verbose_name = '누적 통계'
+        verbose_name_plural = '누적 통계들'
+    
+    def __str__(self):
+        return f"{self.user.username} - {self.total_sessions}회"
+    
+    @property
+    def avg_wpm(self):
+        """평균 WPM (세션 가중)"""
+        if not self.total_sessions:
+            return 0
+        return round(self.sum_wpm / self.total_sessions, 2)
+    
+    @property
+    def avg_accuracy(self):
+        """평균 정확도 (세션 가중)"""
+        if not self.total_sessions:
+            return 0
+        return round(self.sum_accuracy / self.total_sessions, 2)
+
+
+class PersonalBest(models.Model):
+    """
+    개인 최고 기록 - (사용자, 언어, 모드, 문장)별 최고 WPM 세션
+    
+    text_item이 NULL인 행은 (사용자, 언어, 모드) 전체 최고 기록이다.
+    """
+    
+    MODE_CHOICES = [
+        ('practice', '연습'),
+        ('challenge', '챌린지'),
+        ('ranked', '랭킹전'),
+    ]
+    
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='personal_bests',
+        verbose_name='사용자'
+    )
+    language = models.CharField(
+        max_length=10,
+        choices=[('ko', '한글'), ('en', '영어')],
+        default='ko',
+        verbose_name='언어'
+    )
+    mode = models.CharField(
+        max_length=20,
+        choices=MODE_CHOICES,
+        verbose_name='모드'
+    )
+    text_item = models.ForeignKey(
+        'texts.TextItem',
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name='personal_bests',
+        verbose_name='문장',
+        help_text='NULL이면 언어/모드 전체 최고 기록'
+    )
+    session = models.ForeignKey(
+        'typing_sessions.TypingSession',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='+',
+        db_constraint=False,
+        verbose_name='최고 기록 세션'
+    )
+    
+    # 기록
+    best_wpm = models.DecimalField(
+        max_digits=6,
+        decimal_places=2,
+        verbose_name='최고 WPM'
+    )
+    best_accuracy = models.DecimalField(
+        max_digits=5,
+        decimal_places=2,
+        verbose_name='최고 기록 정확도 (%)'
+    )
+    achieved_at = models.DateTimeField(
+        verbose_name='달성 시각',
+        help_text='최고 기록 세션 시작 시각'
+    )
+    session_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name='세션 수'
+    )
+    
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        verbose_name='수정일'
+    )
+    
+    class Meta:
+        verbose_name = '개인 최고 기록'
+        verbose_name_plural = '개인 최고 기록들'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['user', 'language', 'mode', 'text_item'],
+                condition=models.Q(text_item__isnull=False),
+                name='uq_pb_user_lang_mode_text'
+            ),
+            models.UniqueConstraint(
+                fields=['user', 'language', 'mode'],
+                condition=models.Q(text_item__isnull=True),
+                name='uq_pb_user_lang_mode_overall'
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['text_item', '-best_wpm'], name='idx_pb_text_wpm'),
+        ]
+    
+    def __str__(self):
+        target = f"#{self.text_item_id}" if self.text_item_id else '전체'
+        return f"{self.user.username} {target} {self.best_wpm} WPM ({self.language}/{self.mode})"
@@ -1,5 +1,5 @@
 from rest_framework import serializers
-from .models import UserDaily
+from .models import UserDaily, UserWeekly, UserMonthly, KeystrokeProfile, PersonalBest
 
 
 class UserDailySerializer(serializers.ModelSerializer):
@@ -31,6 +31,28 @@ class UserDailyListSerializer(serializers.ModelSerializer):
         fields = ['date', 'language', 'total_sessions', 'avg_wpm', 'avg_accuracy', 'best_wpm']
 
 
+PERIOD_STATS_FIELDS = [
+    'period_start', 'language', 'mode', 'total_sessions', 'total_duration_ms',
+    'avg_wpm', 'avg_accuracy', 'best_wpm', 'best_accuracy', 'total_chars', 'total_errors'
+]
+
+
+class UserWeeklySerializer(serializers.ModelSerializer):
+    """주간 통계 직렬화"""
+    
+    class Meta:
+        model = UserWeekly
+        fields = PERIOD_STATS_FIELDS
+
+
+class UserMonthlySerializer(serializers.ModelSerializer):
+    """월간 통계 직렬화"""
+    
+    class Meta:
+        model = UserMonthly
+        fields = PERIOD_STATS_FIELDS
+
+
 class StatsOverviewSerializer(serializers.Serializer):
     """통계 요약 직렬화"""
     total_sessions = serializers.IntegerField()
@@ -40,3 +62,27 @@ class StatsOverviewSerializer(serializers.Serializer):
     best_wpm = serializers.DecimalField(max_digits=6, decimal_places=2, allow_null=True)
     current_streak = serializers.IntegerField()
     longest_streak = serializers.IntegerField()
+
+
+class KeystrokeProfileSerializer(serializers.ModelSerializer):
+    """키 입력 프로필 직렬화"""
+    latency_std = serializers.FloatField(read_only=True)
+    
+    class Meta:
+        model = KeystrokeProfile
+        fields = [
+            'kind', 'key', 'language', 'total_count', 'error_count', 'error_rate',
+            'latency_count', 'latency_mean', 'latency_std', 'latency_p90', 'updated_at'
+        ]
+
+
+class PersonalBestSerializer(serializers.ModelSerializer):
+    """개인 최고 기록 직렬화"""
+    mode_display = serializers.CharField(source='get_mode_display', read_only=True)
+    
+    class Meta:
+        model = PersonalBest
+        fields = [
+            'language', 'mode', 'mode_display', 'text_item', 'session',
+            'best_wpm', 'best_accuracy', 'achieved_at', 'session_count'
+        ]
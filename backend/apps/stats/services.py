@@ -0,0 +1,631 @@
+"""
+stats 서비스 - UserDaily / UserWeekly / UserMonthly / UserLifetimeStats / PersonalBest 증분 갱신
+
+세션이 들어올 때마다 그날 세션 전체를 다시 집계하지 않고, 누적 합/최댓값만
+INSERT ... ON CONFLICT DO UPDATE 한 번으로 더한다. 평균은 같은 문장에서
+누적 합 / 세션 수로 다시 계산하므로 동시 제출에도 갱신이 유실되지 않는다.
+일/주/월 집계는 같은 upsert 문장을 키 열만 바꿔 쓴다.
+
+사용자 통계 요약은 버전 키로 캐시하고, 세션이 저장되면 버전을 올려 무효화한다.
+"""
+import time
+
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.utils import timezone
+from psycopg2.extras import execute_values
+
+from .models import PersonalBest, UserDaily, UserLifetimeStats, UserMonthly, UserWeekly
+
+
+# 키 열({keys})만 다르고 합계/평균/최고 기록 갱신은 일/주/월 집계가 같다
+UPSERT_ROLLUP_SQL = """
+    INSERT INTO {table} (
+        {keys},
+        total_sessions, total_duration_ms, total_chars, total_errors,
+        sum_wpm, sum_accuracy, avg_wpm, avg_accuracy, best_wpm, best_accuracy,
+        created_at, updated_at
+    )
+    VALUES (
+        {key_values},
+        %(sessions)s, %(duration_ms)s, %(chars)s, %(errors)s,
+        %(sum_wpm)s, %(sum_accuracy)s,
+        ROUND(%(sum_wpm)s / %(sessions)s, 2), ROUND(%(sum_accuracy)s / %(sessions)s, 2),
+        %(best_wpm)s, %(best_accuracy)s,
+        %(now)s, %(now)s
+    )
+    ON CONFLICT ({keys}) DO UPDATE SET
+        total_sessions = {table}.total_sessions + EXCLUDED.total_sessions,
+        total_duration_ms = {table}.total_duration_ms + EXCLUDED.total_duration_ms,
+        total_chars = {table}.total_chars + EXCLUDED.total_chars,
+        total_errors = {table}.total_errors + EXCLUDED.total_errors,
+        sum_wpm = {table}.sum_wpm + EXCLUDED.sum_wpm,
+        sum_accuracy = {table}.sum_accuracy + EXCLUDED.sum_accuracy,
+        avg_wpm = ROUND(
+            ({table}.sum_wpm + EXCLUDED.sum_wpm)
+            / ({table}.total_sessions + EXCLUDED.total_sessions), 2
+        ),
+        avg_accuracy = ROUND(
+            ({table}.sum_accuracy + EXCLUDED.sum_accuracy)
+            / ({table}.total_sessions + EXCLUDED.total_sessions), 2
+        ),
+        best_wpm = GREATEST({table}.best_wpm, EXCLUDED.best_wpm),
+        best_accuracy = GREATEST({table}.best_accuracy, EXCLUDED.best_accuracy),
+        updated_at = EXCLUDED.updated_at
+"""
+
+DAILY_KEYS = ('user_id', 'date', 'language')
+PERIOD_KEYS = ('user_id', 'period_start', 'language', 'mode')
+
+# 기간 이름: (집계 모델, date_trunc 단위)
+PERIOD_ROLLUPS = {
+    'weekly': (UserWeekly, 'week'),
+    'monthly': (UserMonthly, 'month'),
+}
+
+
+def upsert_rollup_sql(model, keys):
+    """model 테이블의 keys 단위 누적 upsert 문장"""
+    return UPSERT_ROLLUP_SQL.format(
+        table=connection.ops.quote_name(model._meta.db_table),
+        keys=', '.join(keys),
+        key_values=', '.join(f'%({key})s' for key in keys),
+    )
+
+
+def apply_daily_delta(user_id, date, language, sessions, duration_ms=0, chars=0, errors=0,
+                      sum_wpm=0, sum_accuracy=0, best_wpm=None, best_accuracy=None):
+    """(사용자, 날짜, 언어) 일일 통계에 세션 묶음의 합계를 원자적으로 더함"""
+    if not sessions:
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(upsert_rollup_sql(UserDaily, DAILY_KEYS), {
+            'user_id': user_id,
+            'date': date,
+            'language': language,
+            'sessions': sessions,
+            'duration_ms': duration_ms,
+            'chars': chars,
+            'errors': errors,
+            'sum_wpm': sum_wpm,
+            'sum_accuracy': sum_accuracy,
+            'best_wpm': best_wpm,
+            'best_accuracy': best_accuracy,
+            'now': timezone.now(),
+        })
+
+
+def group_sessions(sessions, key_func):
+    """
+    로그인 사용자 세션을 key_func(session) 단위로 합산
+    반환값: {키: apply_daily_delta 인자 형태의 합계 dict}
+    """
+    groups = {}
+    for session in sessions:
+        if session.user_id is None:
+            continue
+        key = key_func(session)
+        group = groups.get(key)
+        if group is None:
+            groups[key] = {
+                'sessions': 1,
+                'duration_ms': session.duration_ms,
+                'chars': session.input_length,
+                'errors': session.error_count,
+                'sum_wpm': session.wpm,
+                'sum_accuracy': session.accuracy,
+                'best_wpm': session.wpm,
+                'best_accuracy': session.accuracy,
+            }
+            continue
+        group['sessions'] += 1
+        group['duration_ms'] += session.duration_ms
+        group['chars'] += session.input_length
+        group['errors'] += session.error_count
+        group['sum_wpm'] += session.wpm
+        group['sum_accuracy'] += session.accuracy
+        group['best_wpm'] = max(group['best_wpm'], session.wpm)
+        group['best_accuracy'] = max(group['best_accuracy'], session.accuracy)
+    return groups
+
+
+def record_sessions_daily(sessions):
+    """
+    세션 묶음을 (사용자, 날짜, 언어) 단위로 합산해 그룹당 upsert 한 번으로 반영
+    날짜는 세션 시작 시각의 Asia/Seoul 기준
+    반환값: 갱신한 그룹 수
+    """
+    groups = group_sessions(
+        sessions, lambda session: (session.user_id, timezone.localdate(session.started_at), session.language)
+    )
+    for (user_id, date, language), group in sorted(groups.items()):
+        apply_daily_delta(user_id, date, language, **group)
+    return len(groups)
+
+
+def record_session_daily(session):
+    """세션 하나를 해당 날짜(Asia/Seoul) 일일 통계에 반영"""
+    record_sessions_daily([session])
+
+
+def record_sessions_periods(sessions):
+    """
+    세션 묶음을 (사용자, 기간 시작일, 언어, 모드) 단위로 합산해 주간/월간 통계에 upsert
+    기간 시작일은 세션 시작 시각의 Asia/Seoul 날짜 기준 (주간은 월요일, 월간은 1일)
+    반환값: 갱신한 그룹 수 (주간 + 월간)
+    """
+    sessions = list(sessions)
+    now = timezone.now()
+    updated = 0
+    with connection.cursor() as cursor:
+        for model, _ in PERIOD_ROLLUPS.values():
+            groups = group_sessions(sessions, lambda session: (
+                session.user_id,
+                model.period_start_for(timezone.localdate(session.started_at)),
+                session.language,
+                session.mode,
+            ))
+            sql = upsert_rollup_sql(model, PERIOD_KEYS)
+            for (user_id, period_start, language, mode), group in sorted(groups.items()):
+                cursor.execute(sql, {
+                    'user_id': user_id,
+                    'period_start': period_start,
+                    'language': language,
+                    'mode': mode,
+                    'now': now,
+                    **group,
+                })
+            updated += len(groups)
+    return updated
+
+
+UPSERT_LIFETIME_SQL = """
+    INSERT INTO {table} (
+        user_id, total_sessions, korean_sessions, english_sessions,
+        total_duration_ms, total_chars, total_errors, sum_wpm, sum_accuracy,
+        best_wpm, best_accuracy, first_session_at, last_session_at,
+        created_at, updated_at
+    )
+    VALUES (
+        %(user_id)s, %(sessions)s, %(korean_sessions)s, %(english_sessions)s,
+        %(duration_ms)s, %(chars)s, %(errors)s, %(sum_wpm)s, %(sum_accuracy)s,
+        %(best_wpm)s, %(best_accuracy)s, %(first_session_at)s, %(last_session_at)s,
+        %(now)s, %(now)s
+    )
+    ON CONFLICT (user_id) DO UPDATE SET
+        total_sessions = {table}.total_sessions + EXCLUDED.total_sessions,
+        korean_sessions = {table}.korean_sessions + EXCLUDED.korean_sessions,
+        english_sessions = {table}.english_sessions + EXCLUDED.english_sessions,
+        total_duration_ms = {table}.total_duration_ms + EXCLUDED.total_duration_ms,
+        total_chars = {table}.total_chars + EXCLUDED.total_chars,
+        total_errors = {table}.total_errors + EXCLUDED.total_errors,
+        sum_wpm = {table}.sum_wpm + EXCLUDED.sum_wpm,
+        sum_accuracy = {table}.sum_accuracy + EXCLUDED.sum_accuracy,
+        best_wpm = GREATEST({table}.best_wpm, EXCLUDED.best_wpm),
+        best_accuracy = GREATEST({table}.best_accuracy, EXCLUDED.best_accuracy),
+        first_session_at = LEAST({table}.first_session_at, EXCLUDED.first_session_at),
+        last_session_at = GREATEST({table}.last_session_at, EXCLUDED.last_session_at),
+        updated_at = EXCLUDED.updated_at
+"""
+
+
+def record_sessions_lifetime(sessions):
+    """
+    세션 묶음을 사용자별로 합산해 누적 통계에 upsert 한 번씩 반영
+    세션 저장과 같은 트랜잭션에서 호출한다. 반환값: 갱신한 사용자 수
+    """
+    groups = {}
+    for session in sessions:
+        if session.user_id is None:
+            continue
+        group = groups.get(session.user_id)
+        if group is None:
+            groups[session.user_id] = {
+                'sessions': 1,
+                'korean_sessions': int(session.language == 'ko'),
+                'english_sessions': int(session.language == 'en'),
+                'duration_ms': session.duration_ms,
+                'chars': session.input_length,
+                'errors': session.error_count,
+                'sum_wpm': session.wpm,
+                'sum_accuracy': session.accuracy,
+                'best_wpm': session.wpm,
+                'best_accuracy': session.accuracy,
+                'first_session_at': session.started_at,
+                'last_session_at': session.started_at,
+            }
+            continue
+        group['sessions'] += 1
+        group['korean_sessions'] += int(session.language == 'ko')
+        group['english_sessions'] += int(session.language == 'en')
+        group['duration_ms'] += session.duration_ms
+        group['chars'] += session.input_length
+        group['errors'] += session.error_count
+        group['sum_wpm'] += session.wpm
+        group['sum_accuracy'] += session.accuracy
+        group['best_wpm'] = max(group['best_wpm'], session.wpm)
+        group['best_accuracy'] = max(group['best_accuracy'], session.accuracy)
+        group['first_session_at'] = min(group['first_session_at'], session.started_at)
+        group['last_session_at'] = max(group['last_session_at'], session.started_at)
+
+    sql = UPSERT_LIFETIME_SQL.format(table=connection.ops.quote_name(UserLifetimeStats._meta.db_table))
+    now = timezone.now()
+    with connection.cursor() as cursor:
+        for user_id, group in sorted(groups.items()):
+            cursor.execute(sql, {'user_id': user_id, 'now': now, **group})
+    return len(groups)
+
+
+# 최고 WPM이 갱신될 때만 기록 세션/정확도/달성 시각을 교체 (동점은 기존 기록 유지)
+UPSERT_PERSONAL_BEST_SQL = """
+    INSERT INTO {table} (
+        user_id, language, mode, text_item_id, session_id,
+        best_wpm, best_accuracy, achieved_at, session_count, updated_at
+    )
+    VALUES %s
+    ON CONFLICT {conflict} DO UPDATE SET
+        session_count = {table}.session_count + EXCLUDED.session_count,
+        session_id = CASE WHEN EXCLUDED.best_wpm > {table}.best_wpm
+            THEN EXCLUDED.session_id ELSE {table}.session_id END,
+        best_accuracy = CASE WHEN EXCLUDED.best_wpm > {table}.best_wpm
+            THEN EXCLUDED.best_accuracy ELSE {table}.best_accuracy END,
+        achieved_at = CASE WHEN EXCLUDED.best_wpm > {table}.best_wpm
+            THEN EXCLUDED.achieved_at ELSE {table}.achieved_at END,
+        best_wpm = GREATEST({table}.best_wpm, EXCLUDED.best_wpm),
+        updated_at = EXCLUDED.updated_at
+"""
+
+# uq_pb_user_lang_mode_text / uq_pb_user_lang_mode_overall 부분 유니크 인덱스에 맞춘 충돌 대상
+PERSONAL_BEST_CONFLICTS = {
+    True: '(user_id, language, mode, text_item_id) WHERE text_item_id IS NOT NULL',
+    False: '(user_id, language, mode) WHERE text_item_id IS NULL',
+}
+
+
+def record_personal_bests(sessions):
+    """
+    세션 묶음을 (사용자, 언어, 모드, 문장) 및 (사용자, 언어, 모드) 전체 단위로 묶어
+    최고 기록을 upsert (충돌 대상별 INSERT 한 번씩). 반환값: 갱신한 행 수
+    """
+    groups = {}
+    for session in sessions:
+        if session.user_id is None:
+            continue
+        for text_item_id in {session.text_item_id, None}:
+            key = (session.user_id, session.language, session.mode, text_item_id)
+            group = groups.get(key)
+            if group is None:
+                groups[key] = [session, 1]
+                continue
+            group[1] += 1
+            if session.wpm > group[0].wpm:
+                group[0] = session
+
+    table = connection.ops.quote_name(PersonalBest._meta.db_table)
+    now = timezone.now()
+    with connection.cursor() as cursor:
+        for per_text, conflict in PERSONAL_BEST_CONFLICTS.items():
+            values = [
+                (user_id, language, mode, text_item_id, best.id,
+                 best.wpm, best.accuracy, best.started_at, count, now)
+                for (user_id, language, mode, text_item_id), (best, count) in sorted(
+                    groups.items(), key=lambda item: (item[0][:3], item[0][3] or 0)
+                )
+                if (text_item_id is not None) == per_text
+            ]
+            if values:
+                execute_values(
+                    cursor.cursor,
+                    UPSERT_PERSONAL_BEST_SQL.format(table=table, conflict=conflict),
+                    values,
+                    page_size=len(values),
+                )
+    return len(groups)
+
+
+def record_session_rollups(sessions):
+    """
+    세션 저장과 같은 트랜잭션에서 누적 통계/주간·월간 통계/개인 최고 기록 갱신
+    주간·월간 통계는 랭킹 생성이 세션 ID 워터마크와 함께 읽으므로 세션과 같이 커밋한다.
+    """
+    sessions = list(sessions)
+    record_sessions_lifetime(sessions)
+    record_sessions_periods(sessions)
+    record_personal_bests(sessions)
+
+
+REBUILD_LIFETIME_SQL = """
+    INSERT INTO {lifetime} (
+        user_id, total_sessions, korean_sessions, english_sessions,
+        total_duration_ms, total_chars, total_errors, sum_wpm, sum_accuracy,
+        best_wpm, best_accuracy, first_session_at, last_session_at,
+        created_at, updated_at
+    )
+    SELECT
+        user_id, COUNT(*),
+        COUNT(*) FILTER (WHERE language = 'ko'), COUNT(*) FILTER (WHERE language = 'en'),
+        SUM(duration_ms), SUM(input_length), SUM(error_count), SUM(wpm), SUM(accuracy),
+        MAX(wpm), MAX(accuracy), MIN(started_at), MAX(started_at),
+        %(now)s, %(now)s
+    FROM {sessions}
+    WHERE user_id = ANY(%(user_ids)s)
+    GROUP BY user_id
+"""
+
+# 그룹별 최고 WPM 세션 1개 (동점은 먼저 시작한 세션) + 그룹 세션 수
+REBUILD_PERSONAL_BEST_SQL = """
+    INSERT INTO {personal_best} (
+        user_id, language, mode, text_item_id, session_id,
+        best_wpm, best_accuracy, achieved_at, session_count, updated_at
+    )
+    SELECT DISTINCT ON (user_id, language, mode, {text_item})
+        user_id, language, mode, {text_item}, id,
+        wpm, accuracy, started_at,
+        COUNT(*) OVER (PARTITION BY user_id, language, mode, {text_item}),
+        %(now)s
+    FROM {sessions}
+    WHERE user_id = ANY(%(user_ids)s) {condition}
+    ORDER BY user_id, language, mode, {text_item}, wpm DESC, started_at, id
+"""
+
+
+def rebuild_user_rollups(user_ids):
+    """
+    사용자 묶음의 누적 통계/개인 최고 기록을 세션 테이블에서 다시 계산 (한 트랜잭션)
+    최초 적재나 점수 재계산 이후에 사용한다. 반환값: (누적 통계 행 수, 최고 기록 행 수)
+    """
+    from apps.sessions.models import TypingSession
+
+    user_ids = list(user_ids)
+    tables = {
+        'lifetime': connection.ops.quote_name(UserLifetimeStats._meta.db_table),
+        'personal_best': connection.ops.quote_name(PersonalBest._meta.db_table),
+        'sessions': connection.ops.quote_name(TypingSession._meta.db_table),
+    }
+    params = {'user_ids': user_ids, 'now': timezone.now()}
+
+    with transaction.atomic():
+        # 같은 사용자의 세션 저장(누적 통계 upsert)과 겹치지 않도록 행 잠금 후 교체
+        list(UserLifetimeStats.objects.select_for_update().filter(user_id__in=user_ids).values_list('pk'))
+        UserLifetimeStats.objects.filter(user_id__in=user_ids).delete()
+        PersonalBest.objects.filter(user_id__in=user_ids).delete()
+        with connection.cursor() as cursor:
+            cursor.execute(REBUILD_LIFETIME_SQL.format(**tables), params)
+            lifetime_rows = cursor.rowcount
+            personal_best_rows = 0
+            for text_item, condition in (
+                ('text_item_id', 'AND text_item_id IS NOT NULL'),
+                ('NULL::bigint', ''),
+            ):
+                cursor.execute(
+                    REBUILD_PERSONAL_BEST_SQL.format(text_item=text_item, condition=condition, **tables),
+                    params,
+                )
+                personal_best_rows += cursor.rowcount
+
+    transaction.on_commit(lambda: bump_user_stats_version(user_ids))
+    return lifetime_rows, personal_best_rows
+
+
+# 보관 파일에 세션이 있는 기간은 세션 테이블만으로 다시 계산할 수 없으므로
+# 사용자별 마지막 보관 세션이 속한 기간까지는 기존 행을 그대로 둔다.
+ARCHIVED_PERIODS_CTE = """
+    WITH archived AS (
+        SELECT user_id, date_trunc(%(unit)s, MAX(last_started_at) AT TIME ZONE %(tz)s)::date AS last_period
+        FROM {archives}
+        WHERE user_id = ANY(%(user_ids)s)
+        GROUP BY user_id
+    )
+"""
+
+DELETE_PERIOD_SQL = ARCHIVED_PERIODS_CTE + """
+    DELETE FROM {table} t
+    WHERE t.user_id = ANY(%(user_ids)s)
+      AND NOT EXISTS (
+        SELECT 1 FROM archived a WHERE a.user_id = t.user_id AND t.period_start <= a.last_period
+      )
+"""
+
+# 세션 시작 시각을 Asia/Seoul 날짜로 바꿔 주/월 단위로 자름 (week는 월요일 시작)
+REBUILD_PERIOD_SQL = ARCHIVED_PERIODS_CTE + """
+    INSERT INTO {table} (
+        user_id, period_start, language, mode,
+        total_sessions, total_duration_ms, total_chars, total_errors,
+        sum_wpm, sum_accuracy, avg_wpm, avg_accuracy, best_wpm, best_accuracy,
+        created_at, updated_at
+    )
+    SELECT
+        s.user_id, date_trunc(%(unit)s, s.started_at AT TIME ZONE %(tz)s)::date AS period, s.language, s.mode,
+        COUNT(*), SUM(s.duration_ms), SUM(s.input_length), SUM(s.error_count),
+        SUM(s.wpm), SUM(s.accuracy), ROUND(SUM(s.wpm) / COUNT(*), 2), ROUND(SUM(s.accuracy) / COUNT(*), 2),
+        MAX(s.wpm), MAX(s.accuracy),
+        %(now)s, %(now)s
+    FROM {sessions} s
+    LEFT JOIN archived a ON a.user_id = s.user_id
+    WHERE s.user_id = ANY(%(user_ids)s)
+      AND (a.last_period IS NULL OR date_trunc(%(unit)s, s.started_at AT TIME ZONE %(tz)s)::date > a.last_period)
+    GROUP BY s.user_id, period, s.language, s.mode
+"""
+
+
+def rebuild_period_stats(user_ids):
+    """
+    사용자 묶음의 주간/월간 통계를 세션 테이블에서 다시 계산 (한 트랜잭션)
+    최초 적재나 점수 재계산 이후에 사용한다. 보관된 세션이 있는 기간은 건드리지 않는다.
+    반환값: {기간 이름: 다시 계산한 행 수}
+    """
+    from apps.sessions.models import SessionArchive, TypingSession
+
+    user_ids = list(user_ids)
+    tables = {
+        'sessions': connection.ops.quote_name(TypingSession._meta.db_table),
+        'archives': connection.ops.quote_name(SessionArchive._meta.db_table),
+    }
+    params = {'user_ids': user_ids, 'tz': timezone.get_current_timezone_name(), 'now': timezone.now()}
+
+    counts = {}
+    with transaction.atomic():
+        with connection.cursor() as cursor:
+            for period, (model, unit) in PERIOD_ROLLUPS.items():
+                # 같은 사용자의 세션 저장(기간 통계 upsert)과 겹치지 않도록 행 잠금 후 교체
+                list(model.objects.select_for_update().filter(user_id__in=user_ids).values_list('pk'))
+                table = connection.ops.quote_name(model._meta.db_table)
+                cursor.execute(DELETE_PERIOD_SQL.format(table=table, **tables), {'unit': unit, **params})
+                cursor.execute(REBUILD_PERIOD_SQL.format(table=table, **tables), {'unit': unit, **params})
+                counts[period] = cursor.rowcount
+    return counts
+
+
+
+# (사용자, 날짜) 목록을 unnest로 펼쳐 그날(Asia/Seoul) 세션만 시작 시각 범위로 읽음
+# 아웃박스가 아직 반영하지 않은 세션은 나중에 워커가 더하므로 제외
+USER_DATES_CTE = """
+    WITH targets AS (
+        SELECT DISTINCT user_id, date FROM unnest(%(user_ids)s::bigint[], %(dates)s::date[]) AS t(user_id, date)
+    )
+"""
+
+DELETE_DAILY_SQL = USER_DATES_CTE + """
+    DELETE FROM {table} d USING targets t WHERE d.user_id = t.user_id AND d.date = t.date
+"""
+
+REBUILD_DAILY_SQL = USER_DATES_CTE + """
+    INSERT INTO {table} (
+        user_id, date, language,
+        total_sessions, total_duration_ms, total_chars, total_errors,
+        sum_wpm, sum_accuracy, avg_wpm, avg_accuracy, best_wpm, best_accuracy,
+        created_at, updated_at
+    )
+    SELECT
+        s.user_id, t.date, s.language,
+        COUNT(*), SUM(s.duration_ms), SUM(s.input_length), SUM(s.error_count),
+        SUM(s.wpm), SUM(s.accuracy), ROUND(SUM(s.wpm) / COUNT(*), 2), ROUND(SUM(s.accuracy) / COUNT(*), 2),
+        MAX(s.wpm), MAX(s.accuracy),
+        %(now)s, %(now)s
+    FROM targets t
+    JOIN {sessions} s
+      ON s.user_id = t.user_id
+     AND s.started_at >= t.date::timestamp AT TIME ZONE %(tz)s
+     AND s.started_at < (t.date + 1)::timestamp AT TIME ZONE %(tz)s
+    WHERE NOT EXISTS (
+        SELECT 1 FROM {outbox} o WHERE o.session_id = s.id AND o.processed_at IS NULL
+    )
+    GROUP BY s.user_id, t.date, s.language
+"""
+
+
+def rebuild_daily_stats(user_dates):
+    """
+    (사용자, 날짜) 묶음의 일일 통계를 세션 테이블에서 다시 계산 (한 트랜잭션)
+    점수 재계산 이후에 사용한다. 반환값: 다시 계산한 행 수
+    """
+    from apps.sessions.models import SessionOutbox, TypingSession
+
+    user_dates = sorted(set(user_dates))
+    if not user_dates:
+        return 0
+    params = {
+        'user_ids': [user_id for user_id, _ in user_dates],
+        'dates': [day for _, day in user_dates],
+        'tz': timezone.get_current_timezone_name(),
+        'now': timezone.now(),
+    }
+    tables = {
+        'table': connection.ops.quote_name(UserDaily._meta.db_table),
+        'sessions': connection.ops.quote_name(TypingSession._meta.db_table),
+        'outbox': connection.ops.quote_name(SessionOutbox._meta.db_table),
+    }
+    with transaction.atomic():
+        # 같은 사용자의 아웃박스 일일 통계 upsert와 겹치지 않도록 행 잠금 후 교체
+        list(
+            UserDaily.objects.select_for_update()
+            .filter(user_id__in=params['user_ids'], date__in=params['dates'])
+            .values_list('pk')
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(DELETE_DAILY_SQL.format(**tables), params)
+            cursor.execute(REBUILD_DAILY_SQL.format(**tables), params)
+            return cursor.rowcount
+
+
+def rebuild_session_rollups(sessions):
+    """
+    점수가 바뀐 세션들에서 파생된 집계를 다시 계산 (일일/주간·월간/누적 통계, 개인 최고 기록)
+
+    일일 통계는 세션이 속한 (사용자, 날짜)만, 나머지는 해당 사용자 전체를 다시 계산한다.
+    보관된 세션이 있는 사용자는 누적 통계/최고 기록을 세션 테이블만으로 다시 계산할 수 없어 건너뛴다.
+    반환값: 건너뛴 사용자 ID 집합
+    """
+    from apps.sessions.models import SessionArchive
+
+    sessions = [session for session in sessions if session.user_id is not None]
+    user_ids = {session.user_id for session in sessions}
+    if not user_ids:
+        return set()
+    archived = set(
+        SessionArchive.objects.filter(user_id__in=user_ids).values_list('user_id', flat=True).distinct()
+    )
+    with transaction.atomic():
+        rebuild_daily_stats((session.user_id, timezone.localdate(session.started_at)) for session in sessions)
+        rebuild_period_stats(user_ids)
+        if user_ids - archived:
+            rebuild_user_rollups(user_ids - archived)
+    transaction.on_commit(lambda: bump_user_stats_version(user_ids))
+    return archived
+
+# 사용자 통계 요약 캐시 (공유 캐시(settings.CACHES)의 버전 키로 모든 프로세스에서 무효화)
+# 버전 키가 컬링/재시작으로 사라져도 예전 버전 값을 재사용하지 않도록 현재 시각으로 시작하고,
+# TTL은 그 밖의 누락에 대비한 안전장치로만 둔다.
+USER_STATS_VERSION_KEY = 'stats:user:{user_id}:version'
+USER_STATS_KEY = 'stats:user:{user_id}:v{version}'
+USER_STATS_TTL_SECONDS = 60
+
+EMPTY_USER_STATS = {
+    'total_sessions': 0,
+    'avg_wpm': 0,
+    'avg_accuracy': 0,
+    'best_wpm': None,
+    'total_time_ms': 0,
+    'korean_sessions': 0,
+    'english_sessions': 0,
+}
+
+
+def bump_user_stats_version(user_ids):
+    """세션 저장 후 호출 - 해당 사용자들의 통계 요약 캐시 무효화"""
+    for user_id in set(user_ids) - {None}:
+        key = USER_STATS_VERSION_KEY.format(user_id=user_id)
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, _new_stats_version(), None)
+
+
+def _new_stats_version():
+    return time.time_ns()
+
+
+def lifetime_summary(lifetime):
+    """UserLifetimeStats → sessions stats 응답 형태"""
+    if lifetime is None or not lifetime.total_sessions:
+        return dict(EMPTY_USER_STATS)
+    return {
+        'total_sessions': lifetime.total_sessions,
+        'avg_wpm': lifetime.avg_wpm,
+        'avg_accuracy': lifetime.avg_accuracy,
+        'best_wpm': lifetime.best_wpm,
+        'total_time_ms': lifetime.total_duration_ms,
+        'korean_sessions': lifetime.korean_sessions,
+        'english_sessions': lifetime.english_sessions,
+    }
+
+
+def get_user_stats(user_id):
+    """사용자 통계 요약 (캐시 → 없으면 누적 통계 PK 조회 1회)"""
+    version = cache.get_or_set(USER_STATS_VERSION_KEY.format(user_id=user_id), _new_stats_version, None)
+    key = USER_STATS_KEY.format(user_id=user_id, version=version)
+    stats = cache.get(key)
+    if stats is None:
+        stats = lifetime_summary(UserLifetimeStats.objects.filter(pk=user_id).first())
+        cache.set(key, stats, USER_STATS_TTL_SECONDS)
+    return stats
@@ -1,9 +1,15 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from .views import UserDailyViewSet
+from .views import (
+    UserDailyViewSet, UserWeeklyViewSet, UserMonthlyViewSet, KeystrokeProfileViewSet, PersonalBestViewSet,
+)
 
 router = DefaultRouter()
 router.register('daily', UserDailyViewSet, basename='stats-daily')
+router.register('weekly', UserWeeklyViewSet, basename='stats-weekly')
+router.register('monthly', UserMonthlyViewSet, basename='stats-monthly')
+router.register('keystrokes', KeystrokeProfileViewSet, basename='stats-keystrokes')
+router.register('personal-bests', PersonalBestViewSet, basename='stats-personal-bests')
 
 urlpatterns = [
     path('', include(router.urls)),
@@ -1,10 +1,24 @@
-from rest_framework import viewsets, permissions, status
+from rest_framework import mixins, viewsets, permissions, status
 from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
-from django.db.models import Sum, Avg, Max
-from datetime import date, timedelta
-from .models import UserDaily
-from .serializers import UserDailySerializer, UserDailyListSerializer, StatsOverviewSerializer
+from django.db.models import Sum, Max
+from django.utils import timezone
+from datetime import timedelta
+from .models import UserDaily, UserWeekly, UserMonthly, KeystrokeProfile, PersonalBest
+from .serializers import (
+    UserDailySerializer,
+    UserDailyListSerializer,
+    UserWeeklySerializer,
+    UserMonthlySerializer,
+    StatsOverviewSerializer,
+    KeystrokeProfileSerializer,
+    PersonalBestSerializer,
+)
+
+
+KEYSTROKE_PROFILE_DEFAULT_LIMIT = 20
+KEYSTROKE_PROFILE_MAX_LIMIT = 200
 
 
 class UserDailyViewSet(viewsets.ReadOnlyModelViewSet):
@@ -21,20 +35,36 @@ class UserDailyViewSet(viewsets.ReadOnlyModelViewSet):
     
     @action(detail=False, methods=['get'])
     def overview(self, request):
-        """통계 요약 조회"""
-        queryset = self.get_queryset()
+        """
+        통계 요약 조회 (최근 30일)
         
-        # 최근 30일 통계
-        thirty_days_ago = date.today() - timedelta(days=30)
-        recent = queryset.filter(date__gte=thirty_days_ago)
+        구간 안에 온전히 들어가는 주는 주간 통계, 앞쪽 남는 날은 일일 통계에서 읽고
+        평균은 합계 / 세션 수로 계산한다 (세션 가중 평균).
+        """
+        since = timezone.localdate() - timedelta(days=30)
+        first_week = UserWeekly.period_start_for(since)
+        if first_week < since:
+            first_week += timedelta(days=7)
         
-        stats = recent.aggregate(
-            total_sessions=Sum('total_sessions'),
-            total_duration_ms=Sum('total_duration_ms'),
-            avg_wpm=Avg('avg_wpm'),
-            avg_accuracy=Avg('avg_accuracy'),
-            best_wpm=Max('best_wpm'),
-        )
+        totals = {'total_sessions': 0, 'total_duration_ms': 0, 'sum_wpm': 0, 'sum_accuracy': 0}
+        best_wpm = None
+        for queryset in (
+            self.get_queryset().filter(date__gte=since, date__lt=first_week),
+            UserWeekly.objects.filter(user=request.user, period_start__gte=first_week),
+        ):
+            stats = queryset.aggregate(
+                total_sessions=Sum('total_sessions'),
+                total_duration_ms=Sum('total_duration_ms'),
+                sum_wpm=Sum('sum_wpm'),
+                sum_accuracy=Sum('sum_accuracy'),
+                best_wpm=Max('best_wpm'),
+            )
+            for key in totals:
+                totals[key] += stats[key] or 0
+            if stats['best_wpm'] is not None:
+                best_wpm = max(best_wpm or 0, stats['best_wpm'])
+        
+        sessions = totals['total_sessions']
         
         # 스트릭 정보
         streak_info = {'current_streak': 0, 'longest_streak': 0}
@@ -45,11 +75,11 @@ class UserDailyViewSet(viewsets.ReadOnlyModelViewSet):
             }
         
         data = {
-            'total_sessions': stats.get('total_sessions') or 0,
-            'total_duration_ms': stats.get('total_duration_ms') or 0,
-            'avg_wpm': stats.get('avg_wpm') or 0,
-            'avg_accuracy': stats.get('avg_accuracy') or 0,
-            'best_wpm': stats.get('best_wpm'),
+            'total_sessions': sessions,
+            'total_duration_ms': totals['total_duration_ms'],
+            'avg_wpm': round(totals['sum_wpm'] / sessions, 2) if sessions else 0,
+            'avg_accuracy': round(totals['sum_accuracy'] / sessions, 2) if sessions else 0,
+            'best_wpm': best_wpm,
             **streak_info,
         }
         
@@ -71,3 +101,113 @@ class UserDailyViewSet(viewsets.ReadOnlyModelViewSet):
         
         serializer = UserDailyListSerializer(queryset, many=True)
         return Response(serializer.data)
+
+
+class PeriodStatsViewSet(viewsets.ReadOnlyModelViewSet):
+    """
+    주간/월간 통계 API 공통 (장기 추이 차트용)
+    
+    ?start=2026-01-01&end=2026-06-30&language=ko&mode=practice
+    start/end는 기간 시작일 기준, 기간 시작일 오름차순
+    """
+    permission_classes = [permissions.IsAuthenticated]
+    model = None
+    
+    def get_queryset(self):
+        params = self.request.query_params
+        queryset = self.model.objects.filter(user=self.request.user)
+        
+        if params.get('start'):
+            queryset = queryset.filter(period_start__gte=params['start'])
+        if params.get('end'):
+            queryset = queryset.filter(period_start__lte=params['end'])
+        if params.get('language'):
+            queryset = queryset.filter(language=params['language'])
+        if params.get('mode'):
+            queryset = queryset.filter(mode=params['mode'])
+        return queryset.order_by('period_start', 'language', 'mode')
+
+
+class UserWeeklyViewSet(PeriodStatsViewSet):
+    """주간 통계 API"""
+    model = UserWeekly
+    serializer_class = UserWeeklySerializer
+
+
+class UserMonthlyViewSet(PeriodStatsViewSet):
+    """월간 통계 API"""
+    model = UserMonthly
+    serializer_class = UserMonthlySerializer
+
+
+class KeystrokeProfileViewSet(mixins.ListModelMixin, viewsets.GenericViewSet):
+    """
+    키 입력 프로필 API (오타 Top / 패턴 분석)
+    
+    ?language=ko&kind=char|bigram&limit=20&min_count=5
+    오타율 높은 순으로 반환 (idx_keyprofile_error_rate 인덱스 순서 그대로 조회)
+    """
+    serializer_class = KeystrokeProfileSerializer
+    permission_classes = [permissions.IsAuthenticated]
+    pagination_class = None
+    
+    def get_queryset(self):
+        params = self.request.query_params
+        queryset = KeystrokeProfile.objects.filter(
+            user=self.request.user,
+            language=params.get('language', 'ko'),
+            kind=params.get('kind', 'char'),
+        ).defer('latency_histogram')
+        
+        try:
+            min_count = int(params.get('min_count', 1))
+            limit = max(1, min(int(params.get('limit', KEYSTROKE_PROFILE_DEFAULT_LIMIT)), KEYSTROKE_PROFILE_MAX_LIMIT))
+        except ValueError:
+            min_count, limit = 1, KEYSTROKE_PROFILE_DEFAULT_LIMIT
+        
+        if min_count > 1:
+            queryset = queryset.filter(total_count__gte=min_count)
+        return queryset.order_by('-error_rate', 'key')[:limit]
+    
+    @action(detail=False, methods=['get'])
+    def slowest(self, request):
+        """입력 간격 p90이 긴 순서"""
+        queryset = KeystrokeProfile.objects.filter(
+            user=request.user,
+            language=request.query_params.get('language', 'ko'),
+            kind=request.query_params.get('kind', 'char'),
+            latency_p90__isnull=False,
+        ).defer('latency_histogram').order_by('-latency_p90', 'key')[:KEYSTROKE_PROFILE_DEFAULT_LIMIT]
+        serializer = self.get_serializer(queryset, many=True)
+        return Response(serializer.data)
+
+
+class PersonalBestViewSet(mixins.ListModelMixin, viewsets.GenericViewSet):
+    """
+    개인 최고 기록 API
+    
+    ?language=ko&mode=practice          언어/모드 전체 최고 기록
+    ?text_item=42                       해당 문장 최고 기록
+    """
+    serializer_class = PersonalBestSerializer
+    permission_classes = [permissions.IsAuthenticated]
+    pagination_class = None
+    
+    def get_queryset(self):
+        params = self.request.query_params
+        queryset = PersonalBest.objects.filter(user=self.request.user)
+        
+        text_item = params.get('text_item')
+        if text_item:
+            try:
+                text_item_id = int(text_item)
+            except ValueError:
+                raise ValidationError({'text_item': '문장 ID는 정수여야 합니다.'})
+            queryset = queryset.filter(text_item_id=text_item_id)
+        else:
+            queryset = queryset.filter(text_item__isnull=True)
+        if params.get('language'):
+            queryset = queryset.filter(language=params['language'])
+        if params.get('mode'):
+            queryset = queryset.filter(mode=params['mode'])
+        return queryset.order_by('language', 'mode')
@@ -4,7 +4,7 @@ from .models import TextPack, TextItem
 
 @admin.register(TextPack)
 class TextPackAdmin(admin.ModelAdmin):
-    list_display = ['id', 'title', 'language', 'difficulty', 'item_count', 'is_active', 'created_at']
+    list_display = ['id', 'title', 'language', 'difficulty', 'avg_difficulty_score', 'item_count', 'is_active', 'created_at']
     list_filter = ['language', 'difficulty', 'is_active', 'source']
     search_fields = ['title', 'description']
     list_editable = ['is_active']
@@ -17,7 +17,7 @@ class TextPackAdmin(admin.ModelAdmin):
 
 @admin.register(TextItem)
 class TextItemAdmin(admin.ModelAdmin):
-    list_display = ['id', 'short_content', 'pack', 'length', 'punctuation_level', 'is_active', 'order']
+    list_display = ['id', 'short_content', 'pack', 'length', 'punctuation_level', 'difficulty_score', 'is_active', 'order']
     list_filter = ['pack', 'is_active', 'pack__language']
     search_fields = ['content']
     list_editable = ['is_active', 'order']
@@ -5,3 +5,6 @@ class TextsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.texts'
     verbose_name = '문장팩'
+
+    def ready(self):
+        from . import signals
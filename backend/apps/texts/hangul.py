@@ -0,0 +1,125 @@
+"""
+한글 자모 분해 / 2벌식 타수 계산 엔진
+
+완성형 한글 11,172 음절 → 자모 → 2벌식 키 입력을 모듈 로드 시 한 번 표로 만들어 두고,
+문자열 단위 변환은 str.translate 한 번으로 처리한다. 음절마다 나눗셈을 반복하지 않으므로
+세션/문장 수천 건의 타수를 초 단위 이내에 계산할 수 있다.
+
+키 문자열에서 대문자는 Shift 입력을 뜻한다 (ㄲ → 'R', ㅒ → 'O').
+"""
+from array import array
+
+
+HANGUL_BASE = 0xAC00
+HANGUL_COUNT = 11172
+JUNGSEONG_COUNT = 21
+JONGSEONG_COUNT = 28
+
+CHOSEONG = 'ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ'
+JUNGSEONG = 'ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ'
+JONGSEONG = ['', 'ㄱ', 'ㄲ', 'ㄳ', 'ㄴ', 'ㄵ', 'ㄶ', 'ㄷ', 'ㄹ', 'ㄺ', 'ㄻ', 'ㄼ', 'ㄽ', 'ㄾ',
+             'ㄿ', 'ㅀ', 'ㅁ', 'ㅂ', 'ㅄ', 'ㅅ', 'ㅆ', 'ㅇ', 'ㅈ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ']
+
+# 2벌식 자판 (홑자모 → 키)
+JAMO_KEYS = {
+    'ㅂ': 'q', 'ㅈ': 'w', 'ㄷ': 'e', 'ㄱ': 'r', 'ㅅ': 't',
+    'ㅛ': 'y', 'ㅕ': 'u', 'ㅑ': 'i', 'ㅐ': 'o', 'ㅔ': 'p',
+    'ㅁ': 'a', 'ㄴ': 's', 'ㅇ': 'd', 'ㄹ': 'f', 'ㅎ': 'g',
+    'ㅗ': 'h', 'ㅓ': 'j', 'ㅏ': 'k', 'ㅣ': 'l',
+    'ㅋ': 'z', 'ㅌ': 'x', 'ㅊ': 'c', 'ㅍ': 'v', 'ㅠ': 'b', 'ㅜ': 'n', 'ㅡ': 'm',
+    'ㅃ': 'Q', 'ㅉ': 'W', 'ㄸ': 'E', 'ㄲ': 'R', 'ㅆ': 'T', 'ㅒ': 'O', 'ㅖ': 'P',
+}
+
+# 두 번 나눠 입력하는 겹모음/겹받침
+COMPOUND_JAMO = {
+    'ㅘ': 'ㅗㅏ', 'ㅙ': 'ㅗㅐ', 'ㅚ': 'ㅗㅣ', 'ㅝ': 'ㅜㅓ', 'ㅞ': 'ㅜㅔ', 'ㅟ': 'ㅜㅣ', 'ㅢ': 'ㅡㅣ',
+    'ㄳ': 'ㄱㅅ', 'ㄵ': 'ㄴㅈ', 'ㄶ': 'ㄴㅎ', 'ㄺ': 'ㄹㄱ', 'ㄻ': 'ㄹㅁ', 'ㄼ': 'ㄹㅂ',
+    'ㄽ': 'ㄹㅅ', 'ㄾ': 'ㄹㅌ', 'ㄿ': 'ㄹㅍ', 'ㅀ': 'ㄹㅎ', 'ㅄ': 'ㅂㅅ',
+}
+
+# 영문 자판에서 Shift가 필요한 기호
+SHIFTED_SYMBOLS = '~!@#$%^&*()_+{}|:"<>?'
+
+
+def _jamo_keys(jamo):
+    return ''.join(JAMO_KEYS[part] for part in COMPOUND_JAMO.get(jamo, jamo))
+
+
+def _build_tables():
+    jamo_table = {}
+    key_table = {}
+    keystrokes = array('B', bytes(HANGUL_COUNT))
+
+    for offset in range(HANGUL_COUNT):
+        cho = CHOSEONG[offset // (JUNGSEONG_COUNT * JONGSEONG_COUNT)]
+        jung = JUNGSEONG[(offset // JONGSEONG_COUNT) % JUNGSEONG_COUNT]
+        jong = JONGSEONG[offset % JONGSEONG_COUNT]
+        keys = _jamo_keys(cho) + _jamo_keys(jung) + (_jamo_keys(jong) if jong else '')
+
+        jamo_table[HANGUL_BASE + offset] = cho + jung + jong
+        key_table[HANGUL_BASE + offset] = keys
+        keystrokes[offset] = len(keys)
+
+    # 낱자 입력 (호환 자모 U+3131-U+3163)
+    for jamo in set(CHOSEONG) | set(JUNGSEONG) | set(JONGSEONG[1:]):
+        key_table[ord(jamo)] = _jamo_keys(jamo)
+
+    return jamo_table, key_table, keystrokes
+
+
+# 음절 → 자모 문자열, 음절/낱자 → 2벌식 키 문자열, 음절 오프셋 → 타수
+JAMO_TABLE, KEY_TABLE, SYLLABLE_KEYSTROKES = _build_tables()
+
+# Shift와 함께 누르는 키
+SHIFT_KEYS = frozenset('ABCDEFGHIJKLMNOPQRSTUVWXYZ' + SHIFTED_SYMBOLS)
+
+
+def is_syllable(ch):
+    return HANGUL_BASE <= ord(ch) < HANGUL_BASE + HANGUL_COUNT
+
+
+def decompose(text):
+    """완성형 음절을 호환 자모로 분해 ('한글' → 'ㅎㅏㄴㄱㅡㄹ')"""
+    return text.translate(JAMO_TABLE)
+
+
+def to_keys(text):
+    """
+    2벌식 키 입력열로 변환 ('한글' → 'gksrmf')
+
+    한글이 아닌 문자는 그대로 두어 한 번의 키 입력으로 센다.
+    """
+    return text.translate(KEY_TABLE)
+
+
+def keystroke_count(text, include_spaces=True):
+    """2벌식 기준 총 타수"""
+    keys = to_keys(text)
+    if include_spaces:
+        return len(keys)
+    return len(keys) - sum(map(str.isspace, keys))
+
+
+def shift_count(keys):
+    """키 입력열(to_keys 결과)의 Shift 입력 수"""
+    return sum(map(SHIFT_KEYS.__contains__, keys))
+
+
+def syllable_keystrokes(ch):
+    """완성형 음절 하나의 타수 (한글 음절이 아니면 None)"""
+    offset = ord(ch) - HANGUL_BASE
+    if 0 <= offset < HANGUL_COUNT:
+        return SYLLABLE_KEYSTROKES[offset]
+    return None
+
+
+def keystroke_counts(texts):
+    """문자열 목록의 타수 일괄 계산"""
+    return array('l', (len(text.translate(KEY_TABLE)) for text in texts))
+
+
+def keystrokes_per_minute(text, duration_ms):
+    """문장 입력 시간 기준 분당 타수 (KPM)"""
+    if not duration_ms:
+        return 0.0
+    return round(keystroke_count(text) * 60000 / duration_ms, 2)
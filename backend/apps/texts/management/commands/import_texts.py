@@ -0,0 +1,193 @@
+"""
+대용량 문장 코퍼스 가져오기 커맨드
+Usage: python manage.py import_texts corpus.jsonl --pack-title "뉴스 문장" --language ko [--difficulty 3]
+
+지원 형식 (확장자로 자동 판별, --format으로 지정 가능)
+- jsonl: 한 줄에 {"content": "..."} (또는 "text")
+- csv: 헤더에 content (또는 text) 컬럼
+- txt: 한 줄에 한 문장
+
+파일을 한 줄씩 스트리밍하며 청크 단위로 적재하므로 메모리 사용량이 일정하고,
+같은 팩에 이미 있는 문장(content_hash 기준)은 건너뛰어 재실행해도 안전하다.
+적재는 INSERT ... ON CONFLICT DO NOTHING이므로 같은 팩으로 동시에 가져와도
+uq_item_pack_hash 제약에 걸린 문장은 건너뛴 것으로 센다.
+희귀 바이그램 비율은 코퍼스 기준이 필요하므로 가져오기 후 score_texts로 갱신한다.
+"""
+import csv
+import json
+import time
+from itertools import islice
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.db.models import Max
+from psycopg2.extras import execute_values
+from apps.texts.metrics import compute_metrics, content_hash, normalize_content
+from apps.texts.models import TextPack, TextItem
+from apps.texts.pools import bump_pool_version
+
+
+FORMAT_BY_SUFFIX = {
+    '.jsonl': 'jsonl',
+    '.ndjson': 'jsonl',
+    '.csv': 'csv',
+    '.txt': 'txt',
+}
+
+
+def read_jsonl(fp):
+    for line in fp:
+        line = line.strip()
+        if not line:
+            continue
+        record = json.loads(line)
+        if isinstance(record, str):
+            yield record
+        else:
+            yield record.get('content') or record.get('text') or ''
+
+
+def read_csv(fp):
+    for row in csv.DictReader(fp):
+        yield row.get('content') or row.get('text') or ''
+
+
+def read_txt(fp):
+    yield from fp
+
+
+READERS = {
+    'jsonl': read_jsonl,
+    'csv': read_csv,
+    'txt': read_txt,
+}
+
+
+def insert_new_items(items):
+    """
+    문장 일괄 INSERT (팩 내 같은 해시는 ON CONFLICT DO NOTHING)
+    반환값: 실제로 추가된 행 수
+    """
+    if not items:
+        return 0
+    fields = [field for field in TextItem._meta.concrete_fields if not field.primary_key]
+    table = connection.ops.quote_name(TextItem._meta.db_table)
+    columns = ', '.join(connection.ops.quote_name(field.column) for field in fields)
+    rows = [
+        tuple(field.get_db_prep_save(field.pre_save(item, True), connection) for field in fields)
+        for item in items
+    ]
+    sql = (
+        f'INSERT INTO {table} ({columns}) VALUES %s '
+        f'ON CONFLICT ON CONSTRAINT uq_item_pack_hash DO NOTHING RETURNING id'
+    )
+    with connection.cursor() as cursor:
+        inserted = execute_values(cursor.cursor, sql, rows, page_size=len(rows), fetch=True)
+    return len(inserted)
+
+
+def chunked(iterable, size):
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+class Command(BaseCommand):
+    help = 'JSONL/CSV/텍스트 파일의 문장을 문장팩으로 대량 가져옵니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('paths', nargs='+', help='가져올 파일 경로')
+        parser.add_argument('--pack-title', required=True, help='대상 문장팩 이름 (없으면 생성)')
+        parser.add_argument(
+            '--language',
+            required=True,
+            choices=[choice[0] for choice in TextPack.LANGUAGE_CHOICES],
+            help='문장팩 언어',
+        )
+        parser.add_argument('--difficulty', type=int, default=3, help='새 문장팩 난이도 (1-5)')
+        parser.add_argument('--format', choices=list(READERS), help='파일 형식 (기본: 확장자로 판별)')
+        parser.add_argument('--batch-size', type=int, default=2000, help='청크 크기')
+
+    def handle(self, *args, **options):
+        pack, created = TextPack.objects.get_or_create(
+            title=options['pack_title'],
+            language=options['language'],
+            defaults={
+                'difficulty': options['difficulty'],
+                'source': 'import',
+                'is_active': True,
+            }
+        )
+        if created:
+            self.stdout.write(f'  ✅ Pack 생성: {pack.title}')
+        else:
+            self.stdout.write(f'  ⏭️ 기존 Pack에 추가: {pack.title}')
+
+        next_order = (pack.items.aggregate(max_order=Max('order'))['max_order'] or -1) + 1
+        totals = {'read': 0, 'inserted': 0, 'skipped': 0}
+        started = time.monotonic()
+
+        for path in options['paths']:
+            path = Path(path)
+            fmt = options['format'] or FORMAT_BY_SUFFIX.get(path.suffix.lower())
+            if fmt is None:
+                raise CommandError(f'형식을 알 수 없습니다: {path} (--format 지정 필요)')
+
+            self.stdout.write(f'📥 {path} ({fmt}) 가져오는 중...')
+            with path.open(encoding='utf-8-sig', newline='') as fp:
+                for chunk in chunked(READERS[fmt](fp), options['batch_size']):
+                    inserted, skipped, next_order = self._import_chunk(pack, chunk, next_order)
+                    totals['read'] += len(chunk)
+                    totals['inserted'] += inserted
+                    totals['skipped'] += skipped
+
+                    elapsed = max(time.monotonic() - started, 1e-6)
+                    self.stdout.write(
+                        f"     → {totals['read']}줄 처리, {totals['inserted']}개 추가, "
+                        f"{totals['skipped']}개 건너뜀 ({totals['read'] / elapsed:,.0f}줄/s)"
+                    )
+
+        if totals['inserted']:
+            # 일괄 INSERT는 시그널을 보내지 않으므로 랜덤 선택 풀을 직접 무효화
+            bump_pool_version()
+
+        elapsed = time.monotonic() - started
+        self.stdout.write(self.style.SUCCESS(
+            f"✅ 가져오기 완료! {totals['inserted']}개 추가 / {totals['skipped']}개 건너뜀 ({elapsed:.1f}s)"
+        ))
+
+    def _import_chunk(self, pack, lines, start_order):
+        """청크 하나 정규화 → 중복 제거 → 일괄 적재. 반환값: (추가 수, 건너뛴 수, 다음 순서)"""
+        contents = {}
+        for line in lines:
+            content = normalize_content(line)
+            if content:
+                contents.setdefault(content, None)
+
+        hashes = [content_hash(content) for content in contents]
+        existing = set(
+            TextItem.objects.filter(pack=pack, content_hash__in=hashes).values_list('content_hash', flat=True)
+        )
+        new_contents = [
+            (content, item_hash) for content, item_hash in zip(contents, hashes) if item_hash not in existing
+        ]
+        metrics = compute_metrics(content for content, _ in new_contents)
+
+        items = [
+            TextItem(
+                pack=pack,
+                content=content,
+                content_hash=item_hash,
+                order=start_order + index,
+                **item_metrics,
+            )
+            for index, ((content, item_hash), item_metrics) in enumerate(zip(new_contents, metrics))
+        ]
+
+        inserted = insert_new_items(items)
+        # 충돌로 빠진 문장의 순서 값은 비워 두어 다음 청크와 겹치지 않게 함
+        return inserted, len(lines) - inserted, start_order + len(items)
@@ -0,0 +1,44 @@
+"""
+문장 난이도 지표 일괄 계산 커맨드
+Usage: python manage.py score_texts [--language ko] [--pack 1 --pack 2]
+"""
+import time
+
+from django.core.management.base import BaseCommand
+from apps.texts.models import TextPack
+from apps.texts.services import score_packs
+
+
+class Command(BaseCommand):
+    help = '문장팩 단위로 문장 난이도 지표(문자 구성/시프트/자모/희귀 바이그램)를 계산합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--language',
+            choices=[choice[0] for choice in TextPack.LANGUAGE_CHOICES],
+            help='대상 언어 (기본: 전체)',
+        )
+        parser.add_argument(
+            '--pack',
+            type=int,
+            action='append',
+            help='대상 문장팩 ID (여러 번 지정 가능)',
+        )
+
+    def handle(self, *args, **options):
+        packs = TextPack.objects.all()
+        if options['language']:
+            packs = packs.filter(language=options['language'])
+        if options['pack']:
+            packs = packs.filter(id__in=options['pack'])
+
+        self.stdout.write('📊 문장 난이도 계산 시작...')
+        started = time.monotonic()
+
+        results = score_packs(packs)
+        for pack, count in results.items():
+            score = f'{pack.avg_difficulty_score:.2f}' if pack.avg_difficulty_score is not None else '-'
+            self.stdout.write(f'  ✅ {pack.title}: {count}개 문장 (평균 난이도 {score})')
+
+        elapsed = time.monotonic() - started
+        self.stdout.write(self.style.SUCCESS(f'✅ 난이도 계산 완료! ({elapsed:.1f}s)'))
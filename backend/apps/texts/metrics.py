@@ -0,0 +1,170 @@
+"""
+texts 문장 지표 계산 - 정규화/해시/글자 구성/난이도
+
+문장 하나에서 바로 계산되는 지표(글자 수, 2벌식 타수, 문자 구성비, 시프트 비율,
+자모 복잡도, 기호 난이도)와 코퍼스 기준이 필요한 희귀 바이그램 비율을 함께 계산해
+TextItem 저장 컬럼에 그대로 넣을 수 있는 dict로 반환한다.
+"""
+import hashlib
+import unicodedata
+from collections import Counter
+
+from .hangul import HANGUL_BASE, HANGUL_COUNT, SYLLABLE_KEYSTROKES, shift_count, to_keys
+
+
+# 기호 비율(공백 제외 글자 대비) 상한 → punctuation_level
+PUNCTUATION_LEVEL_THRESHOLDS = [
+    (0.0, 0),
+    (0.05, 1),
+    (0.10, 2),
+    (0.15, 3),
+    (0.25, 4),
+]
+
+# 희귀 바이그램 기준: 코퍼스 전체 바이그램 중 이 비율 미만으로 등장
+RARE_BIGRAM_SHARE = 0.00001
+
+# analyze()가 채우는 TextItem 컬럼
+METRIC_FIELDS = [
+    'length', 'char_count', 'word_count', 'keystroke_count', 'punctuation_level',
+    'hangul_ratio', 'latin_ratio', 'digit_ratio', 'symbol_ratio',
+    'shift_ratio', 'jamo_complexity', 'rare_bigram_ratio', 'difficulty_score',
+]
+
+# 종합 난이도(0-100) 가중치
+DIFFICULTY_WEIGHTS = {
+    'length': 20,
+    'punctuation': 15,
+    'shift': 20,
+    'jamo': 15,
+    'rare_bigram': 20,
+    'digit': 10,
+}
+
+
+def normalize_content(content):
+    """NFC 정규화 + 앞뒤 공백 제거"""
+    return unicodedata.normalize('NFC', content).strip()
+
+
+def content_hash(content):
+    """정규화된 문장의 SHA-256 해시 (중복 판별용)"""
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+
+def text_length(content):
+    """글자 수 (공백 제외, TextItem.length 기준)"""
+    return len(content.replace(' ', ''))
+
+
+def punctuation_level_for_ratio(ratio):
+    """기호 비율 → 기호 난이도 (0-5)"""
+    for threshold, level in PUNCTUATION_LEVEL_THRESHOLDS:
+        if ratio <= threshold:
+            return level
+    return 5
+
+
+def bigrams(content):
+    """공백을 제외한 연속 문자 바이그램 (소문자 기준)"""
+    chars = [ch for ch in content.lower() if not ch.isspace()]
+    return zip(chars, chars[1:])
+
+
+def build_bigram_reference(contents):
+    """코퍼스 바이그램 빈도표 생성 (희귀 바이그램 판별 기준)"""
+    counts = Counter()
+    for content in contents:
+        counts.update(bigrams(content))
+    return counts
+
+
+def rare_bigram_threshold(bigram_reference):
+    """희귀 바이그램 판별 기준 빈도"""
+    return sum(bigram_reference.values()) * RARE_BIGRAM_SHARE
+
+
+def analyze(content, bigram_reference=None, rare_threshold=None):
+    """
+    문장 하나의 지표 계산
+
+    bigram_reference가 없으면 rare_bigram_ratio는 0으로 두어
+    난이도에 반영되지 않는다.
+    """
+    hangul = latin = digit = symbol = other = 0
+    hangul_keystrokes = 0
+    for ch in content:
+        if ch.isspace():
+            continue
+        offset = ord(ch) - HANGUL_BASE
+        if 0 <= offset < HANGUL_COUNT:
+            hangul += 1
+            hangul_keystrokes += SYLLABLE_KEYSTROKES[offset]
+        elif ch.isascii() and ch.isalpha():
+            latin += 1
+        elif ch.isdigit():
+            digit += 1
+        elif not ch.isalnum():
+            symbol += 1
+        else:
+            other += 1
+
+    visible = hangul + latin + digit + symbol + other
+    keys = to_keys(content)
+    keystrokes = len(keys)
+    typed_keys = keystrokes - sum(map(str.isspace, keys))
+
+    metrics = {
+        'length': text_length(content),
+        'char_count': len(content),
+        'word_count': len(content.split()),
+        'keystroke_count': keystrokes,
+        'punctuation_level': punctuation_level_for_ratio(symbol / visible) if visible else 0,
+        'hangul_ratio': _ratio(hangul, visible),
+        'latin_ratio': _ratio(latin, visible),
+        'digit_ratio': _ratio(digit, visible),
+        'symbol_ratio': _ratio(symbol, visible),
+        'shift_ratio': _ratio(shift_count(keys), typed_keys),
+        'jamo_complexity': round(hangul_keystrokes / hangul, 3) if hangul else 0.0,
+        'rare_bigram_ratio': 0.0,
+    }
+
+    if bigram_reference:
+        if rare_threshold is None:
+            rare_threshold = rare_bigram_threshold(bigram_reference)
+        pairs = list(bigrams(content))
+        rare = sum(1 for pair in pairs if bigram_reference.get(pair, 0) < rare_threshold)
+        metrics['rare_bigram_ratio'] = _ratio(rare, len(pairs))
+
+    metrics['difficulty_score'] = difficulty_score(metrics)
+    return metrics
+
+
+def difficulty_score(metrics):
+    """지표 → 종합 난이도 (0-100)"""
+    weights = DIFFICULTY_WEIGHTS
+    jamo = max(0.0, (metrics['jamo_complexity'] - 2) / 3) if metrics['jamo_complexity'] else 0.0
+    score = (
+        weights['length'] * min(metrics['length'] / 120, 1)
+        + weights['punctuation'] * metrics['punctuation_level'] / 5
+        + weights['shift'] * min(metrics['shift_ratio'] / 0.3, 1)
+        + weights['jamo'] * min(jamo, 1)
+        + weights['rare_bigram'] * min(metrics['rare_bigram_ratio'] / 0.3, 1)
+        + weights['digit'] * min(metrics['digit_ratio'] / 0.2, 1)
+    )
+    return round(score, 2)
+
+
+def compute_metrics(contents, bigram_reference=None):
+    """
+    문장 목록의 지표 일괄 계산
+
+    입력은 normalize_content를 거친 문장이어야 한다.
+    희귀 바이그램 기준 빈도는 목록 전체에 대해 한 번만 계산한다.
+    """
+    rare_threshold = rare_bigram_threshold(bigram_reference) if bigram_reference else None
+    return [analyze(content, bigram_reference, rare_threshold) for content in contents]
+
+
+def _ratio(part, whole):
+    return round(part / whole, 4) if whole else 0.0
@@ -0,0 +1,40 @@
+# Generated by Django 4.2.30 on 2026-10-17 21:51
+
+import hashlib
+import unicodedata
+
+from django.db import migrations, models
+
+
+def backfill_content_hash(apps, schema_editor):
+    TextItem = apps.get_model('texts', 'TextItem')
+    batch = []
+    for item in TextItem.objects.filter(content_hash='').only('id', 'content').iterator(chunk_size=2000):
+        normalized = unicodedata.normalize('NFC', item.content).strip()
+        item.content_hash = hashlib.sha256(normalized.encode('utf-8')).hexdigest()
+        batch.append(item)
+        if len(batch) >= 2000:
+            TextItem.objects.bulk_update(batch, ['content_hash'])
+            batch = []
+    if batch:
+        TextItem.objects.bulk_update(batch, ['content_hash'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('texts', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='textitem',
+            name='content_hash',
+            field=models.CharField(blank=True, help_text='NFC 정규화 문장의 SHA-256 (가져오기 중복 판별용)', max_length=64, verbose_name='문장 해시'),
+        ),
+        migrations.AddIndex(
+            model_name='textitem',
+            index=models.Index(fields=['pack', 'content_hash'], name='idx_item_pack_hash'),
+        ),
+        migrations.RunPython(backfill_content_hash, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,186 @@
+# Generated by Django 4.2.30 on 2026-10-17 21:54
+
+import unicodedata
+
+from django.db import migrations, models
+
+
+# 아래 지표 계산은 apps.texts.metrics 의 마이그레이션 시점 사본
+# (이후 지표 코드가 바뀌어도 이 마이그레이션의 결과는 달라지지 않도록 고정)
+LOCAL_METRIC_FIELDS = [
+    'length', 'char_count', 'word_count', 'punctuation_level',
+    'hangul_ratio', 'latin_ratio', 'digit_ratio', 'symbol_ratio',
+    'shift_ratio', 'jamo_complexity', 'difficulty_score',
+]
+
+PUNCTUATION_LEVEL_THRESHOLDS = [(0.0, 0), (0.05, 1), (0.10, 2), (0.15, 3), (0.25, 4)]
+SHIFTED_SYMBOLS = set('~!@#$%^&*()_+{}|:"<>?')
+HANGUL_BASE = 0xAC00
+HANGUL_LAST = 0xD7A3
+SHIFT_CHOSEONG = {1, 4, 8, 10, 13}
+SHIFT_JUNGSEONG = {3, 7}
+SHIFT_JONGSEONG = {2, 20}
+COMPOUND_JUNGSEONG = {9, 10, 11, 14, 15, 16, 19}
+COMPOUND_JONGSEONG = {3, 5, 6, 9, 10, 11, 12, 13, 14, 15, 18}
+DIFFICULTY_WEIGHTS = {'length': 20, 'punctuation': 15, 'shift': 20, 'jamo': 15, 'digit': 10}
+
+
+def _ratio(part, whole):
+    return round(part / whole, 4) if whole else 0.0
+
+
+def local_metrics(content):
+    """문장 하나의 지표 (희귀 바이그램 비율 0 기준 난이도)"""
+    content = unicodedata.normalize('NFC', content).strip()
+    hangul = latin = digit = symbol = other = shift = 0
+    keystrokes = 0
+    for ch in content:
+        if ch.isspace():
+            continue
+        code = ord(ch)
+        if HANGUL_BASE <= code <= HANGUL_LAST:
+            hangul += 1
+            offset = code - HANGUL_BASE
+            cho, jung, jong = offset // 588, (offset % 588) // 28, offset % 28
+            keystrokes += 1
+            keystrokes += 2 if jung in COMPOUND_JUNGSEONG else 1
+            if jong:
+                keystrokes += 2 if jong in COMPOUND_JONGSEONG else 1
+            if cho in SHIFT_CHOSEONG or jung in SHIFT_JUNGSEONG or jong in SHIFT_JONGSEONG:
+                shift += 1
+        elif ch.isascii() and ch.isalpha():
+            latin += 1
+            if ch.isupper():
+                shift += 1
+        elif ch.isdigit():
+            digit += 1
+        elif not ch.isalnum():
+            symbol += 1
+            if ch in SHIFTED_SYMBOLS:
+                shift += 1
+        else:
+            other += 1
+
+    visible = hangul + latin + digit + symbol + other
+    punctuation_level = 0
+    if visible:
+        punctuation_level = 5
+        for threshold, level in PUNCTUATION_LEVEL_THRESHOLDS:
+            if symbol / visible <= threshold:
+                punctuation_level = level
+                break
+
+    metrics = {
+        'length': len(content.replace(' ', '')),
+        'char_count': len(content),
+        'word_count': len(content.split()),
+        'punctuation_level': punctuation_level,
+        'hangul_ratio': _ratio(hangul, visible),
+        'latin_ratio': _ratio(latin, visible),
+        'digit_ratio': _ratio(digit, visible),
+        'symbol_ratio': _ratio(symbol, visible),
+        'shift_ratio': _ratio(shift, visible),
+        'jamo_complexity': round(keystrokes / hangul, 3) if hangul else 0.0,
+    }
+
+    weights = DIFFICULTY_WEIGHTS
+    jamo = max(0.0, (metrics['jamo_complexity'] - 2) / 3) if metrics['jamo_complexity'] else 0.0
+    metrics['difficulty_score'] = round(
+        weights['length'] * min(metrics['length'] / 120, 1)
+        + weights['punctuation'] * punctuation_level / 5
+        + weights['shift'] * min(metrics['shift_ratio'] / 0.3, 1)
+        + weights['jamo'] * min(jamo, 1)
+        + weights['digit'] * min(metrics['digit_ratio'] / 0.2, 1),
+        2,
+    )
+    return metrics
+
+
+def backfill_local_metrics(apps, schema_editor):
+    # 희귀 바이그램 비율은 코퍼스 기준이 필요하므로 score_texts로 별도 갱신
+    TextItem = apps.get_model('texts', 'TextItem')
+    batch = []
+    for item in TextItem.objects.only('id', 'content').iterator(chunk_size=2000):
+        metrics = local_metrics(item.content)
+        for field in LOCAL_METRIC_FIELDS:
+            setattr(item, field, metrics[field])
+        batch.append(item)
+        if len(batch) >= 2000:
+            TextItem.objects.bulk_update(batch, LOCAL_METRIC_FIELDS)
+            batch = []
+    if batch:
+        TextItem.objects.bulk_update(batch, LOCAL_METRIC_FIELDS)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('texts', '0003_textitem_content_hash'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='textitem',
+            name='char_count',
+            field=models.PositiveIntegerField(default=0, help_text='공백 포함', verbose_name='문자 수'),
+        ),
+        migrations.AddField(
+            model_name='textitem',
+            name='difficulty_score',
+            field=models.FloatField(db_index=True, default=0, help_text='0-100, 지표 가중 합', verbose_name='난이도 점수'),
+        ),
+        migrations.AddField(
+            model_name='textitem',
+            name='digit_ratio',
+            field=models.FloatField(default=0, verbose_name='숫자 비율'),
+        ),
+        migrations.AddField(
+            model_name='textitem',
+            name='hangul_ratio',
+            field=models.FloatField(default=0, verbose_name='한글 비율'),
+        ),
+        migrations.AddField(
+            model_name='textitem',
+            name='jamo_complexity',
+            field=models.FloatField(default=0, help_text='한글 음절당 평균 타수', verbose_name='자모 복잡도'),
+        ),
+        migrations.AddField(
+            model_name='textitem',
+            name='latin_ratio',
+            field=models.FloatField(default=0, verbose_name='영문 비율'),
+        ),
+        migrations.AddField(
+            model_name='textitem',
+            name='rare_bigram_ratio',
+            field=models.FloatField(default=0, help_text='언어 코퍼스 기준', verbose_name='희귀 바이그램 비율'),
+        ),
+        migrations.AddField(
+            model_name='textitem',
+            name='shift_ratio',
+            field=models.FloatField(default=0, verbose_name='Shift 입력 비율'),
+        ),
+        migrations.AddField(
+            model_name='textitem',
+            name='symbol_ratio',
+            field=models.FloatField(default=0, verbose_name='기호 비율'),
+        ),
+        migrations.AddField(
+            model_name='textitem',
+            name='word_count',
+            field=models.PositiveIntegerField(default=0, verbose_name='단어 수'),
+        ),
+        migrations.AddField(
+            model_name='textpack',
+            name='avg_difficulty_score',
+            field=models.FloatField(blank=True, db_index=True, help_text='활성 문장 difficulty_score 평균 (score_texts로 갱신)', null=True, verbose_name='평균 난이도 점수'),
+        ),
+        migrations.AddIndex(
+            model_name='textitem',
+            index=models.Index(fields=['pack', 'is_active', 'difficulty_score'], name='idx_item_pack_score'),
+        ),
+        migrations.AddIndex(
+            model_name='textpack',
+            index=models.Index(fields=['language', 'is_active', 'avg_difficulty_score'], name='idx_pack_lang_active_score'),
+        ),
+        migrations.RunPython(backfill_local_metrics, migrations.RunPython.noop),
+    ]
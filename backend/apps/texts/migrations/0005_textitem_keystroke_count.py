@@ -0,0 +1,112 @@
+# Generated by Django 4.2.30 on 2026-10-17 22:02
+
+import unicodedata
+
+from django.db import migrations, models
+
+
+# 아래 타수/난이도 계산은 apps.texts.hangul / apps.texts.metrics 의 마이그레이션 시점 사본
+# (이후 지표 코드가 바뀌어도 이 마이그레이션의 결과는 달라지지 않도록 고정)
+KEYSTROKE_METRIC_FIELDS = ['keystroke_count', 'shift_ratio', 'jamo_complexity', 'difficulty_score']
+
+HANGUL_BASE = 0xAC00
+HANGUL_COUNT = 11172
+CHOSEONG = 'ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ'
+JUNGSEONG = 'ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ'
+JONGSEONG = ['', 'ㄱ', 'ㄲ', 'ㄳ', 'ㄴ', 'ㄵ', 'ㄶ', 'ㄷ', 'ㄹ', 'ㄺ', 'ㄻ', 'ㄼ', 'ㄽ', 'ㄾ',
+             'ㄿ', 'ㅀ', 'ㅁ', 'ㅂ', 'ㅄ', 'ㅅ', 'ㅆ', 'ㅇ', 'ㅈ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ']
+JAMO_KEYS = {
+    'ㅂ': 'q', 'ㅈ': 'w', 'ㄷ': 'e', 'ㄱ': 'r', 'ㅅ': 't',
+    'ㅛ': 'y', 'ㅕ': 'u', 'ㅑ': 'i', 'ㅐ': 'o', 'ㅔ': 'p',
+    'ㅁ': 'a', 'ㄴ': 's', 'ㅇ': 'd', 'ㄹ': 'f', 'ㅎ': 'g',
+    'ㅗ': 'h', 'ㅓ': 'j', 'ㅏ': 'k', 'ㅣ': 'l',
+    'ㅋ': 'z', 'ㅌ': 'x', 'ㅊ': 'c', 'ㅍ': 'v', 'ㅠ': 'b', 'ㅜ': 'n', 'ㅡ': 'm',
+    'ㅃ': 'Q', 'ㅉ': 'W', 'ㄸ': 'E', 'ㄲ': 'R', 'ㅆ': 'T', 'ㅒ': 'O', 'ㅖ': 'P',
+}
+COMPOUND_JAMO = {
+    'ㅘ': 'ㅗㅏ', 'ㅙ': 'ㅗㅐ', 'ㅚ': 'ㅗㅣ', 'ㅝ': 'ㅜㅓ', 'ㅞ': 'ㅜㅔ', 'ㅟ': 'ㅜㅣ', 'ㅢ': 'ㅡㅣ',
+    'ㄳ': 'ㄱㅅ', 'ㄵ': 'ㄴㅈ', 'ㄶ': 'ㄴㅎ', 'ㄺ': 'ㄹㄱ', 'ㄻ': 'ㄹㅁ', 'ㄼ': 'ㄹㅂ',
+    'ㄽ': 'ㄹㅅ', 'ㄾ': 'ㄹㅌ', 'ㄿ': 'ㄹㅍ', 'ㅀ': 'ㄹㅎ', 'ㅄ': 'ㅂㅅ',
+}
+SHIFT_KEYS = frozenset('ABCDEFGHIJKLMNOPQRSTUVWXYZ~!@#$%^&*()_+{}|:"<>?')
+DIFFICULTY_WEIGHTS = {'length': 20, 'punctuation': 15, 'shift': 20, 'jamo': 15, 'rare_bigram': 20, 'digit': 10}
+
+
+def _jamo_keys(jamo):
+    return ''.join(JAMO_KEYS[part] for part in COMPOUND_JAMO.get(jamo, jamo))
+
+
+def build_key_table():
+    """음절/낱자 → 2벌식 키 문자열 (str.translate 용)"""
+    key_table = {}
+    for offset in range(HANGUL_COUNT):
+        cho = CHOSEONG[offset // (len(JUNGSEONG) * len(JONGSEONG))]
+        jung = JUNGSEONG[(offset // len(JONGSEONG)) % len(JUNGSEONG)]
+        jong = JONGSEONG[offset % len(JONGSEONG)]
+        key_table[HANGUL_BASE + offset] = _jamo_keys(cho) + _jamo_keys(jung) + (_jamo_keys(jong) if jong else '')
+    for jamo in set(CHOSEONG) | set(JUNGSEONG) | set(JONGSEONG[1:]):
+        key_table[ord(jamo)] = _jamo_keys(jamo)
+    return key_table
+
+
+def keystroke_metrics(item, key_table):
+    """타수 기준 지표 재계산 (나머지 난이도 입력은 저장된 컬럼 사용)"""
+    content = unicodedata.normalize('NFC', item.content).strip()
+    keys = content.translate(key_table)
+    typed_keys = len(keys) - sum(map(str.isspace, keys))
+    syllables = [ch for ch in content if HANGUL_BASE <= ord(ch) < HANGUL_BASE + HANGUL_COUNT]
+    syllable_keys = sum(len(key_table[ord(ch)]) for ch in syllables)
+
+    shift_ratio = round(sum(map(SHIFT_KEYS.__contains__, keys)) / typed_keys, 4) if typed_keys else 0.0
+    jamo_complexity = round(syllable_keys / len(syllables), 3) if syllables else 0.0
+
+    weights = DIFFICULTY_WEIGHTS
+    jamo = max(0.0, (jamo_complexity - 2) / 3) if jamo_complexity else 0.0
+    score = (
+        weights['length'] * min(item.length / 120, 1)
+        + weights['punctuation'] * item.punctuation_level / 5
+        + weights['shift'] * min(shift_ratio / 0.3, 1)
+        + weights['jamo'] * min(jamo, 1)
+        + weights['rare_bigram'] * min(item.rare_bigram_ratio / 0.3, 1)
+        + weights['digit'] * min(item.digit_ratio / 0.2, 1)
+    )
+    return {
+        'keystroke_count': len(keys),
+        'shift_ratio': shift_ratio,
+        'jamo_complexity': jamo_complexity,
+        'difficulty_score': round(score, 2),
+    }
+
+
+def backfill_keystroke_metrics(apps, schema_editor):
+    # 타수 기준으로 바뀐 지표만 재계산 (희귀 바이그램 비율은 저장값 유지)
+    TextItem = apps.get_model('texts', 'TextItem')
+    key_table = build_key_table()
+    fields = ['id', 'content', 'length', 'punctuation_level', 'digit_ratio', 'rare_bigram_ratio']
+    batch = []
+    for item in TextItem.objects.only(*fields).iterator(chunk_size=2000):
+        metrics = keystroke_metrics(item, key_table)
+        for field in KEYSTROKE_METRIC_FIELDS:
+            setattr(item, field, metrics[field])
+        batch.append(item)
+        if len(batch) >= 2000:
+            TextItem.objects.bulk_update(batch, KEYSTROKE_METRIC_FIELDS)
+            batch = []
+    if batch:
+        TextItem.objects.bulk_update(batch, KEYSTROKE_METRIC_FIELDS)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('texts', '0004_textitem_difficulty_metrics'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='textitem',
+            name='keystroke_count',
+            field=models.PositiveIntegerField(default=0, help_text='2벌식 기준 키 입력 수 (공백 포함)', verbose_name='타수'),
+        ),
+        migrations.RunPython(backfill_keystroke_metrics, migrations.RunPython.noop),
+    ]
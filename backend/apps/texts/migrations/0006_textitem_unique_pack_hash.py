@@ -0,0 +1,95 @@
+# Generated by Django 4.2.30 on 2026-10-17 23:06
+
+from django.db import migrations, models
+
+
+# 같은 팩의 같은 해시 문장 중 가장 먼저 만든 행(id 최소)만 남긴다
+DUPLICATES_CTE = """
+    WITH ranked AS (
+        SELECT id, MIN(id) OVER (PARTITION BY pack_id, content_hash) AS keep_id
+        FROM {items}
+    ),
+    duplicates AS (
+        SELECT id, keep_id FROM ranked WHERE id <> keep_id
+    )
+"""
+
+# 문장별 개인 최고 기록은 남길 문장으로 합치고, 사용자/언어/모드별로 가장 높은 기록 한 행만 유지
+# (유일 제약 충돌을 피하려고 세션 수 합산 → 나머지 삭제 → 문장 변경 순서로 나눠 실행)
+RANKED_PERSONAL_BESTS_CTE = DUPLICATES_CTE + """
+    , targets AS (
+        SELECT id, keep_id FROM duplicates
+        UNION
+        SELECT keep_id, keep_id FROM duplicates
+    ),
+    merged AS (
+        SELECT
+            pb.id,
+            ROW_NUMBER() OVER w AS rank,
+            SUM(pb.session_count) OVER (PARTITION BY pb.user_id, pb.language, pb.mode, t.keep_id) AS session_count
+        FROM {personal_bests} pb
+        JOIN targets t ON t.id = pb.text_item_id
+        WINDOW w AS (PARTITION BY pb.user_id, pb.language, pb.mode, t.keep_id ORDER BY pb.best_wpm DESC, pb.achieved_at, pb.id)
+    )
+"""
+
+SUM_PERSONAL_BEST_COUNTS_SQL = RANKED_PERSONAL_BESTS_CTE + """
+    UPDATE {personal_bests} pb SET session_count = m.session_count FROM merged m WHERE pb.id = m.id AND m.rank = 1
+"""
+
+DELETE_PERSONAL_BEST_LOSERS_SQL = RANKED_PERSONAL_BESTS_CTE + """
+    DELETE FROM {personal_bests} pb USING merged m WHERE pb.id = m.id AND m.rank > 1
+"""
+
+REPOINT_PERSONAL_BESTS_SQL = DUPLICATES_CTE + """
+    UPDATE {personal_bests} pb SET text_item_id = d.keep_id FROM duplicates d WHERE pb.text_item_id = d.id
+"""
+
+REPOINT_SESSIONS_SQL = DUPLICATES_CTE + """
+    UPDATE {sessions} s SET text_item_id = d.keep_id FROM duplicates d WHERE s.text_item_id = d.id
+"""
+
+DELETE_DUPLICATES_SQL = DUPLICATES_CTE + """
+    DELETE FROM {items} i USING duplicates d WHERE i.id = d.id
+"""
+
+
+def merge_duplicate_items(apps, schema_editor):
+    """유일 제약 추가 전에 중복 문장 정리 (세션/개인 최고 기록은 남길 문장으로 옮김)"""
+    quote = schema_editor.quote_name
+    tables = {
+        'items': quote(apps.get_model('texts', 'TextItem')._meta.db_table),
+        'personal_bests': quote(apps.get_model('stats', 'PersonalBest')._meta.db_table),
+        'sessions': quote(apps.get_model('typing_sessions', 'TypingSession')._meta.db_table),
+    }
+    for sql in (
+        SUM_PERSONAL_BEST_COUNTS_SQL,
+        DELETE_PERSONAL_BEST_LOSERS_SQL,
+        REPOINT_PERSONAL_BESTS_SQL,
+        REPOINT_SESSIONS_SQL,
+        DELETE_DUPLICATES_SQL,
+    ):
+        schema_editor.execute(sql.format(**tables))
+    # 지연된 FK 검사를 지금 실행해 두어야 같은 트랜잭션에서 제약을 추가할 수 있다
+    schema_editor.execute('SET CONSTRAINTS ALL IMMEDIATE')
+    schema_editor.execute('SET CONSTRAINTS ALL DEFERRED')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('texts', '0005_textitem_keystroke_count'),
+        ('stats', '0006_personal_best'),
+    ]
+
+    operations = [
+        migrations.RunPython(merge_duplicate_items, migrations.RunPython.noop),
+        migrations.RemoveIndex(
+            model_name='textitem',
+            name='idx_item_pack_hash',
+        ),
+        migrations.AddConstraint(
+            model_name='textitem',
+            constraint=models.UniqueConstraint(fields=('pack', 'content_hash'), name='uq_item_pack_hash'),
+        ),
+    ]
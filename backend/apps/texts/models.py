@@ -1,5 +1,6 @@
 from django.db import models
 from django.conf import settings
+from .metrics import analyze, content_hash, difficulty_score, normalize_content
 
 
 class TextPack(models.Model):
@@ -50,6 +51,13 @@ class TextPack(models.Model):
         verbose_name='노출 여부',
         db_index=True
     )
+    avg_difficulty_score = models.FloatField(
+        null=True,
+        blank=True,
+        verbose_name='평균 난이도 점수',
+        help_text='활성 문장 difficulty_score 평균 (score_texts로 갱신)',
+        db_index=True
+    )
     created_by = models.ForeignKey(
         settings.AUTH_USER_MODEL,
         on_delete=models.SET_NULL,
@@ -74,6 +82,7 @@ class TextPack(models.Model):
         ordering = ['language', 'difficulty', '-created_at']
         indexes = [
             models.Index(fields=['language', 'is_active', 'difficulty'], name='idx_pack_lang_active_diff'),
+            models.Index(fields=['language', 'is_active', 'avg_difficulty_score'], name='idx_pack_lang_active_score'),
         ]
     
     def __str__(self):
@@ -97,6 +106,12 @@ class TextItem(models.Model):
     content = models.TextField(
         verbose_name='문장 내용'
     )
+    content_hash = models.CharField(
+        max_length=64,
+        blank=True,
+        verbose_name='문장 해시',
+        help_text='NFC 정규화 문장의 SHA-256 (가져오기 중복 판별용)'
+    )
     length = models.PositiveIntegerField(
         default=0,
         verbose_name='글자 수',
@@ -108,6 +123,58 @@ class TextItem(models.Model):
         verbose_name='기호 난이도',
         help_text='특수문자/기호 포함 정도 (0-5)'
     )
+    char_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name='문자 수',
+        help_text='공백 포함'
+    )
+    word_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name='단어 수'
+    )
+    keystroke_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name='타수',
+        help_text='2벌식 기준 키 입력 수 (공백 포함)'
+    )
+    
+    # 난이도 지표 (apps.texts.metrics, score_texts 커맨드로 일괄 계산)
+    hangul_ratio = models.FloatField(
+        default=0,
+        verbose_name='한글 비율'
+    )
+    latin_ratio = models.FloatField(
+        default=0,
+        verbose_name='영문 비율'
+    )
+    digit_ratio = models.FloatField(
+        default=0,
+        verbose_name='숫자 비율'
+    )
+    symbol_ratio = models.FloatField(
+        default=0,
+        verbose_name='기호 비율'
+    )
+    shift_ratio = models.FloatField(
+        default=0,
+        verbose_name='Shift 입력 비율'
+    )
+    jamo_complexity = models.FloatField(
+        default=0,
+        verbose_name='자모 복잡도',
+        help_text='한글 음절당 평균 타수'
+    )
+    rare_bigram_ratio = models.FloatField(
+        default=0,
+        verbose_name='희귀 바이그램 비율',
+        help_text='언어 코퍼스 기준'
+    )
+    difficulty_score = models.FloatField(
+        default=0,
+        verbose_name='난이도 점수',
+        help_text='0-100, 지표 가중 합',
+        db_index=True
+    )
     is_active = models.BooleanField(
         default=True,
         verbose_name='활성화',
@@ -131,26 +198,35 @@ class TextItem(models.Model):
         verbose_name = '연습 문장'
         verbose_name_plural = '연습 문장들'
         ordering = ['pack', 'order', '-created_at']
+        constraints = [
+            # 같은 팩에 같은 문장은 한 번만 (가져오기 동시 실행에도 중복 방지)
+            models.UniqueConstraint(fields=['pack', 'content_hash'], name='uq_item_pack_hash'),
+        ]
         indexes = [
             models.Index(fields=['pack', 'is_active'], name='idx_item_pack_active'),
             models.Index(fields=['pack', 'order'], name='idx_item_pack_order'),
+            models.Index(fields=['pack', 'is_active', 'difficulty_score'], name='idx_item_pack_score'),
         ]
     
     def __str__(self):
         return f"{self.content[:50]}..." if len(self.content) > 50 else self.content
     
+    def clean(self):
+        # full_clean()의 제약 검증(uq_item_pack_hash)이 저장될 해시 기준으로 동작하도록 미리 계산
+        super().clean()
+        self.content_hash = content_hash(normalize_content(self.content))
+    
     def save(self, *args, **kwargs):
-        # 자동으로 글자 수 계산
-        if not self.length:
-            self.length = len(self.content.replace(' ', ''))
+        # 자동으로 해시 / 문장 지표 계산 (희귀 바이그램 비율은 score_texts에서 갱신)
+        self.content_hash = content_hash(normalize_content(self.content))
+        self.apply_metrics(analyze(self.content))
         super().save(*args, **kwargs)
     
-    @property
-    def word_count(self):
-        """단어 수 계산"""
-        return len(self.content.split())
-    
-    @property
-    def char_count(self):
-        """문자 수 계산"""
-        return len(self.content)
+    def apply_metrics(self, metrics):
+        """analyze() 결과를 필드에 반영 (희귀 바이그램 미계산 시 기존 값 유지)"""
+        metrics = dict(metrics)
+        if not metrics.get('rare_bigram_ratio') and self.rare_bigram_ratio:
+            metrics['rare_bigram_ratio'] = self.rare_bigram_ratio
+            metrics['difficulty_score'] = difficulty_score(metrics)
+        for field, value in metrics.items():
+            setattr(self, field, value)
@@ -0,0 +1,138 @@
+"""
+texts 랜덤 선택용 ID 풀 캐시
+
+조건(언어/난이도/팩)별 활성 ID를 프로세스 내 정수 배열로 보관해
+랜덤 선택을 배열 인덱스 1회 + PK 조회 1회로 처리한다.
+TextItem/TextPack 저장·삭제 시 공유 캐시(settings.CACHES)의 버전 카운터를
+올려 모든 프로세스의 풀을 무효화하며, 풀에는 TTL도 둔다.
+조건 값은 언어 선택지/정수로 정규화하고, 풀 개수에 상한을 두어
+임의 쿼리 파라미터로 프로세스 메모리가 늘어나지 않게 한다.
+"""
+import random
+import threading
+import time
+from array import array
+
+from django.core.cache import cache
+
+from .models import TextPack, TextItem
+
+
+POOL_VERSION_KEY = 'texts:pool_version'
+POOL_TTL_SECONDS = 300
+# 프로세스당 보관하는 풀 개수 상한 (넘으면 가장 먼저 만든 풀부터 제거)
+MAX_POOLS = 256
+MAX_ID = 2 ** 63 - 1
+
+LANGUAGES = {code for code, _ in TextPack.LANGUAGE_CHOICES}
+
+_pools = {}
+_lock = threading.Lock()
+
+
+def get_pool_version():
+    return cache.get_or_set(POOL_VERSION_KEY, 1, None)
+
+
+def bump_pool_version():
+    """문장/문장팩 변경 시 호출 - 모든 프로세스의 풀 무효화"""
+    try:
+        cache.incr(POOL_VERSION_KEY)
+    except ValueError:
+        cache.set(POOL_VERSION_KEY, 1, None)
+    with _lock:
+        _pools.clear()
+
+
+def _positive_int(value):
+    """빈 값은 None, bigint 범위의 양의 정수가 아니면 ValueError"""
+    if value in (None, ''):
+        return None
+    number = int(value)
+    if not 1 <= number <= MAX_ID:
+        raise ValueError(value)
+    return number
+
+
+def _pool_key(kind, language, difficulty, pack_id):
+    """
+    조건 → 정규화된 풀 키
+
+    조건 값이 올바르지 않으면 (없는 언어, 정수가 아닌 난이도/팩) 어떤 대상과도
+    맞지 않으므로 None을 반환한다.
+    """
+    if language and language not in LANGUAGES:
+        return None
+    try:
+        return (kind, language or None, _positive_int(difficulty), _positive_int(pack_id))
+    except (TypeError, ValueError):
+        return None
+
+
+def _build_pool(kind, language, difficulty, pack_id):
+    if kind == 'pack':
+        queryset = TextPack.objects.filter(is_active=True)
+        if language:
+            queryset = queryset.filter(language=language)
+        if difficulty:
+            queryset = queryset.filter(difficulty=difficulty)
+    else:
+        queryset = TextItem.objects.filter(is_active=True)
+        if pack_id:
+            queryset = queryset.filter(pack_id=pack_id)
+        if language:
+            queryset = queryset.filter(pack__language=language)
+        if difficulty:
+            queryset = queryset.filter(pack__difficulty=difficulty)
+
+    return array('q', queryset.order_by().values_list('id', flat=True).iterator())
+
+
+def get_id_pool(kind, language=None, difficulty=None, pack_id=None):
+    """
+    조건별 ID 풀 조회
+
+    kind: 'pack' 또는 'item'
+    """
+    key = _pool_key(kind, language, difficulty, pack_id)
+    if key is None:
+        return array('q')
+    version = get_pool_version()
+    now = time.monotonic()
+
+    with _lock:
+        cached = _pools.get(key)
+    if cached and cached[0] == version and cached[1] > now:
+        return cached[2]
+
+    ids = _build_pool(*key)
+    with _lock:
+        _pools.pop(key, None)
+        while len(_pools) >= MAX_POOLS:
+            del _pools[next(iter(_pools))]
+        _pools[key] = (version, now + POOL_TTL_SECONDS, ids)
+    return ids
+
+
+def invalidate_pool(kind, language=None, difficulty=None, pack_id=None):
+    key = _pool_key(kind, language, difficulty, pack_id)
+    with _lock:
+        _pools.pop(key, None)
+
+
+def pick_random(queryset, kind, language=None, difficulty=None, pack_id=None):
+    """
+    풀에서 랜덤 ID를 골라 queryset에서 조회
+
+    풀이 오래되어 대상이 사라졌으면 풀을 다시 만들어 한 번 더 시도한다.
+    조건에 맞는 대상이 없으면 None.
+    """
+    for _ in range(2):
+        ids = get_id_pool(kind, language, difficulty, pack_id)
+        if not ids:
+            return None
+        obj = queryset.filter(pk=ids[random.randrange(len(ids))]).first()
+        if obj is not None:
+            return obj
+        invalidate_pool(kind, language, difficulty, pack_id)
+    return None
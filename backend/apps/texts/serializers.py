@@ -9,9 +9,17 @@ class TextItemSerializer(serializers.ModelSerializer):
         model = TextItem
         fields = [
             'id', 'pack', 'content', 'length', 'punctuation_level',
-            'is_active', 'order', 'word_count', 'char_count', 'created_at'
+            'is_active', 'order', 'word_count', 'char_count', 'keystroke_count',
+            'hangul_ratio', 'latin_ratio', 'digit_ratio', 'symbol_ratio',
+            'shift_ratio', 'jamo_complexity', 'rare_bigram_ratio', 'difficulty_score',
+            'created_at'
+        ]
+        read_only_fields = [
+            'id', 'length', 'punctuation_level', 'word_count', 'char_count', 'keystroke_count',
+            'hangul_ratio', 'latin_ratio', 'digit_ratio', 'symbol_ratio',
+            'shift_ratio', 'jamo_complexity', 'rare_bigram_ratio', 'difficulty_score',
+            'created_at'
         ]
-        read_only_fields = ['id', 'created_at']
 
 
 class TextItemListSerializer(serializers.ModelSerializer):
@@ -19,7 +27,7 @@ class TextItemListSerializer(serializers.ModelSerializer):
     
     class Meta:
         model = TextItem
-        fields = ['id', 'content', 'length', 'order']
+        fields = ['id', 'content', 'length', 'keystroke_count', 'difficulty_score', 'order']
 
 
 class TextPackSerializer(serializers.ModelSerializer):
@@ -32,10 +40,10 @@ class TextPackSerializer(serializers.ModelSerializer):
         model = TextPack
         fields = [
             'id', 'title', 'language', 'language_display', 'difficulty',
-            'source', 'description', 'is_active', 'item_count',
+            'avg_difficulty_score', 'source', 'description', 'is_active', 'item_count',
             'created_by', 'created_by_username', 'created_at', 'updated_at'
         ]
-        read_only_fields = ['id', 'created_at', 'updated_at']
+        read_only_fields = ['id', 'avg_difficulty_score', 'created_at', 'updated_at']
 
 
 class TextPackListSerializer(serializers.ModelSerializer):
@@ -44,7 +52,7 @@ class TextPackListSerializer(serializers.ModelSerializer):
     
     class Meta:
         model = TextPack
-        fields = ['id', 'title', 'language', 'difficulty', 'item_count']
+        fields = ['id', 'title', 'language', 'difficulty', 'avg_difficulty_score', 'item_count']
 
 
 class TextPackDetailSerializer(serializers.ModelSerializer):
@@ -55,6 +63,6 @@ class TextPackDetailSerializer(serializers.ModelSerializer):
     class Meta:
         model = TextPack
         fields = [
-            'id', 'title', 'language', 'difficulty', 'source', 'description',
+            'id', 'title', 'language', 'difficulty', 'avg_difficulty_score', 'source', 'description',
             'is_active', 'item_count', 'items', 'created_at'
         ]
@@ -0,0 +1,96 @@
+"""
+texts 서비스 - 문장팩 단위 난이도 일괄 계산
+"""
+from django.db import connection
+from django.db.models import Avg
+from psycopg2.extras import execute_values
+
+from .metrics import METRIC_FIELDS, build_bigram_reference, compute_metrics, normalize_content
+from .models import TextPack, TextItem
+
+
+SCORE_BATCH_SIZE = 2000
+
+
+def bulk_update_metrics(rows):
+    """
+    (id, metrics) 목록을 UPDATE ... FROM (VALUES ...) 한 번으로 기록
+
+    bulk_update의 필드별 CASE 문보다 훨씬 가벼워 대량 재계산에 쓴다.
+    """
+    table = TextItem._meta.db_table
+    columns = ', '.join(METRIC_FIELDS)
+    assignments = ', '.join(f'{field} = v.{field}' for field in METRIC_FIELDS)
+    casts = [
+        TextItem._meta.get_field(field).db_type(connection)
+        for field in METRIC_FIELDS
+    ]
+    template = '(%s, ' + ', '.join(f'%s::{cast}' for cast in casts) + ')'
+    sql = (
+        f'UPDATE {table} AS t SET {assignments} '
+        f'FROM (VALUES %s) AS v (id, {columns}) WHERE t.id = v.id'
+    )
+    values = [
+        (item_id, *(metrics[field] for field in METRIC_FIELDS))
+        for item_id, metrics in rows
+    ]
+    with connection.cursor() as cursor:
+        execute_values(cursor.cursor, sql, values, template=template, page_size=len(values) or 1)
+
+
+def build_language_reference(language):
+    """언어별 활성 문장 전체로 바이그램 빈도표 생성 (스트리밍)"""
+    contents = TextItem.objects.filter(
+        is_active=True,
+        pack__language=language,
+    ).values_list('content', flat=True).iterator(chunk_size=5000)
+    return build_bigram_reference(normalize_content(content) for content in contents)
+
+
+def score_pack(pack, bigram_reference=None, batch_size=SCORE_BATCH_SIZE):
+    """
+    문장팩 전체 문장의 난이도 지표를 배치로 계산해 저장
+
+    문장은 batch_size 단위로 읽어 한 번에 계산하고 UPDATE 한 번으로 기록한 뒤,
+    팩의 평균 난이도 점수를 갱신한다. 반환값: 갱신한 문장 수
+    """
+    if bigram_reference is None:
+        bigram_reference = build_language_reference(pack.language)
+
+    items = pack.items.order_by('id')
+    updated = 0
+    batch = []
+
+    def flush():
+        metrics = compute_metrics([normalize_content(content) for _, content in batch], bigram_reference)
+        bulk_update_metrics(zip((item_id for item_id, _ in batch), metrics))
+        return len(batch)
+
+    for item in items.values_list('id', 'content').iterator(chunk_size=batch_size):
+        batch.append(item)
+        if len(batch) >= batch_size:
+            updated += flush()
+            batch = []
+    if batch:
+        updated += flush()
+
+    pack.avg_difficulty_score = pack.items.filter(is_active=True).aggregate(
+        avg=Avg('difficulty_score')
+    )['avg']
+    pack.save(update_fields=['avg_difficulty_score', 'updated_at'])
+    return updated
+
+
+def score_packs(packs=None):
+    """
+    여러 문장팩 일괄 계산 (언어별 바이그램 기준은 한 번만 생성)
+    반환값: {pack: 갱신한 문장 수}
+    """
+    packs = TextPack.objects.all() if packs is None else packs
+    references = {}
+    results = {}
+    for pack in packs.order_by('language', 'id'):
+        if pack.language not in references:
+            references[pack.language] = build_language_reference(pack.language)
+        results[pack] = score_pack(pack, references[pack.language])
+    return results
@@ -0,0 +1,16 @@
+"""
+texts 시그널 - 랜덤 선택 ID 풀 무효화
+"""
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from .models import TextPack, TextItem
+from .pools import bump_pool_version
+
+
+@receiver(post_save, sender=TextPack)
+@receiver(post_delete, sender=TextPack)
+@receiver(post_save, sender=TextItem)
+@receiver(post_delete, sender=TextItem)
+def invalidate_text_pools(sender, **kwargs):
+    bump_pool_version()
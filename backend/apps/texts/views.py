@@ -7,14 +7,18 @@ from .serializers import (
     TextPackSerializer, TextPackListSerializer, TextPackDetailSerializer,
     TextItemSerializer, TextItemListSerializer
 )
-import random
+from .pools import pick_random
 
 
 class TextPackViewSet(viewsets.ReadOnlyModelViewSet):
     """문장팩 조회 API"""
     permission_classes = [permissions.AllowAny]
     filter_backends = [DjangoFilterBackend]
-    filterset_fields = ['language', 'difficulty']
+    filterset_fields = {
+        'language': ['exact'],
+        'difficulty': ['exact'],
+        'avg_difficulty_score': ['gte', 'lte'],
+    }
     
     def get_queryset(self):
         return TextPack.objects.filter(is_active=True).prefetch_related('items')
@@ -32,14 +36,8 @@ class TextPackViewSet(viewsets.ReadOnlyModelViewSet):
         language = request.query_params.get('language')
         difficulty = request.query_params.get('difficulty')
         
-        queryset = self.get_queryset()
-        if language:
-            queryset = queryset.filter(language=language)
-        if difficulty:
-            queryset = queryset.filter(difficulty=difficulty)
-        
-        if queryset.exists():
-            pack = random.choice(list(queryset))
+        pack = pick_random(self.get_queryset(), 'pack', language=language, difficulty=difficulty)
+        if pack:
             serializer = TextPackDetailSerializer(pack)
             return Response(serializer.data)
         
@@ -50,7 +48,12 @@ class TextItemViewSet(viewsets.ReadOnlyModelViewSet):
     """문장 조회 API"""
     permission_classes = [permissions.AllowAny]
     filter_backends = [DjangoFilterBackend]
-    filterset_fields = ['pack', 'is_active']
+    filterset_fields = {
+        'pack': ['exact'],
+        'is_active': ['exact'],
+        'length': ['gte', 'lte'],
+        'difficulty_score': ['gte', 'lte'],
+    }
     
     def get_queryset(self):
         return TextItem.objects.filter(is_active=True).select_related('pack')
@@ -66,14 +69,8 @@ class TextItemViewSet(viewsets.ReadOnlyModelViewSet):
         pack_id = request.query_params.get('pack')
         language = request.query_params.get('language')
         
-        queryset = self.get_queryset()
-        if pack_id:
-            queryset = queryset.filter(pack_id=pack_id)
-        if language:
-            queryset = queryset.filter(pack__language=language)
-        
-        if queryset.exists():
-            item = random.choice(list(queryset))
+        item = pick_random(self.get_queryset(), 'item', language=language, pack_id=pack_id)
+        if item:
             serializer = TextItemSerializer(item)
             return Response(serializer.data)
         
@@ -82,6 +82,29 @@ DATABASES = {
     }
 }
 
+# Cache
+# 풀 버전/통계 요약 버전 키는 모든 프로세스(runserver/gunicorn 워커, run_worker)가
+# 같은 값을 봐야 하므로 프로세스 로컬 캐시(LocMemCache)를 쓰지 않는다.
+# 기본은 DB 캐시(python manage.py createcachetable 필요), REDIS_URL이 있으면 Redis
+if os.environ.get('REDIS_URL'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.environ['REDIS_URL'],
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+            'LOCATION': 'django_cache',
+            'OPTIONS': {
+                # 사용자별 버전 키가 컬링으로 지워지지 않도록 여유 있게 잡는다
+                'MAX_ENTRIES': int(os.environ.get('CACHE_MAX_ENTRIES', 100000)),
+            },
+        }
+    }
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -115,6 +138,23 @@ STATIC_ROOT = BASE_DIR / 'staticfiles'
 MEDIA_URL = 'media/'
 MEDIA_ROOT = BASE_DIR / 'media'
 
+# File storages
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+    },
+    'staticfiles': {
+        'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage',
+    },
+    # 보관(archive_sessions)된 오래된 세션 파일 - 오브젝트 스토리지를 쓰려면 BACKEND 교체
+    'session_archive': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+        'OPTIONS': {
+            'location': os.environ.get('SESSION_ARCHIVE_ROOT', str(BASE_DIR / 'archive')),
+        },
+    },
+}
+
 # Default primary key field type
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
@@ -138,3 +178,26 @@ SIMPLE_JWT = {
     'BLACKLIST_AFTER_ROTATION': True,
     'UPDATE_LAST_LOGIN': True,
 }
+
+# Leaderboard
+# 교체된 스냅샷 세대를 정리하기 전까지 유지하는 유예 기간 (분)
+LEADERBOARD_SNAPSHOT_GRACE_MINUTES = int(os.environ.get('LEADERBOARD_SNAPSHOT_GRACE_MINUTES', 60))
+
+# 스냅샷 상세 응답에 미리 렌더링해 두는 상위 엔트리 수
+LEADERBOARD_TOP_N = int(os.environ.get('LEADERBOARD_TOP_N', 100))
+
+# 세션 저장 트랜잭션이 커밋되기까지 걸릴 수 있는 최대 시간 (초)
+# 스냅샷/실시간 인덱스의 세션 ID 워터마크는 이보다 먼저 생성된 세션까지만 올린다.
+LEADERBOARD_COMMIT_WINDOW_SECONDS = int(os.environ.get('LEADERBOARD_COMMIT_WINDOW_SECONDS', 300))
+# 실시간 순위 인덱스를 DB와 맞추는 주기 (초) - 다른 프로세스에서 저장된 세션/제외된 세션 반영
+LEADERBOARD_LIVE_RECONCILE_SECONDS = int(os.environ.get('LEADERBOARD_LIVE_RECONCILE_SECONDS', 30))
+
+# Typing sessions
+# 키 입력 이벤트 저장 방식: packed(세션당 압축 블롭 1행) / rows(이벤트당 1행) / off
+TYPING_EVENT_STORAGE = os.environ.get('TYPING_EVENT_STORAGE', 'packed')
+
+# 랭킹 집계에서 제외할 부정행위 의심 점수 (detect_cheating 결과, 0~1)
+ANTICHEAT_EXCLUDE_SCORE = float(os.environ.get('ANTICHEAT_EXCLUDE_SCORE', 0.8))
+
+# 세션 테이블에 남겨 두는 기간 (일) - 이보다 오래된 세션은 archive_sessions가 보관 파일로 옮김
+SESSION_HOT_DAYS = int(os.environ.get('SESSION_HOT_DAYS', 90))
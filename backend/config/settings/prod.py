@@ -27,7 +27,9 @@ SESSION_COOKIE_SECURE = True
 CSRF_COOKIE_SECURE = True
 
 # Static files
-STATICFILES_STORAGE = 'django.contrib.staticfiles.storage.ManifestStaticFilesStorage'
+STORAGES['staticfiles'] = {
+    'BACKEND': 'django.contrib.staticfiles.storage.ManifestStaticFilesStorage',
+}
 
 # Logging
 LOGGING = {